@@ -9,10 +9,113 @@ Cross-platform, auto-install, auto-language.
 __version__ = "2.0.2"
 __author__ = "©Benoit_SAINTOT — GUI by NGC4565"
 
-import subprocess, sys, importlib, os, math, locale, platform, webbrowser, json, threading, re, traceback
+import subprocess, sys, importlib, importlib.util, os, math, locale, platform, webbrowser, json, threading, re, traceback, time
 from datetime import datetime
 from pathlib import Path
 
+_T0 = time.perf_counter()  # process start reference for the startup budget and profiler
+
+# === BATCH / SKY-LOG MODES ===
+# Headless: dispatched before the error-log hook, the pip probes and any Qt / matplotlib import.
+# The mode's module runs as __main__ (runpy), so the batch pool's spawned workers import it
+# by name instead of re-running this script.
+if __name__ == "__main__":
+    for _flag, _module in (("--batch", "exposure_engine.batch"), ("--sky-log", "exposure_engine.skylog")):
+        if any(a == _flag or a.startswith(_flag + "=") for a in sys.argv[1:]):
+            import runpy
+            sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+            runpy.run_module(_module, run_name="__main__", alter_sys=True)
+            sys.exit(0)
+
+
+# === STARTUP PROFILER (--profile-startup [text|json]) ===
+class _StartupProfiler:
+    """Startup phase timestamps, plus per-import cost when enabled.
+
+    mark(name) closes a phase that started at the previous mark. When enabled,
+    builtins.__import__ is wrapped to time every module imported for the first
+    time (cumulative and self time, like `python -X importtime`), and the
+    report is printed once the Parameters tab is first painted.
+    """
+
+    def __init__(self, fmt=None):
+        self.fmt = fmt
+        self.enabled = fmt is not None
+        self.marks = []
+        self.imports = []
+        self._last = _T0
+        if self.enabled:
+            self._install_import_timer()
+
+    def mark(self, name):
+        now = time.perf_counter()
+        self.marks.append((name, (self._last - _T0) * 1000, (now - self._last) * 1000))
+        self._last = now
+
+    def _install_import_timer(self):
+        import builtins
+        orig_import = builtins.__import__
+        stack = []
+
+        def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+            if level or name in sys.modules:
+                return orig_import(name, globals, locals, fromlist, level)
+            start = time.perf_counter()
+            stack.append(0.0)
+            try:
+                return orig_import(name, globals, locals, fromlist, level)
+            finally:
+                total = time.perf_counter() - start
+                children = stack.pop()
+                if stack:
+                    stack[-1] += total
+                self.imports.append((name, total * 1000, (total - children) * 1000, len(stack)))
+
+        builtins.__import__ = _timed_import
+
+    def report(self):
+        total = self.marks[-1][1] + self.marks[-1][2] if self.marks else 0.0
+        data = {
+            "version": __version__,
+            "python": sys.version.split()[0],
+            "platform": platform.system(),
+            "total_ms": round(total, 2),
+            "phases": [{"name": n, "start_ms": round(st, 2), "duration_ms": round(d, 2)} for n, st, d in self.marks],
+            "imports": [{"module": n, "cumulative_ms": round(c, 2), "self_ms": round(sf, 2), "depth": dp}
+                        for n, c, sf, dp in sorted(self.imports, key=lambda r: -r[1])],
+            "matplotlib_loaded": "matplotlib" in sys.modules,
+        }
+        if self.fmt == "json":
+            return json.dumps(data, indent=2)
+        lines = [f"Startup profile — ExposureCalculator v{data['version']} | Python {data['python']} | {data['platform']}",
+                 "", f"{'phase':<34}{'start ms':>10}{'duration ms':>14}"]
+        for ph in data["phases"]:
+            lines.append(f"{ph['name']:<34}{ph['start_ms']:>10.1f}{ph['duration_ms']:>14.1f}")
+        lines.append(f"{'total (to first paint)':<34}{'':>10}{data['total_ms']:>14.1f}")
+        lines += ["", f"{'top-level imports':<34}{'cumul. ms':>10}{'self ms':>14}"]
+        for imp in [i for i in data["imports"] if i["depth"] == 0][:25]:
+            lines.append(f"{imp['module']:<34}{imp['cumulative_ms']:>10.1f}{imp['self_ms']:>14.1f}")
+        lines.append(f"\nmatplotlib loaded at startup: {'yes' if data['matplotlib_loaded'] else 'no (deferred)'}")
+        return "\n".join(lines)
+
+    def finish(self):
+        print(self.report())
+        app = QApplication.instance()
+        if app is not None:
+            app.quit()
+
+
+def _profile_format(argv):
+    for i, a in enumerate(argv):
+        if a == "--profile-startup":
+            nxt = argv[i + 1] if i + 1 < len(argv) else ""
+            return nxt if nxt in ("text", "json") else "text"
+        if a.startswith("--profile-startup="):
+            return "json" if a.split("=", 1)[1] == "json" else "text"
+    return None
+
+_PROFILER = _StartupProfiler(_profile_format(sys.argv[1:]) if __name__ == "__main__" else None)
+
 def _resource_path(filename):
     """Return absolute path to resource — works for dev and PyInstaller bundle."""
     if getattr(sys, '_MEIPASS', None):
@@ -22,9 +125,18 @@ def _resource_path(filename):
 # === APP DIRECTORY (store data alongside the script, not in home) ===
 _APP_DIR = Path(__file__).resolve().parent
 
+# Named profiles (per rig / site), shared by every PC that runs from this folder
+_PROFILES_PATH = _APP_DIR / ".exposure_calc_profiles.sqlite"
+
 # === ERROR LOGGING ===
-_LOG_PATH = _APP_DIR / ".exposure_calc_errors.log"
-_LOG_MAX_BYTES = 512_000  # 500 KB
+# EXPOSURE_CALC_LOG_FORMAT=jsonl: one JSON object per line instead of text blocks
+_LOG_JSONL = os.environ.get("EXPOSURE_CALC_LOG_FORMAT", "").strip().lower() == "jsonl"
+_LOG_PATH = _APP_DIR / (".exposure_calc_errors.jsonl" if _LOG_JSONL else ".exposure_calc_errors.log")
+_LOG_MAX_BYTES = 512_000  # 500 KB per file
+_LOG_BACKUPS = 3          # .1 (newest) ... .3, the oldest dropped on rotation
+_LOG_TAIL_CHUNK = 8192
+# Start of a text entry: a blank line, then "[<ISO date>" (tracebacks may contain blank lines too)
+_LOG_ENTRY_START = re.compile(rb"\n\n(?=\[\d{4}-\d\d-\d\dT)")
 
 def _anonymize_path(text):
     """Replace user home directory with ~ for anonymous error/bug reports."""
@@ -37,6 +149,14 @@ def _anonymize_path(text):
         text = text.replace(home.lower(), "~")
     return text
 
+def _rotate_log():
+    """Shift the numbered files up by one (renames only, nothing is rewritten); the log restarts empty."""
+    for i in range(_LOG_BACKUPS - 1, 0, -1):
+        src = _LOG_PATH.with_name(f"{_LOG_PATH.name}.{i}")
+        if src.exists():
+            os.replace(src, _LOG_PATH.with_name(f"{_LOG_PATH.name}.{i + 1}"))
+    os.replace(_LOG_PATH, _LOG_PATH.with_name(f"{_LOG_PATH.name}.1"))
+
 def _log_error(exc_type=None, exc_value=None, exc_tb=None):
     try:
         if exc_type is None:
@@ -45,16 +165,28 @@ def _log_error(exc_type=None, exc_value=None, exc_tb=None):
             return
         tb_text = "".join(traceback.format_exception(exc_type, exc_value, exc_tb))
         tb_text = _anonymize_path(tb_text)
-        entry = (
-            f"[{datetime.now().isoformat(timespec='seconds')}] "
-            f"v{__version__} | {platform.system()} | "
-            f"Python {sys.version.split()[0]}\n{tb_text}\n"
-        )
-        if _LOG_PATH.exists() and _LOG_PATH.stat().st_size > _LOG_MAX_BYTES:
-            lines = _LOG_PATH.read_text(encoding="utf-8", errors="replace").splitlines(True)
-            half = len(lines) // 2
-            _LOG_PATH.write_text("".join(lines[half:]), encoding="utf-8")
-        with open(_LOG_PATH, "a", encoding="utf-8") as f:
+        stamp = datetime.now().isoformat(timespec="seconds")
+        if _LOG_JSONL:
+            entry = json.dumps({
+                "time": stamp, "version": __version__, "os": platform.system(),
+                "python": sys.version.split()[0], "type": exc_type.__name__,
+                "message": _anonymize_path(str(exc_value)), "traceback": tb_text,
+            }, ensure_ascii=False) + "\n"
+        else:
+            entry = (
+                f"[{stamp}] "
+                f"v{__version__} | {platform.system()} | "
+                f"Python {sys.version.split()[0]}\n{tb_text}\n"
+            )
+        f = open(_LOG_PATH, "a", encoding="utf-8")
+        if f.seek(0, os.SEEK_END) > _LOG_MAX_BYTES:
+            f.close()
+            try:
+                _rotate_log()
+            except OSError:
+                pass        # renamed meanwhile by another PC, or open elsewhere (Windows): keep appending
+            f = open(_LOG_PATH, "a", encoding="utf-8")
+        with f:
             f.write(entry)
     except Exception:
         pass
@@ -65,13 +197,41 @@ def _excepthook(exc_type, exc_value, exc_tb):
 
 sys.excepthook = _excepthook
 
+def _read_last_entry(path):
+    """Last log entry of `path` (bytes), read backwards from the end in chunks; None if empty."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        while pos > 0:
+            step = min(_LOG_TAIL_CHUNK, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            tail = buf.rstrip()
+            if _LOG_JSONL:
+                cut = tail.rfind(b"\n")
+                if cut >= 0:
+                    return tail[cut + 1:] or None
+            else:
+                starts = list(_LOG_ENTRY_START.finditer(tail))
+                if starts:
+                    return tail[starts[-1].end():] or None
+        return buf.strip() or None
+
 def _get_last_error():
     try:
-        if not _LOG_PATH.exists():
-            return None
-        text = _LOG_PATH.read_text(encoding="utf-8", errors="replace")
-        blocks = text.strip().split("\n\n")
-        return blocks[-1].strip() if blocks else None
+        for path in (_LOG_PATH, _LOG_PATH.with_name(f"{_LOG_PATH.name}.1")):
+            if not path.exists():
+                continue
+            raw = _read_last_entry(path)
+            if raw is None:
+                continue
+            text = raw.decode("utf-8", errors="replace").strip()
+            if _LOG_JSONL:
+                e = json.loads(text)
+                text = f"[{e['time']}] v{e['version']} | {e['os']} | Python {e['python']}\n{e['traceback']}".strip()
+            return text
+        return None
     except Exception:
         return None
 
@@ -86,19 +246,98 @@ def _load_settings():
         pass
     return None
 
-def _save_settings_to_file(data):
-    try:
-        tmp = _SETTINGS_PATH.with_suffix(".tmp")
-        tmp.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
-        tmp.replace(_SETTINGS_PATH)
-    except Exception:
-        pass
+class _SettingsWriter:
+    """Writes the settings file from a background thread.
+
+    _APP_DIR may be a NAS share: serialization and I/O stay off the GUI
+    thread. Only the latest submitted snapshot is kept (bursts coalesce
+    into one write), and a write is skipped when the serialized content
+    hashes the same as the file's. flush() waits for the pending write
+    (called on close).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._cond = threading.Condition()
+        self._pending = None
+        self._busy = False
+        self._thread = None
+        self._last_hash = None
+        self.counters = {"submitted": 0, "coalesced": 0, "written": 0, "skipped": 0, "errors": 0,
+                         "last_ms": 0.0, "max_ms": 0.0, "total_ms": 0.0}
+
+    def submit(self, data):
+        with self._cond:
+            if self._pending is not None:
+                self.counters["coalesced"] += 1
+            self._pending = data
+            self.counters["submitted"] += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="settings-writer")
+                self._thread.start()
+            self._cond.notify()
+
+    def flush(self, timeout=5.0):
+        """Wait until the last submitted snapshot is on disk (or skipped); False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._pending is not None or self._busy:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    return False
+                self._cond.wait(left)
+        return True
+
+    def stats(self):
+        with self._cond:
+            c = dict(self.counters)
+        c["mean_ms"] = c["total_ms"] / c["written"] if c["written"] else 0.0
+        return c
+
+    def _run(self):
+        import hashlib
+        if self._last_hash is None:
+            try:
+                self._last_hash = hashlib.sha1(self.path.read_bytes()).digest()
+            except OSError:
+                self._last_hash = b""
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                data, self._pending = self._pending, None
+                self._busy = True
+            result = "errors"
+            t0 = time.perf_counter()
+            try:
+                raw = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+                digest = hashlib.sha1(raw).digest()
+                if digest == self._last_hash:
+                    result = "skipped"
+                else:
+                    tmp = self.path.with_suffix(".tmp")
+                    tmp.write_bytes(raw)
+                    tmp.replace(self.path)
+                    self._last_hash = digest
+                    result = "written"
+            except Exception:
+                pass
+            ms = (time.perf_counter() - t0) * 1000
+            with self._cond:
+                self.counters[result] += 1
+                if result == "written":
+                    self.counters["last_ms"] = ms
+                    self.counters["max_ms"] = max(self.counters["max_ms"], ms)
+                    self.counters["total_ms"] += ms
+                self._busy = False
+                self._cond.notify_all()
+
+_SETTINGS_WRITER = _SettingsWriter(_SETTINGS_PATH)
 
 def _ensure_package(pip_name, import_name=None):
     import_name = import_name or pip_name
-    try:
-        importlib.import_module(import_name)
-    except ImportError:
+    # find_spec only probes the install: heavy packages (matplotlib) are imported when first needed
+    if importlib.util.find_spec(import_name) is None:
         print(f"[setup] Installing {pip_name}...")
         try:
             subprocess.check_call([sys.executable, "-m", "pip", "install", "--quiet", pip_name],
@@ -110,20 +349,26 @@ def _ensure_package(pip_name, import_name=None):
         importlib.invalidate_caches()
 
 _ensure_package("PyQt6")
+_ensure_package("numpy")
 _ensure_package("matplotlib")
-
-import matplotlib
-matplotlib.use("QtAgg")
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+_PROFILER.mark("_ensure_package probes")
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QTabWidget, QLabel, QLineEdit, QPushButton, QComboBox, QFrame, QScrollArea,
-    QGroupBox, QFileDialog, QMessageBox, QSizePolicy, QSpacerItem
+    QGroupBox, QFileDialog, QMessageBox, QSizePolicy, QSpacerItem,
+    QTableView, QHeaderView, QAbstractItemView, QDialog, QDialogButtonBox, QFormLayout
+)
+from PyQt6.QtCore import Qt, QTimer, QUrl, QEvent, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QFont, QIcon, QDesktopServices, QColor
+_PROFILER.mark("import PyQt6")
+
+from exposure_engine import (
+    TIMES_LRGB, TIMES_NB, FILTERS, EXP_KEYS, DEFAULT_PARAMS, CAMERA_DB, CAMERA_DB_COUNTS, CAMERA_DB_INFO, ExposureMatrix,
+    RESULT_KEYS, CAMERA_KEYS, RESULT_NODES, SETPOINT_MAX, ResultCache, ResultGraph, classify_median, dark_model,
+    gain_curve, parse_gain, CurveSampler, decimate, filter_skies, PLAN_MODES, sec_to_mmss,
 )
-from PyQt6.QtCore import Qt, QTimer, QUrl
-from PyQt6.QtGui import QFont, QIcon, QDesktopServices
+_PROFILER.mark("import exposure_engine + camera DB")
 
 
 def _detect_language():
@@ -136,54 +381,6 @@ def _detect_language():
     return "fr" if lc and str(lc).lower().startswith("fr") else "en"
 
 
-# === SENSOR DATABASE ===
-_SENSORS = {
-    "IMX571": {"bits":16, "gains":{"Gain 0":{"rn":3.25,"ge":0.75,"offset":40,"fw":50000},"Gain 100 (HCG)":{"rn":1.4,"ge":0.21,"offset":40,"fw":15000}}, "temps":{0:0.002,-5:0.00125,-10:0.00075,-15:0.00037,-20:0.00012,-25:0.00012},
-        "cameras":{"ZWO":["ASI2600MM Pro","ASI2600MC Pro"],"QHY":["QHY268M","QHY268C"],"Moravian":["C3-26000"],"Player One":["Poseidon-M Pro","Poseidon-C Pro"],"ToupTek":["ATR2600M","ATR2600C"],"ATIK":["Horizon II"]}},
-    "IMX455": {"bits":16, "gains":{"Gain 0":{"rn":3.5,"ge":0.78,"offset":50,"fw":51400},"Gain 100 (HCG)":{"rn":1.2,"ge":0.25,"offset":50,"fw":21000}}, "temps":{0:0.0017,-5:0.001,-10:0.0006,-15:0.0003,-20:0.00015,-25:0.00008},
-        "cameras":{"ZWO":["ASI6200MM Pro","ASI6200MC Pro"],"QHY":["QHY600M","QHY600C"],"Moravian":["C3-61000"],"Player One":["Poseidon-M FF Pro"],"ToupTek":["ATR6200M"]}},
-    "IMX533": {"bits":14, "gains":{"Gain 0":{"rn":3.1,"ge":3.1,"offset":5,"fw":50000},"Gain 100 (HCG)":{"rn":1.0,"ge":0.8,"offset":5,"fw":13000}}, "temps":{0:0.0008,-5:0.0004,-10:0.0002,-15:0.0001,-20:0.00005,-25:0.00003},
-        "cameras":{"ZWO":["ASI533MM Pro","ASI533MC Pro"],"QHY":["QHY533M","QHY533C"],"Player One":["Ares-M Pro","Ares-C Pro"],"ToupTek":["ATR533M","ATR533C"]}},
-    "IMX294": {"bits":14, "gains":{"Gain 0":{"rn":3.6,"ge":3.5,"offset":10,"fw":66400},"Gain 120 (HCG)":{"rn":1.2,"ge":0.9,"offset":10,"fw":17000}}, "temps":{0:0.01,-5:0.006,-10:0.004,-15:0.003,-20:0.0022,-25:0.0015},
-        "cameras":{"ZWO":["ASI294MM Pro","ASI294MC Pro"],"QHY":["QHY294M","QHY294C"],"Player One":["Artemis-M Pro","Artemis-C Pro"]}},
-    "IMX183": {"bits":12, "gains":{"Gain 0":{"rn":3.0,"ge":3.6,"offset":10,"fw":15000},"Gain 120":{"rn":2.2,"ge":1.0,"offset":10,"fw":4500}}, "temps":{0:0.007,-5:0.0042,-10:0.0035,-15:0.00298,-20:0.00298,-25:0.00298},
-        "cameras":{"ZWO":["ASI183MM Pro","ASI183MC Pro"],"QHY":["QHY183M","QHY183C"]}},
-    "MN34230": {"bits":12, "gains":{"Gain 0":{"rn":3.6,"ge":5.0,"offset":50,"fw":10000},"Gain 76 (Unity)":{"rn":2.5,"ge":1.65,"offset":50,"fw":6000},"Gain 139 (HCG)":{"rn":1.7,"ge":1.0,"offset":50,"fw":4000}}, "temps":{0:0.03125,-5:0.018,-10:0.0136,-15:0.009,-20:0.0062,-25:0.0062},
-        "cameras":{"ZWO":["ASI1600MM Pro","ASI1600MC Pro"],"QHY":["QHY163M","QHY163C"]}},
-    "IMX585": {"bits":12, "gains":{"Gain 0":{"rn":3.3,"ge":2.7,"offset":10,"fw":40000},"Gain 250":{"rn":0.8,"ge":0.12,"offset":10,"fw":5000}}, "temps":{0:0.015,-5:0.009,-10:0.005,-15:0.003,-20:0.002,-25:0.001},
-        "cameras":{"ZWO":["ASI585MC"],"QHY":["QHY5III585C"],"Player One":["Neptune-C II"],"ToupTek":["ATR585MC"]}},
-    "IMX174": {"bits":12, "gains":{"Gain 0":{"rn":5.7,"ge":2.58,"offset":10,"fw":32400}}, "temps":{0:0.04,-5:0.025,-10:0.015,-15:0.01,-20:0.007,-25:0.005},
-        "cameras":{"ZWO":["ASI174MM","ASI174MC"]}},
-    "IMX224": {"bits":12, "gains":{"Gain 0":{"rn":6.7,"ge":3.85,"offset":10,"fw":63700}}, "temps":{0:0.05,-5:0.03,-10:0.018,-15:0.011,-20:0.007,-25:0.005},
-        "cameras":{"ZWO":["ASI224MC"]}},
-    "AR0130": {"bits":12, "gains":{"Gain 0":{"rn":6.0,"ge":3.3,"offset":10,"fw":20000}}, "temps":{0:0.05,-5:0.03,-10:0.02,-15:0.012,-20:0.008,-25:0.005},
-        "cameras":{"ZWO":["ASI120MM","ASI120MC"]}},
-    "IMX290": {"bits":12, "gains":{"Gain 0":{"rn":3.3,"ge":2.12,"offset":10,"fw":14600}}, "temps":{0:0.03,-5:0.018,-10:0.011,-15:0.007,-20:0.004,-25:0.003},
-        "cameras":{"ZWO":["ASI290MM","ASI290MC"],"QHY":["QHY290M","QHY290C"]}},
-    "IMX461": {"bits":16, "gains":{"Gain 0":{"rn":3.6,"ge":0.78,"offset":50,"fw":51000},"Gain 100 (HCG)":{"rn":1.4,"ge":0.25,"offset":50,"fw":20000}}, "temps":{0:0.002,-5:0.0012,-10:0.0007,-15:0.0004,-20:0.0002,-25:0.0001},
-        "cameras":{"QHY":["QHY461M","QHY411"],"Moravian":["C3-100000"]}},
-    "IMX071": {"bits":14, "gains":{"Gain 0":{"rn":3.3,"ge":3.2,"offset":10,"fw":50000},"Gain 90":{"rn":2.5,"ge":0.8,"offset":10,"fw":12000}}, "temps":{0:0.015,-5:0.01,-10:0.006,-15:0.004,-20:0.003,-25:0.002},
-        "cameras":{"ZWO":["ASI071MC Pro"]}},
-    "ICX825": {"bits":16, "gains":{"Unique":{"rn":5.0,"ge":0.27,"offset":10,"fw":18000}}, "temps":{-10:0.0005},
-        "cameras":{"ATIK":["One 6.0","Infinity"]}},
-    "IMX410": {"bits":16, "gains":{"Gain 0":{"rn":3.4,"ge":0.93,"offset":50,"fw":75000},"Gain 100 (HCG)":{"rn":1.3,"ge":0.28,"offset":50,"fw":22000}}, "temps":{0:0.003,-5:0.002,-10:0.001,-15:0.0006,-20:0.0003,-25:0.00015},
-        "cameras":{"ZWO":["ASI2400MC Pro"]}},
-    "IMX678": {"bits":12, "gains":{"Gain 0":{"rn":3.2,"ge":4.5,"offset":10,"fw":18000},"Gain 200":{"rn":0.7,"ge":0.15,"offset":10,"fw":3000}}, "temps":{0:0.01,-5:0.006,-10:0.004,-15:0.002,-20:0.001,-25:0.0006},
-        "cameras":{"ZWO":["ASI678MC"],"Player One":["Uranus-C Pro"]}},
-}
-
-def _build_camera_db():
-    db = {}
-    for sn, s in _SENSORS.items():
-        for brand, models in s["cameras"].items():
-            if brand not in db:
-                db[brand] = {}
-            for m in models:
-                db[brand][f"{m}  [{sn}]"] = {"sensor": sn, "gains": s["gains"], "temps": s["temps"], "bits": s["bits"]}
-    return {b: dict(sorted(db[b].items())) for b in sorted(db.keys())}
-
-CAMERA_DB = _build_camera_db()
-
 # === TRANSLATIONS ===
 T = {}
 def _init_translations():
@@ -216,6 +413,16 @@ def _init_translations():
         "lbl_gain": {"fr": "Gain", "en": "Gain"}, "lbl_temp": {"fr": "T refroid.", "en": "Cool. temp."},
         "btn_apply": {"fr": "Appliquer", "en": "Apply"},
         "cam_count": {"fr": "{n} cameras ({s} capteurs)", "en": "{n} cameras ({s} sensors)"},
+        "lbl_dc_frac": {"fr": "DC max (% du ciel)", "en": "Max DC (% of sky)"},
+        "cam_setpoint": {"fr": "Consigne la plus chaude :", "en": "Warmest setpoint:"},
+        "tip_temp": {"fr": "Temperature libre (ex. -12) : courant d'obscurite interpole en log entre les paliers du capteur",
+                     "en": "Any temperature (e.g. -12): dark current interpolated in log scale between the sensor setpoints"},
+        "lbl_dr_min": {"fr": "DR min (stops)", "en": "Min DR (stops)"},
+        "cam_best_gain": {"fr": "Gain optimal :", "en": "Best gain:"},
+        "cam_no_gain": {"fr": "aucun gain n'atteint cette dynamique", "en": "no gain reaches this dynamic range"},
+        "tip_gain": {"fr": "Gain libre (ex. 60) : bruit de lecture, e-/ADU et puits interpoles entre les presets (saut HCG compris)",
+                     "en": "Any gain (e.g. 60): read noise, e-/ADU and full well interpolated between the presets (HCG step included)"},
+        "fastest_cams": {"fr": "Poses L les plus courtes ce soir :", "en": "Shortest L subs tonight:"},
         "a1_title": {"fr": "1ere Approche — Swamp Factor", "en": "1st Approach — Swamp Factor"},
         "a1_explain": {"fr": "Le Swamp Factor (SF) est le rapport signal fond de ciel / bruit de lecture. Viser entre 3 et 10.",
                        "en": "The Swamp Factor (SF) is sky background signal / read noise ratio. Aim for 3 to 10."},
@@ -223,6 +430,22 @@ def _init_translations():
         "lbl_median": {"fr": "Valeur mediane de fond de ciel visee (ADU) :", "en": "Target sky background median (ADU):"},
         "tip_median1": {"fr": "Sur une brute, selectionner une zone de ciel sans signal et verifier la valeur mediane (Process Statistics dans PixInsight).",
                         "en": "On a raw frame, select sky area without signal and check median (Process Statistics in PixInsight)."},
+        "btn_fits": {"fr": "Analyser un dossier de brutes FITS...", "en": "Analyze a folder of FITS subs..."},
+        "fits_running": {"fr": "Mesure de {n} fichiers FITS...", "en": "Measuring {n} FITS files..."},
+        "fits_none": {"fr": "Aucun fichier FITS dans ce dossier.", "en": "No FITS file in this folder."},
+        "fits_summary": {"fr": "{n} brutes en {s:.1f} s : {low} sous SF x3, {ok} dans la cible, {high} au-dessus de SF x10 | mediane des medianes : {med} ADU",
+                         "en": "{n} subs in {s:.1f} s: {low} below SF x3, {ok} on target, {high} above SF x10 | median of medians: {med} ADU"},
+        "btn_watch": {"fr": "Surveiller le dossier de capture...", "en": "Watch the capture folder..."},
+        "btn_watch_stop": {"fr": "Arreter la surveillance", "en": "Stop watching"},
+        "watch_status": {"fr": "Surveillance de {dir} ({backend}) : {n} brutes, {low} sous SF x3, {ok} dans la cible, {high} au-dessus de SF x10",
+                         "en": "Watching {dir} ({backend}): {n} subs, {low} below SF x3, {ok} on target, {high} above SF x10"},
+        "cam_info": {"fr": "  {brand} {model} | {gain} | T={temp}C | RN={rn} Gain={ge} e-/ADU Dc={dc} {bits} bits Off={offset}",
+                     "en": "  {brand} {model} | {gain} | T={temp}C | RN={rn} Gain={ge} e-/ADU Dc={dc} {bits}bit Off={offset}"},
+        "watch_last": {"fr": "Derniere brute {name} : ciel {med:.0f} ADU, {status}", "en": "Last sub {name}: sky {med:.0f} ADU, {status}"},
+        "fits_cols": {"fr": "Fichier|Filtre|Pose (s)|Mediane ciel (ADU)|Cible", "en": "File|Filter|Exp. (s)|Sky median (ADU)|Target"},
+        "fits_low": {"fr": "sous SF x3 : allonger", "en": "below SF x3: lengthen"},
+        "fits_ok": {"fr": "ok", "en": "ok"},
+        "fits_high": {"fr": "au-dessus de SF x10 : raccourcir", "en": "above SF x10: shorten"},
         "tip_median2": {"fr": "Comparer a la cible et ajuster le temps de pose.", "en": "Compare to target and adjust exposure time."},
         "a2_title": {"fr": "2e Approche — Temps de pose optimal", "en": "2nd Approach — Optimal exposure time"},
         "a2_explain": {"fr": "On accepte un leger surcout en bruit par rapport a une pose unique infiniment longue.",
@@ -235,6 +458,23 @@ def _init_translations():
         "tip_opti": {"fr": "Si mediane FDC entre SF x3 et SF x10 = zone optimale.\nSi mediane < SF x3 = augmenter le temps.\nSi mediane trop elevee = possible de reduire.",
                      "en": "If FDC median between SF x3 and SF x10 = optimal zone.\nIf median < SF x3 = increase time.\nIf median too high = can reduce."},
         "sec_gain_long": {"fr": "Bruit additionnel pour un temps donne", "en": "Additional noise for a given exposure time"},
+        "lbl_hours": {"fr": "Integration totale (h)", "en": "Total integration (h)"},
+        "lbl_signal": {"fr": "Signal objet (e-/s/px)", "en": "Target signal (e-/s/px)"},
+        "col_dc": {"fr": "Avec DC (s)", "en": "With DC (s)"}, "col_subs": {"fr": "Poses", "en": "Subs"},
+        "col_snr": {"fr": "SNR empile", "en": "Stacked SNR"}, "col_eff": {"fr": "% ideal", "en": "% ideal"},
+        "sec_plan": {"fr": "Plan de session (repartition des heures entre filtres)", "en": "Session plan (hours split across filters)"},
+        "lbl_plan_mode": {"fr": "Objectif", "en": "Objective"},
+        "plan_maxmin": {"fr": "Equilibre (SNR min. pondere)", "en": "Balanced (weighted min. SNR)"},
+        "plan_weighted": {"fr": "Somme ponderee des SNR", "en": "Weighted SNR sum"},
+        "lbl_overhead": {"fr": "Surcout par pose (s)", "en": "Overhead per sub (s)"},
+        "col_weight": {"fr": "Poids", "en": "Weight"}, "col_sub": {"fr": "Pose (s)", "en": "Sub (s)"},
+        "col_time": {"fr": "Temps", "en": "Time"},
+        "plan_total": {"fr": "Utilise {used} sur {budget} (integration totale, surcout compris)",
+                       "en": "Uses {used} of {budget} (total integration, overhead included)"},
+        "tip_plan": {"fr": "Poids 0 = filtre ignore. Chaque filtre utilise sa pose 'Avec DC' ; un filtre au seuil inatteignable est ignore.",
+                     "en": "Weight 0 = filter skipped. Each filter uses its 'With DC' sub; a filter whose threshold is unreachable is skipped."},
+        "tip_dc_snr": {"fr": "Avec DC : meme bruit accepte, en comptant le courant d'obscurite (champ DC) ; inf = seuil inatteignable a cette temperature.\nSNR empile : poses du temps 'Avec DC' dans l'integration totale ; % ideal = par rapport a une integration sans bruit de lecture ni DC.",
+                       "en": "With DC: same accepted noise, counting dark current (DC field); inf = threshold unreachable at this temperature.\nStacked SNR: subs of the 'With DC' length within the total integration; % ideal = vs. an integration without read noise or DC."},
         "cmp_title_L": {"fr": "Comparaison 2 strategies en L", "en": "Compare 2 strategies in L"},
         "cmp_title_RGB": {"fr": "Comparaison 2 strategies en RGB", "en": "Compare 2 strategies in RGB"},
         "lbl_strat1": {"fr": "Strategie 1 (s)", "en": "Strategy 1 (s)"}, "lbl_strat2": {"fr": "Strategie 2 (s)", "en": "Strategy 2 (s)"},
@@ -243,10 +483,22 @@ def _init_translations():
         "ch2_title": {"fr": "Bruit additionnel Narrowband", "en": "Additional noise Narrowband"},
         "ch_x": {"fr": "Temps de pose (s)", "en": "Exposure time (s)"}, "ch_y": {"fr": "Bruit additionnel (%)", "en": "Additional noise (%)"},
         "ch_thresh": {"fr": "Seuil accepte", "en": "Accepted threshold"},
+        "ch_range": {"fr": "Plage de temps (s) :", "en": "Time range (s):"},
         "tbl_lrgb": {"fr": "Table — L / RGB", "en": "Table — L / RGB"}, "tbl_nb": {"fr": "Table — Narrowband", "en": "Table — Narrowband"},
         "tbl_exp": {"fr": "Temps (s)", "en": "Time (s)"}, "tbl_thresh": {"fr": "Seuil", "en": "Threshold"},
         "help_title": {"fr": "Aide — Theorie et mode d'emploi", "en": "Help — Theory and user guide"},
         "btn_bug": {"fr": "Signaler un bug", "en": "Report a bug"},
+        "lbl_profile": {"fr": "Profil :", "en": "Profile:"},
+        "profile_none": {"fr": "(aucun)", "en": "(none)"},
+        "btn_profile_save": {"fr": "Enregistrer", "en": "Save"},
+        "btn_profile_save_as": {"fr": "Enregistrer sous...", "en": "Save as..."},
+        "btn_profile_delete": {"fr": "Supprimer", "en": "Delete"},
+        "profile_name": {"fr": "Nom", "en": "Name"}, "profile_rig": {"fr": "Instrument", "en": "Rig"},
+        "profile_site": {"fr": "Site", "en": "Site"},
+        "profile_conflict": {"fr": "Le profil \"{name}\" a ete modifie depuis un autre poste ({host}).\nL'ecraser avec les reglages actuels ?",
+                             "en": "Profile \"{name}\" was changed from another computer ({host}).\nOverwrite it with the current settings?"},
+        "profile_delete_q": {"fr": "Supprimer le profil \"{name}\" ?", "en": "Delete profile \"{name}\"?"},
+        "profile_err": {"fr": "Base de profils indisponible :\n{err}", "en": "Profile database unavailable:\n{err}"},
         "bug_no_errors": {"fr": "Aucune erreur enregistree. Si vous rencontrez un probleme, decrivez-le dans le rapport qui va s'ouvrir.",
                           "en": "No errors logged. If you have an issue, describe it in the report that will open."},
         "bug_describe": {"fr": "Decrivez le probleme ici", "en": "Describe the problem here"},
@@ -258,6 +510,7 @@ def _init_translations():
     }
 
 _init_translations()
+_PROFILER.mark("_init_translations")
 
 def tr(key, lang):
     return T.get(key, {}).get(lang, key)
@@ -331,7 +584,11 @@ IV. SIGNALEMENT DE BUGS
     Toute erreur non geree est enregistree dans le fichier :
       .exposure_calc_errors.log (dans le dossier du programme)
     Format : date, version, OS, Python, traceback complet.
-    Le fichier est automatiquement tronque au-dela de 500 Ko.
+    Au-dela de 500 Ko, le journal tourne : .log devient .log.1,
+    .1 devient .2, ... jusqu'a .log.3 (le plus ancien est supprime).
+    Les entrees existantes ne sont jamais reecrites.
+    Avec EXPOSURE_CALC_LOG_FORMAT=jsonl, le journal est
+    .exposure_calc_errors.jsonl : un objet JSON par erreur.
     Les chemins utilisateur sont anonymises (remplaces par ~)
     pour proteger la vie privee.
 
@@ -421,7 +678,11 @@ IV. BUG REPORTING
     All unhandled errors are logged to:
       .exposure_calc_errors.log (in the program directory)
     Format: date, version, OS, Python, full traceback.
-    The file is automatically truncated beyond 500 KB.
+    Past 500 KB the log is rotated: .log becomes .log.1,
+    .1 becomes .2, ... up to .log.3 (the oldest is dropped).
+    Existing entries are never rewritten.
+    With EXPOSURE_CALC_LOG_FORMAT=jsonl the log is
+    .exposure_calc_errors.jsonl: one JSON object per error.
     User paths are anonymized (replaced with ~) for privacy.
 
   MANUAL:
@@ -445,36 +706,6 @@ V. SETTINGS PERSISTENCE
 """
 
 
-# === CALCULATIONS ===
-def additional_noise(t, sky, rn):
-    if rn == 0 or t <= 0 or sky <= 0:
-        return 0.0
-    r = t * sky / (rn * rn)
-    return math.sqrt((r + 1) / r) - 1
-
-def c_factor(npct):
-    if npct <= 0:
-        return float("inf")
-    ratio = ((100 + npct) / 100) ** 2 - 1
-    return round(1.0 / ratio, 1) if ratio > 0 else float("inf")
-
-def optimal_time(c, rn, sky):
-    if sky <= 0 or c == float("inf"):
-        return float("inf")
-    return math.ceil(c * rn * rn / sky)
-
-def target_median(sf, rn, ge, offset, bits):
-    if ge == 0:
-        return 0
-    return int((sf * rn * rn / ge + offset) * 65536 / (2 ** bits))
-
-def sec_to_mmss(s):
-    if s is None or s == float("inf") or s < 0:
-        return "\u2014"
-    m, sec = divmod(int(s), 60)
-    return f"{m:02d}:{sec:02d}"
-
-
 # === THEME ===
 CL = {
     "bg": "#0d1117", "bg2": "#161b22", "card": "#1c2333", "border": "#30363d",
@@ -539,13 +770,27 @@ QToolTip {{
     border-radius: 4px; padding: 6px; font-size: 9pt;
 }}
 QLabel {{ background: transparent; }}
+QTableView {{
+    background-color: {CL['card']}; border: none; font-family: "Consolas", "Menlo", monospace; font-size: 9pt;
+}}
+QHeaderView {{ background-color: {CL['card']}; border: none; }}
+QHeaderView::section {{
+    background-color: {CL['card']}; color: {CL['accent2']}; border: none; padding: 2px;
+    font-weight: bold; font-size: 9pt;
+}}
 """
 
-TIMES_LRGB = [4, 10, 20, 30, 40, 50, 60, 100, 200, 300, 400, 500, 600, 1000, 2000]
-TIMES_NB = [100, 200, 300, 400, 500, 600, 1000, 2000]
-FILTERS = [("L", "sky_L"), ("RGB", "sky_RGB"), ("NB 12 nm", "sky_NB12"), ("NB 7 nm", "sky_NB7"), ("NB 3 nm", "sky_NB3")]
 
-_UPDATE_URL = "https://raw.githubusercontent.com/ARP273-ROSE/exposure-calculator/main/ExposureCalculator.py"
+# Time-to-first-paint budget of the Parameters tab, measured from process start
+_STARTUP_BUDGET_MS = float(os.environ.get("EXPOSURE_CALC_STARTUP_BUDGET_MS", "1500"))
+
+# Update check: EXPOSURE_CALC_UPDATE_URL points it at a mirror (http(s):// or file://, e.g. a local
+# stand-in for testing); it runs at most once per EXPOSURE_CALC_UPDATE_INTERVAL_H hours (0 = every launch)
+_UPDATE_URL = (os.environ.get("EXPOSURE_CALC_UPDATE_URL", "").strip()
+               or "https://raw.githubusercontent.com/ARP273-ROSE/exposure-calculator/main/ExposureCalculator.py")
+_UPDATE_INTERVAL_H = float(os.environ.get("EXPOSURE_CALC_UPDATE_INTERVAL_H", "24"))
+# Last check: time, ETag / Last-Modified validators, remote version, check and pull durations, last skip
+_UPDATE_STATE_PATH = _APP_DIR / ".exposure_calc_update.json"
 _REPO_URL = "https://github.com/ARP273-ROSE/exposure-calculator"
 
 
@@ -556,20 +801,202 @@ def _parse_version(v):
         return (0,)
 
 
+# === NOISE TABLE MODEL ===
+class _NoiseTableModel(QAbstractTableModel):
+    """Additional-noise table: column 0 = filter name, one column per exposure time, plus a threshold row.
+
+    The model is persistent: set_data() only emits dataChanged for cells whose
+    value or threshold color changed, and resets only when the shape changes.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._times = []
+        self._names = []
+        self._grid = None
+        self._ok = None
+        self._thr = 0.0
+        self._header = ""
+        self._thr_name = ""
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() or not self._names else len(self._names) + 1
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() or not self._names else len(self._times) + 1
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        r, c = index.row(), index.column()
+        thr_row = r == len(self._names)
+        if role == Qt.ItemDataRole.DisplayRole:
+            if c == 0:
+                return self._thr_name if thr_row else self._names[r]
+            if thr_row:
+                return f"{self._thr * 100:.0f}%"
+            return f"{self._grid[r, c - 1] * 100:.1f}%"
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if thr_row:
+                return QColor(CL["green"])
+            if c == 0:
+                return QColor(CL["text"])
+            return QColor(CL["green"] if self._ok[r, c - 1] else CL["red"])
+        if role == Qt.ItemDataRole.FontRole and (c == 0 or thr_row):
+            font = QFont()
+            font.setBold(c == 0 and not thr_row)
+            font.setItalic(thr_row)
+            return font
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if c == 0:
+                return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation != Qt.Orientation.Horizontal or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._header if section == 0 else str(self._times[section - 1])
+
+    def set_labels(self, header, thr_name):
+        self._header = header
+        self._thr_name = thr_name
+        if self._names:
+            self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, 0)
+            thr_idx = self.index(len(self._names), 0)
+            self.dataChanged.emit(thr_idx, thr_idx)
+
+    def set_data(self, times, names, grid, thr):
+        import numpy as np
+        grid = np.asarray(grid, dtype=float)
+        ok = grid <= thr
+        if list(times) != self._times or list(names) != self._names or self._grid is None:
+            self.beginResetModel()
+            self._times, self._names = list(times), list(names)
+            self._grid, self._ok, self._thr = grid, ok, thr
+            self.endResetModel()
+            return
+        changed = (grid != self._grid) | (ok != self._ok)
+        thr_changed = f"{thr * 100:.0f}" != f"{self._thr * 100:.0f}"
+        self._grid, self._ok, self._thr = grid, ok, thr
+        for r in np.flatnonzero(changed.any(axis=1)):
+            cols = np.flatnonzero(changed[r])
+            self.dataChanged.emit(self.index(int(r), int(cols[0]) + 1), self.index(int(r), int(cols[-1]) + 1))
+        if thr_changed:
+            r = len(self._names)
+            self.dataChanged.emit(self.index(r, 1), self.index(r, len(self._times)))
+
+
+class _FitsResultModel(QAbstractTableModel):
+    """One row per measured FITS sub; the status column follows the current SF x3 / SF x10 medians."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._headers = []
+        self._status_text = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        r, c = self._rows[index.row()], index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if r.get("error"):
+                return (r["name"], "", "", r["error"], "")[c]
+            return (r["name"], r.get("filter") or "", "" if r.get("exptime") is None else f"{r['exptime']:g}",
+                    f"{r['sky_median']:.0f}", self._status_text.get(r.get("status"), ""))[c]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if c == 4 or r.get("error"):
+                return QColor({"ok": CL["green"], "low": CL["accent"], "high": CL["red"]}.get(r.get("status"), CL["dim"]))
+            return QColor(CL["text"])
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if c == 0:
+                return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation != Qt.Orientation.Horizontal or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._headers[section]
+
+    def set_labels(self, headers, status_text):
+        self.beginResetModel()
+        self._headers = headers
+        self._status_text = status_text
+        self.endResetModel()
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def append_row(self, row, limit):
+        """Add a row at the bottom, dropping the oldest ones beyond `limit`."""
+        extra = len(self._rows) + 1 - limit
+        if extra > 0:
+            self.beginRemoveRows(QModelIndex(), 0, extra - 1)
+            del self._rows[:extra]
+            self.endRemoveRows()
+        n = len(self._rows)
+        self.beginInsertRows(QModelIndex(), n, n)
+        self._rows.append(row)
+        self.endInsertRows()
+
+    def set_targets(self, median_sf3, median_sf10):
+        for r in self._rows:
+            r["status"] = classify_median(r.get("sky_median"), median_sf3, median_sf10)
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 4), self.index(len(self._rows) - 1, 4))
+
+    def rows(self):
+        return self._rows
+
+
+class _ProfileCombo(QComboBox):
+    """Profile selector, re-read from the store each time it opens (another PC may have saved).
+
+    The list is read in the background: the popup shows the last known list and
+    is refilled when the new one arrives.
+    """
+
+    def __init__(self, refresh, parent=None):
+        super().__init__(parent)
+        self._refresh = refresh
+
+    def showPopup(self):
+        self._refresh()
+        super().showPopup()
+
+
 # === MAIN WINDOW ===
 class ExposureCalculatorWindow(QMainWindow):
+    # Emitted from the FITS scan thread with (results, seconds)
+    fits_scanned = pyqtSignal(object, float)
+    # Emitted from the folder watcher's worker threads with one measured sub
+    fits_frame = pyqtSignal(object)
+    # Emitted from the profile list thread with (rows or None on error, request number)
+    profiles_listed = pyqtSignal(object, int)
+
     def __init__(self):
         super().__init__()
         self.lang = _detect_language()
 
         # Current values (dict-based instead of tkinter vars)
         self._vals = {
-            "sky_L": 1.76, "sky_RGB": 1.31, "sky_NB12": 0.12, "sky_NB7": 0.07,
-            "rn": 1.375, "ge": 0.244, "dc": 0.0017, "bits": 16, "offset": 20,
-            "sf": 10, "noise_pct": 5.0,
-            "exp_L": 90, "exp_RGB": 90, "exp_NB12": 180, "exp_NB7": 300, "exp_NB3": 300,
-            "cL1": 120, "cL2": 180, "cR1": 120, "cR2": 180,
+            **DEFAULT_PARAMS,
             "brand": "ZWO", "model": "", "gain_setting": "", "temp_setting": "",
+            # Chart time ranges (continuous, adaptively sampled)
+            "ch_lrgb_tmin": float(TIMES_LRGB[0]), "ch_lrgb_tmax": float(TIMES_LRGB[-1]),
+            "ch_nb_tmin": float(TIMES_NB[0]), "ch_nb_tmax": float(TIMES_NB[-1]),
+            # Last loaded / saved profile (not part of the profiles themselves)
+            "profile": "",
         }
 
         # Restore saved settings
@@ -592,10 +1019,23 @@ class ExposureCalculatorWindow(QMainWindow):
                         except (ValueError, TypeError):
                             pass
 
+        _PROFILER.mark("window: load settings")
+
         # Widget references for result labels
         self._result_labels = {}
         self._input_fields = {}
         self._combo_refs = {}
+        self.fits_scanned.connect(self._on_fits_scanned)
+        self.fits_frame.connect(self._on_fits_frame)
+        self.profiles_listed.connect(self._on_profiles_listed)
+        self._fits_model = _FitsResultModel(self)
+        self._fits_view = self._fits_btn = self._watch_btn = None
+        self._watcher = None
+        self._fits_last = None
+        self._cam_info = None
+        self._profiles = None
+        self._profile_rev = None
+        self._profiles_req = 0
         self._save_timer = QTimer(self)
         self._save_timer.setSingleShot(True)
         self._save_timer.timeout.connect(self._do_save)
@@ -603,14 +1043,37 @@ class ExposureCalculatorWindow(QMainWindow):
         self._recalc_timer.setSingleShot(True)
         self._recalc_timer.timeout.connect(self._recalc)
         self._charts_dirty = True
+        self._tables_dirty = True
         self._chart_fig = None
+        self._curves = CurveSampler()
+        self._matrix = ExposureMatrix()
+        self._results_cache = ResultCache()
+        self._graph = ResultGraph(self._matrix)
+        self._results = None
+        self.first_paint_ms = None
+        # Translatable texts: (setter, T key, format), see _tr
+        self._i18n = []
 
         self._build_ui()
+        _PROFILER.mark("window: _build_ui")
         self._recalc()
+        _PROFILER.mark("window: initial _recalc")
 
     def _t(self, key):
         return tr(key, self.lang)
 
+    def _tr(self, widget, key, fmt="{}", setter="setText"):
+        """Give `widget` the translation of `key` and register it for in-place language switches.
+
+        fmt is a format string with one {} or a callable on the translated
+        text; setter is a method name of the widget or a callable.
+        """
+        if isinstance(setter, str):
+            setter = getattr(widget, setter)
+        self._i18n.append((setter, key, fmt))
+        setter(fmt(self._t(key)) if callable(fmt) else fmt.format(self._t(key)))
+        return widget
+
     @property
     def sky_NB3(self):
         try:
@@ -640,6 +1103,17 @@ class ExposureCalculatorWindow(QMainWindow):
                 self._vals[key] = float(text)
         except (ValueError, TypeError):
             return
+        if key in self._CHART_RANGE_KEYS:
+            # Only the charts depend on their time range: no recalculation
+            self._charts_dirty = True
+            if self.tabs.currentIndex() == 4:
+                QTimer.singleShot(80, self._draw_charts)
+            self._auto_save()
+            return
+        self._schedule_recalc()
+
+    def _on_plan_mode_changed(self, idx):
+        self._vals["plan_mode"] = idx
         self._schedule_recalc()
 
     def _schedule_recalc(self):
@@ -652,7 +1126,7 @@ class ExposureCalculatorWindow(QMainWindow):
         data = dict(self._vals)
         data["version"] = __version__
         data["lang"] = self.lang
-        _save_settings_to_file(data)
+        _SETTINGS_WRITER.submit(data)
 
     def _make_label(self, text, color=None, font_size=10, bold=False, italic=False):
         lbl = QLabel(text)
@@ -676,9 +1150,8 @@ class ExposureCalculatorWindow(QMainWindow):
         self._result_labels[key] = lbl
         return lbl
 
-    def _make_card(self, title):
-        box = QGroupBox(f"  {title}  ")
-        return box
+    def _make_card(self, title_key):
+        return self._tr(QGroupBox(), title_key, "  {}  ", setter="setTitle")
 
     def _make_scrollable(self):
         scroll = QScrollArea()
@@ -696,7 +1169,7 @@ class ExposureCalculatorWindow(QMainWindow):
         return btn
 
     def _build_ui(self):
-        self.setWindowTitle(self._t("win_title"))
+        self._tr(self, "win_title", setter="setWindowTitle")
         ico_path = _resource_path("logo-expo.ico")
         if os.path.isfile(ico_path):
             self.setWindowIcon(QIcon(ico_path))
@@ -720,20 +1193,34 @@ class ExposureCalculatorWindow(QMainWindow):
         top_bar.setStyleSheet(f"background-color: {CL['bg2']}; padding: 5px;")
         top_layout = QHBoxLayout(top_bar)
         top_layout.setContentsMargins(10, 5, 10, 5)
-        top_layout.addWidget(self._make_label(self._t("win_title"), CL["accent"], 12, bold=True))
+        top_layout.addWidget(self._tr(self._make_label("", CL["accent"], 12, bold=True), "win_title"))
         top_layout.addStretch()
-        for txt, cmd, bg in [
-            (self._t("recalc"), self._recalc, CL["green"]),
-            (self._t("export"), self._export, CL["accent2"]),
-            (self._t("import"), self._import_settings, CL["accent2"]),
-            (self._t("btn_bug"), self._report_bug, CL["red"]),
-            (self._t("lang_btn"), self._toggle_lang, CL["purple"]),
+        top_layout.addWidget(self._tr(self._make_label(""), "lbl_profile"))
+        self._profile_combo = _ProfileCombo(self._refresh_profiles)
+        self._profile_combo.setMinimumWidth(220)
+        self._profile_combo.activated.connect(
+            lambda i: self._load_profile(self._profile_combo.itemData(i) or ""))
+        top_layout.addWidget(self._profile_combo)
+        for key, cmd in [
+            ("btn_profile_save", self._save_profile),
+            ("btn_profile_save_as", self._save_profile_as),
+            ("btn_profile_delete", self._delete_profile),
+        ]:
+            top_layout.addWidget(self._tr(self._make_button("", cmd, CL["accent"]), key))
+        self._refresh_profiles()
+        top_layout.addSpacing(15)
+        for key, cmd, bg in [
+            ("recalc", lambda: self._recalc(repaint_all=True), CL["green"]),
+            ("export", self._export, CL["accent2"]),
+            ("import", self._import_settings, CL["accent2"]),
+            ("btn_bug", self._report_bug, CL["red"]),
+            ("lang_btn", self._toggle_lang, CL["purple"]),
         ]:
-            top_layout.addWidget(self._make_button(txt, cmd, bg))
+            top_layout.addWidget(self._tr(self._make_button("", cmd, bg), key))
         main_layout.addWidget(top_bar)
 
         # Yellow info bar
-        info_bar = QLabel(self._t("fill_yellow"))
+        info_bar = self._tr(QLabel(), "fill_yellow")
         info_bar.setAlignment(Qt.AlignmentFlag.AlignCenter)
         info_bar.setStyleSheet(f"background-color: {CL['accent']}; color: {CL['bg']}; padding: 3px; font-size: 9pt;")
         main_layout.addWidget(info_bar)
@@ -741,7 +1228,6 @@ class ExposureCalculatorWindow(QMainWindow):
         # Tab widget
         self.tabs = QTabWidget()
         main_layout.addWidget(self.tabs)
-        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         tab_builders = [
             ("tab_params", self._build_params_tab),
@@ -752,9 +1238,50 @@ class ExposureCalculatorWindow(QMainWindow):
             ("tab_tables", self._build_tables_tab),
             ("tab_help", self._build_help_tab),
         ]
-        for key, builder in tab_builders:
-            widget = builder()
-            self.tabs.addTab(widget, f" {self._t(key)} ")
+        # Tab bodies are built on first activation (see _ensure_tab)
+        self._tab_builders = [builder for _, builder in tab_builders]
+        self._tabs_built = set()
+        for i, (key, _) in enumerate(tab_builders):
+            page = QWidget()
+            page_lay = QVBoxLayout(page)
+            page_lay.setContentsMargins(0, 0, 0, 0)
+            self.tabs.addTab(page, "")
+            self._tr(self.tabs, key, " {} ", setter=lambda text, i=i: self.tabs.setTabText(i, text))
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        self._ensure_tab(self.tabs.currentIndex())
+
+    def _ensure_tab(self, idx):
+        if idx < 0 or idx in self._tabs_built:
+            return
+        self._tabs_built.add(idx)
+        body = self._tab_builders[idx]()
+        self.tabs.widget(idx).layout().addWidget(body)
+        if idx == 0 and self.first_paint_ms is None:
+            # First card of the Parameters tab = first meaningful paint
+            (body.findChild(QGroupBox) or body).installEventFilter(self)
+        if self._results is not None:
+            self._show_results(self._results, set(self._graph.nodes))
+
+    def closeEvent(self, event):
+        if self._watcher is not None:
+            self._watcher.stop()
+        # Last snapshot (a no-op write when nothing changed since the last save)
+        self._save_timer.stop()
+        self._do_save()
+        _SETTINGS_WRITER.flush()
+        super().closeEvent(event)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and self.first_paint_ms is None:
+            obj.removeEventFilter(self)
+            self.first_paint_ms = (time.perf_counter() - _T0) * 1000
+            _PROFILER.mark("first paint (event loop)")
+            if _PROFILER.enabled:
+                QTimer.singleShot(0, _PROFILER.finish)
+            if self.first_paint_ms > _STARTUP_BUDGET_MS:
+                print(f"[startup] Parameters tab first painted after {self.first_paint_ms:.0f} ms "
+                      f"(budget {_STARTUP_BUDGET_MS:.0f} ms)", file=sys.stderr)
+        return super().eventFilter(obj, event)
 
     def _build_params_tab(self):
         scroll, inner = self._make_scrollable()
@@ -762,46 +1289,50 @@ class ExposureCalculatorWindow(QMainWindow):
         layout.setContentsMargins(6, 6, 6, 6)
 
         # Sky background card
-        sky_card = self._make_card(self._t("sec_sky"))
+        sky_card = self._make_card("sec_sky")
         sky_lay = QGridLayout(sky_card)
 
-        link = QLabel(f'<a href="https://tools.sharpcap.co.uk/" style="color: {CL["accent2"]};">{self._t("sky_link")}</a>')
+        link = self._tr(QLabel(), "sky_link",
+                        f'<a href="https://tools.sharpcap.co.uk/" style="color: {CL["accent2"]};">{{}}</a>')
         link.setOpenExternalLinks(True)
         sky_lay.addWidget(link, 0, 0, 1, 2)
 
         for i, (lk, vk) in enumerate([("lbl_L", "sky_L"), ("lbl_RGB", "sky_RGB"), ("lbl_NB12", "sky_NB12"), ("lbl_NB7", "sky_NB7")], 1):
-            sky_lay.addWidget(self._make_label(self._t(lk)), i, 0)
+            sky_lay.addWidget(self._tr(self._make_label(""), lk), i, 0)
             sky_lay.addWidget(self._make_input(vk), i, 1)
 
-        sky_lay.addWidget(self._make_label(self._t("lbl_NB3"), CL["dim"], 9, italic=True), 5, 0)
+        sky_lay.addWidget(self._tr(self._make_label("", CL["dim"], 9, italic=True), "lbl_NB3"), 5, 0)
         sky_lay.addWidget(self._make_result_label("nb3_val", "0.030", CL["green"], 11), 5, 1)
 
-        warn = self._make_label(self._t("warn_qe"), CL["red"], 8, italic=True)
+        warn = self._tr(self._make_label("", CL["red"], 8, italic=True), "warn_qe")
         warn.setWordWrap(True)
         sky_lay.addWidget(warn, 6, 0, 1, 2)
 
         layout.addWidget(sky_card, 0, 0)
 
         # Sensor params card
-        sensor_card = self._make_card(self._t("sec_sensor"))
+        sensor_card = self._make_card("sec_sensor")
         sensor_lay = QGridLayout(sensor_card)
 
         tips = {"rn": "tip_rn", "ge": "tip_ge", "dc": "tip_dc"}
         for i, (lk, vk) in enumerate([("lbl_rn", "rn"), ("lbl_ge", "ge"), ("lbl_dc", "dc"), ("lbl_bits", "bits"), ("lbl_offset", "offset")]):
-            sensor_lay.addWidget(self._make_label(self._t(lk)), i, 0)
+            sensor_lay.addWidget(self._tr(self._make_label(""), lk), i, 0)
             sensor_lay.addWidget(self._make_input(vk), i, 1)
             tip_key = tips.get(vk)
             if tip_key:
-                sensor_lay.addWidget(self._make_label(self._t(tip_key), CL["dim"], 8, italic=True), i, 2)
+                sensor_lay.addWidget(self._tr(self._make_label("", CL["dim"], 8, italic=True), tip_key), i, 2)
 
         layout.addWidget(sensor_card, 0, 1)
 
         # Camera database card
-        cam_card = self._make_card(self._t("sec_cam"))
+        cam_card = self._make_card("sec_cam")
         cam_lay = QVBoxLayout(cam_card)
 
-        nc = sum(len(m) for m in CAMERA_DB.values())
-        cam_lay.addWidget(self._make_label(self._t("cam_count").format(n=nc, s=len(_SENSORS)), CL["dim"], 9, italic=True))
+        count_lbl = self._tr(self._make_label("", CL["dim"], 9, italic=True), "cam_count",
+                             lambda text: text.format(n=CAMERA_DB_COUNTS["cameras"], s=CAMERA_DB_COUNTS["sensors"]))
+        if CAMERA_DB_INFO["source"]:
+            count_lbl.setToolTip(CAMERA_DB_INFO["source"] + (f"\n{CAMERA_DB_INFO['error']}" if CAMERA_DB_INFO["error"] else ""))
+        cam_lay.addWidget(count_lbl)
 
         combo_row = QHBoxLayout()
         for lk, vk, vals in [
@@ -810,23 +1341,43 @@ class ExposureCalculatorWindow(QMainWindow):
             ("lbl_gain", "gain_setting", []),
             ("lbl_temp", "temp_setting", []),
         ]:
-            combo_row.addWidget(self._make_label(self._t(lk)))
+            combo_row.addWidget(self._tr(self._make_label(""), lk))
             cb = QComboBox()
             cb.addItems(vals)
             if vk == "model":
                 cb.setMinimumWidth(180)
+            if vk == "temp_setting":
+                cb.setEditable(True)
+                self._tr(cb, "tip_temp", setter="setToolTip")
+            if vk == "gain_setting":
+                cb.setEditable(True)
+                self._tr(cb, "tip_gain", setter="setToolTip")
             self._combo_refs[vk] = cb
             combo_row.addWidget(cb)
 
         self._combo_refs["brand"].currentTextChanged.connect(self._on_brand_changed)
         self._combo_refs["model"].currentTextChanged.connect(self._on_model_changed)
 
-        apply_btn = self._make_button(self._t("btn_apply"), self._apply_camera, CL["accent"])
+        apply_btn = self._tr(self._make_button("", self._apply_camera, CL["accent"]), "btn_apply")
         combo_row.addWidget(apply_btn)
         cam_lay.addLayout(combo_row)
 
-        self._cam_info_label = self._make_label("", CL["green"], 9, italic=True)
+        self._cam_info_label = self._tr(self._make_label("", CL["green"], 9, italic=True), "cam_info",
+                                        lambda text: text.format(**self._cam_info) if self._cam_info else "")
         cam_lay.addWidget(self._cam_info_label)
+        setpoint_row = QHBoxLayout()
+        setpoint_row.addWidget(self._tr(self._make_label(""), "lbl_dc_frac"))
+        setpoint_row.addWidget(self._make_input("dc_frac", 50))
+        setpoint_row.addWidget(self._make_result_label("cam_setpoint", "", CL["accent2"], 9, bold=False, mono=False), 1)
+        cam_lay.addLayout(setpoint_row)
+        gain_row = QHBoxLayout()
+        gain_row.addWidget(self._tr(self._make_label(""), "lbl_dr_min"))
+        gain_row.addWidget(self._make_input("dr_min", 50))
+        gain_row.addWidget(self._make_result_label("cam_best_gain", "", CL["accent2"], 9, bold=False, mono=False), 1)
+        cam_lay.addLayout(gain_row)
+        fastest = self._make_result_label("fastest_cams", "", CL["accent2"], 9, bold=False, mono=False)
+        fastest.setWordWrap(True)
+        cam_lay.addWidget(fastest)
 
         layout.addWidget(cam_card, 1, 0, 1, 2)
         layout.setRowStretch(2, 1)
@@ -845,22 +1396,22 @@ class ExposureCalculatorWindow(QMainWindow):
         layout = QVBoxLayout(inner)
         layout.setContentsMargins(15, 10, 15, 10)
 
-        layout.addWidget(self._make_label(self._t("a1_title"), CL["accent"], 13, bold=True))
-        explain = self._make_label(self._t("a1_explain"), CL["dim"], 9)
+        layout.addWidget(self._tr(self._make_label("", CL["accent"], 13, bold=True), "a1_title"))
+        explain = self._tr(self._make_label("", CL["dim"], 9), "a1_explain")
         explain.setWordWrap(True)
         layout.addWidget(explain)
 
-        card = self._make_card(self._t("lbl_sf"))
+        card = self._make_card("lbl_sf")
         card_lay = QVBoxLayout(card)
 
         sf_row = QHBoxLayout()
-        sf_row.addWidget(self._make_label(self._t("lbl_sf") + " :"))
+        sf_row.addWidget(self._tr(self._make_label(""), "lbl_sf", "{} :"))
         sf_row.addWidget(self._make_input("sf", 60))
-        sf_row.addWidget(self._make_label(self._t("sf_range"), CL["dim"], 9, italic=True))
+        sf_row.addWidget(self._tr(self._make_label("", CL["dim"], 9, italic=True), "sf_range"))
         sf_row.addStretch()
         card_lay.addLayout(sf_row)
 
-        card_lay.addWidget(self._make_label(self._t("lbl_median"), font_size=11, bold=True))
+        card_lay.addWidget(self._tr(self._make_label("", font_size=11, bold=True), "lbl_median"))
 
         medians_row = QHBoxLayout()
         for label_text, color, key in [("SF x3", CL["accent2"], "sf3"), ("SF xN", CL["accent"], "sfn"), ("SF x10", CL["green"], "sf10")]:
@@ -874,10 +1425,37 @@ class ExposureCalculatorWindow(QMainWindow):
         card_lay.addLayout(medians_row)
 
         for tip_key in ("tip_median1", "tip_median2"):
-            tip = self._make_label(self._t(tip_key), CL["dim"], 9)
+            tip = self._tr(self._make_label("", CL["dim"], 9), tip_key)
             tip.setWordWrap(True)
             card_lay.addWidget(tip)
 
+        # Automatic measure: sky medians of a folder of raw subs
+        fits_row = QHBoxLayout()
+        self._fits_btn = self._tr(self._make_button("", self._analyze_fits_folder, CL["accent2"]), "btn_fits")
+        fits_row.addWidget(self._fits_btn)
+        watching = self._watcher is not None and self._watcher.running
+        self._watch_btn = self._make_button(self._t("btn_watch_stop" if watching else "btn_watch"),
+                                            self._toggle_watch, CL["accent"])
+        fits_row.addWidget(self._watch_btn)
+        fits_row.addWidget(self._make_result_label("fits_summary", "", CL["dim"], 9, bold=False, mono=False), 1)
+        card_lay.addLayout(fits_row)
+        card_lay.addWidget(self._tr(self._make_result_label("fits_alert", "", CL["dim"], 11, bold=True, mono=False),
+                                    "watch_last", self._watch_last_text))
+        self._tr(self._fits_model, "fits_cols", setter=lambda text: self._fits_model.set_labels(
+            text.split("|"), {k: self._t(f"fits_{k}") for k in ("low", "ok", "high")}))
+        view = QTableView()
+        view.setModel(self._fits_model)
+        view.verticalHeader().hide()
+        view.setShowGrid(False)
+        view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        view.horizontalHeader().setStretchLastSection(True)
+        view.setMinimumHeight(220)
+        view.setVisible(self._fits_model.rowCount() > 0)
+        self._fits_view = view
+        card_lay.addWidget(view)
+
         layout.addWidget(card)
         layout.addStretch()
         return scroll
@@ -887,33 +1465,43 @@ class ExposureCalculatorWindow(QMainWindow):
         layout = QVBoxLayout(inner)
         layout.setContentsMargins(15, 10, 15, 10)
 
-        layout.addWidget(self._make_label(self._t("a2_title"), CL["accent"], 13, bold=True))
-        explain = self._make_label(self._t("a2_explain"), CL["dim"], 9)
+        layout.addWidget(self._tr(self._make_label("", CL["accent"], 13, bold=True), "a2_title"))
+        explain = self._tr(self._make_label("", CL["dim"], 9), "a2_explain")
         explain.setWordWrap(True)
         layout.addWidget(explain)
 
         # Noise % card
-        noise_card = self._make_card(self._t("lbl_noise_pct"))
+        noise_card = self._make_card("lbl_noise_pct")
         nc_lay = QVBoxLayout(noise_card)
         noise_row = QHBoxLayout()
-        noise_row.addWidget(self._make_label(self._t("lbl_noise_pct") + " :"))
+        noise_row.addWidget(self._tr(self._make_label(""), "lbl_noise_pct", "{} :"))
         noise_row.addWidget(self._make_input("noise_pct", 60))
         noise_row.addWidget(self._make_label("%", font_size=11, bold=True))
         noise_row.addWidget(self._make_label("|", CL["border"], 14))
-        noise_row.addWidget(self._make_label(self._t("lbl_c") + " :"))
+        noise_row.addWidget(self._tr(self._make_label(""), "lbl_c", "{} :"))
         noise_row.addWidget(self._make_result_label("c_factor", "--", CL["green"], 14))
         noise_row.addStretch()
         nc_lay.addLayout(noise_row)
-        nc_lay.addWidget(self._make_label(self._t("lbl_examples"), CL["dim"], 9, italic=True))
+        nc_lay.addWidget(self._tr(self._make_label("", CL["dim"], 9, italic=True), "lbl_examples"))
         layout.addWidget(noise_card)
 
         # Optimal times card
-        opti_card = self._make_card(self._t("sec_opti"))
+        opti_card = self._make_card("sec_opti")
         oc_lay = QVBoxLayout(opti_card)
 
+        budget_row = QHBoxLayout()
+        budget_row.addWidget(self._tr(self._make_label(""), "lbl_hours", "{} :"))
+        budget_row.addWidget(self._make_input("hours", 60))
+        budget_row.addWidget(self._make_label("|", CL["border"], 14))
+        budget_row.addWidget(self._tr(self._make_label(""), "lbl_signal", "{} :"))
+        budget_row.addWidget(self._make_input("signal", 60))
+        budget_row.addStretch()
+        oc_lay.addLayout(budget_row)
+
         header = QHBoxLayout()
-        for text, w in [(self._t("col_filter"), 100), (self._t("col_sec"), 100), (self._t("col_mmss"), 100)]:
-            lbl = self._make_label(text, CL["accent2"], 10, bold=True)
+        for key, w in [("col_filter", 100), ("col_sec", 100), ("col_mmss", 100),
+                       ("col_dc", 100), ("col_subs", 70), ("col_snr", 100), ("col_eff", 80)]:
+            lbl = self._tr(self._make_label("", CL["accent2"], 10, bold=True), key)
             lbl.setFixedWidth(w)
             header.addWidget(lbl)
         header.addStretch()
@@ -928,28 +1516,86 @@ class ExposureCalculatorWindow(QMainWindow):
             self._result_labels[f"opti_sec_{fn}"].setFixedWidth(100)
             row.addWidget(self._make_result_label(f"opti_mmss_{fn}", "--", CL["dim"], 12, mono=True))
             self._result_labels[f"opti_mmss_{fn}"].setFixedWidth(100)
+            for key, color, w in [("opti_dc", CL["accent"], 100), ("snr_n", CL["dim"], 70),
+                                  ("snr", CL["accent2"], 100), ("snr_eff", CL["dim"], 80)]:
+                row.addWidget(self._make_result_label(f"{key}_{fn}", "--", color, 12))
+                self._result_labels[f"{key}_{fn}"].setFixedWidth(w)
             row.addStretch()
             oc_lay.addLayout(row)
 
-        tip = self._make_label(self._t("tip_opti"), CL["dim"], 9)
+        tip = self._tr(self._make_label("", CL["dim"], 9), "tip_opti")
         tip.setWordWrap(True)
         oc_lay.addWidget(tip)
+        tip_dc = self._tr(self._make_label("", CL["dim"], 9, italic=True), "tip_dc_snr")
+        tip_dc.setWordWrap(True)
+        oc_lay.addWidget(tip_dc)
         layout.addWidget(opti_card)
 
+        # Session plan card
+        plan_card = self._make_card("sec_plan")
+        pc_lay = QVBoxLayout(plan_card)
+        mode_row = QHBoxLayout()
+        mode_row.addWidget(self._tr(self._make_label(""), "lbl_plan_mode", "{} :"))
+        mode_cb = QComboBox()
+        mode_cb.addItems(["", ""])
+        for i, key in enumerate(("plan_maxmin", "plan_weighted")):
+            self._tr(mode_cb, key, setter=lambda text, i=i: mode_cb.setItemText(i, text))
+        mode_cb.setCurrentIndex(int(self._vals.get("plan_mode", 0)) % 2)
+        mode_cb.currentIndexChanged.connect(self._on_plan_mode_changed)
+        self._combo_refs["plan_mode"] = mode_cb
+        mode_row.addWidget(mode_cb)
+        mode_row.addWidget(self._make_label("|", CL["border"], 14))
+        mode_row.addWidget(self._tr(self._make_label(""), "lbl_overhead", "{} :"))
+        mode_row.addWidget(self._make_input("overhead", 60))
+        mode_row.addStretch()
+        pc_lay.addLayout(mode_row)
+
+        header = QHBoxLayout()
+        for key, w in [("col_filter", 100), ("col_weight", 70), ("col_sub", 100),
+                       ("col_subs", 70), ("col_time", 100), ("col_snr", 100)]:
+            lbl = self._tr(self._make_label("", CL["accent2"], 10, bold=True), key)
+            lbl.setFixedWidth(w)
+            header.addWidget(lbl)
+        header.addStretch()
+        pc_lay.addLayout(header)
+
+        for fn, sk in FILTERS:
+            row = QHBoxLayout()
+            lbl = self._make_label(fn)
+            lbl.setFixedWidth(100)
+            row.addWidget(lbl)
+            w_field = self._make_input("w_" + sk[4:], 50)
+            row.addWidget(w_field)
+            row.addSpacing(20)
+            for key, color, w in [("plan_sub", CL["accent"], 100), ("plan_n", CL["dim"], 70),
+                                  ("plan_time", CL["green"], 100), ("plan_snr", CL["accent2"], 100)]:
+                row.addWidget(self._make_result_label(f"{key}_{fn}", "--", color, 12))
+                self._result_labels[f"{key}_{fn}"].setFixedWidth(w)
+            row.addStretch()
+            pc_lay.addLayout(row)
+
+        pc_lay.addWidget(self._make_result_label("plan_total", "", CL["green"], 10, bold=False, mono=False))
+        tip_plan = self._tr(self._make_label("", CL["dim"], 9, italic=True), "tip_plan")
+        tip_plan.setWordWrap(True)
+        pc_lay.addWidget(tip_plan)
+        layout.addWidget(plan_card)
+
         # Additional noise for given time card
-        gain_card = self._make_card(self._t("sec_gain_long"))
+        gain_card = self._make_card("sec_gain_long")
         gc_lay = QVBoxLayout(gain_card)
 
-        exp_key_map = {"L": "exp_L", "RGB": "exp_RGB", "NB 12 nm": "exp_NB12", "NB 7 nm": "exp_NB7", "NB 3 nm": "exp_NB3"}
         for fn, _ in FILTERS:
             row = QHBoxLayout()
             lbl = self._make_label(fn)
             lbl.setFixedWidth(100)
             row.addWidget(lbl)
-            row.addWidget(self._make_input(exp_key_map[fn], 70))
+            row.addWidget(self._make_input(EXP_KEYS[fn], 70))
             row.addWidget(self._make_label("s"))
             row.addWidget(self._make_label("->", CL["dim"]))
             row.addWidget(self._make_result_label(f"gain_noise_{fn}", "--", CL["accent"], 12))
+            self._result_labels[f"gain_noise_{fn}"].setFixedWidth(100)
+            row.addWidget(self._make_label("|", CL["border"], 14))
+            row.addWidget(self._make_result_label(f"gain_snr_{fn}", "--", CL["accent2"], 11, bold=False))
             row.addStretch()
             gc_lay.addLayout(row)
 
@@ -965,16 +1611,16 @@ class ExposureCalculatorWindow(QMainWindow):
             ("cmp_title_L", "sky_L", "cL1", "cL2", "dL"),
             ("cmp_title_RGB", "sky_RGB", "cR1", "cR2", "dR"),
         ]:
-            card = self._make_card(self._t(title_key))
+            card = self._make_card(title_key)
             card_lay = QVBoxLayout(card)
 
-            for lk, vk, nk in [(self._t("lbl_strat1"), v1_key, f"n{delta_key}1"), (self._t("lbl_strat2"), v2_key, f"n{delta_key}2")]:
+            for lk, vk, nk in [("lbl_strat1", v1_key, f"n{delta_key}1"), ("lbl_strat2", v2_key, f"n{delta_key}2")]:
                 row = QHBoxLayout()
-                row.addWidget(self._make_label(lk + " :"))
+                row.addWidget(self._tr(self._make_label(""), lk, "{} :"))
                 row.addWidget(self._make_input(vk, 70))
                 row.addWidget(self._make_label("s"))
                 row.addWidget(self._make_label("|", CL["border"], 14))
-                row.addWidget(self._make_label(self._t("lbl_noise") + " :"))
+                row.addWidget(self._tr(self._make_label(""), "lbl_noise", "{} :"))
                 row.addWidget(self._make_result_label(nk, "--", CL["accent2"], 11))
                 row.addStretch()
                 card_lay.addLayout(row)
@@ -985,7 +1631,7 @@ class ExposureCalculatorWindow(QMainWindow):
             card_lay.addWidget(sep)
 
             delta_row = QHBoxLayout()
-            delta_row.addWidget(self._make_label(self._t("lbl_delta"), font_size=12, bold=True))
+            delta_row.addWidget(self._tr(self._make_label("", font_size=12, bold=True), "lbl_delta"))
             delta_row.addWidget(self._make_result_label(delta_key, "--", CL["green"], 18))
             delta_row.addStretch()
             card_lay.addLayout(delta_row)
@@ -999,66 +1645,148 @@ class ExposureCalculatorWindow(QMainWindow):
         self._chart_widget = QWidget()
         self._chart_layout = QVBoxLayout(self._chart_widget)
         self._chart_layout.setContentsMargins(0, 0, 0, 0)
-        return self._chart_widget
-
-    def _draw_charts(self):
-        # Clear existing
-        while self._chart_layout.count():
-            item = self._chart_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.setParent(None)
-                w.deleteLater()
-
-        if self._chart_fig is not None:
-            try:
-                self._chart_fig.clf()
-                import matplotlib.pyplot as plt
-                plt.close(self._chart_fig)
-            except Exception:
-                pass
 
-        rn = self._vals["rn"]
-        thr = self._vals["noise_pct"] / 100
-
-        size = self._chart_widget.size()
-        fw = max(400, size.width())
-        fh = max(300, size.height())
-        dpi = 100
-        fig_w = fw / dpi
-        fig_h = min(fh / dpi, fig_w * 0.52)
+        range_row = QHBoxLayout()
+        range_row.setContentsMargins(10, 4, 10, 0)
+        range_row.addWidget(self._tr(self._make_label("", CL["dim"], 9), "ch_range"))
+        for title, (k0, k1) in (("L / RGB", self._CHART_SERIES[0][5]), ("NB", self._CHART_SERIES[1][5])):
+            range_row.addSpacing(12)
+            range_row.addWidget(self._make_label(title, CL["accent"], 9, bold=True))
+            range_row.addWidget(self._make_input(k0, 60))
+            range_row.addWidget(self._make_label("-", CL["dim"]))
+            range_row.addWidget(self._make_input(k1, 60))
+        range_row.addStretch()
+        self._chart_layout.addLayout(range_row)
+        return self._chart_widget
 
-        fig = Figure(figsize=(fig_w, fig_h), dpi=dpi, facecolor=CL["bg"])
+    # Chart series: (result node, marker times, colors, names, title key, time range keys, filter slice)
+    _CHART_SERIES = [
+        ("table_lrgb", TIMES_LRGB, ["red", "accent"], ["L", "RGB"], "ch1_title", ("ch_lrgb_tmin", "ch_lrgb_tmax"), slice(0, 2)),
+        ("table_nb", TIMES_NB, ["red", "accent", "accent2"], ["NB12", "NB7", "NB3"], "ch2_title", ("ch_nb_tmin", "ch_nb_tmax"), slice(2, 5)),
+    ]
+    _CHART_RANGE_KEYS = {k for *_, keys, _ in _CHART_SERIES for k in keys}
+
+    def _init_chart(self):
+        """Create the figure, axes, artists and canvas once; later draws only update data."""
+        # matplotlib is only imported once the Charts tab is first drawn
+        import matplotlib
+        matplotlib.use("QtAgg")
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
+
+        fig = Figure(dpi=100, facecolor=CL["bg"])
         fig.set_tight_layout(True)
-
-        for idx, (times, skies, colors, names, tk_k) in enumerate([
-            (TIMES_LRGB, [self._sky("sky_L"), self._sky("sky_RGB")],
-             [CL["red"], CL["accent"]], ["L", "RGB"], "ch1_title"),
-            (TIMES_NB, [self._sky("sky_NB12"), self._sky("sky_NB7"), self.sky_NB3],
-             [CL["red"], CL["accent"], CL["accent2"]], ["NB12", "NB7", "NB3"], "ch2_title"),
-        ]):
+        self._chart_axes, self._chart_artists = [], []
+        for idx, (_, times, colors, names, *_) in enumerate(self._CHART_SERIES):
             ax = fig.add_subplot(1, 2, idx + 1)
             ax.set_facecolor(CL["bg2"])
-            allv = []
-            for sky, co, nm in zip(skies, colors, names):
-                v = [additional_noise(t, sky, rn) * 100 for t in times]
-                allv.extend(v)
-                ax.plot(times, v, "o-", color=co, label=nm, linewidth=2, markersize=4)
-            ax.axhline(y=thr * 100, color=CL["green"], linestyle="--", linewidth=1.5, label=self._t("ch_thresh"))
-            ymax = max(max(allv) if allv else 1, thr * 100) * 1.15
-            ax.set_ylim(0, ymax)
-            ax.set_xlabel(self._t("ch_x"), color=CL["text"], fontsize=9)
-            ax.set_ylabel(self._t("ch_y"), color=CL["text"], fontsize=9)
-            ax.set_title(self._t(tk_k), color=CL["accent"], fontsize=11, fontweight="bold")
-            ax.legend(fontsize=8, facecolor=CL["bg2"], edgecolor=CL["border"], labelcolor=CL["text"])
+            # Per filter: adaptive continuous curve, then markers at the fixed table times, then the threshold
+            artists = [ax.plot([], [], "-", color=CL[co], label=nm, linewidth=2, animated=True)[0]
+                       for co, nm in zip(colors, names)]
+            artists += [ax.plot(times, [0.0] * len(times), "o", color=CL[co], label="_nolegend_",
+                                markersize=4, animated=True)[0]
+                        for co in colors]
+            artists.append(ax.axhline(y=0, color=CL["green"], linestyle="--", linewidth=1.5, animated=True))
+            ax.set_ylim(0, 1)
             ax.tick_params(colors=CL["dim"], labelsize=8)
             ax.grid(True, alpha=0.15, color=CL["dim"])
             for sp in ax.spines.values():
                 sp.set_color(CL["border"])
-
-        self._chart_fig = fig
+            self._chart_axes.append(ax)
+            self._chart_artists.append(artists)
         canvas = FigureCanvasQTAgg(fig)
+        canvas.mpl_connect("draw_event", self._on_chart_draw)
+        canvas.mpl_connect("resize_event", lambda event: self._set_chart_curves())
         self._chart_layout.addWidget(canvas)
+        self._chart_fig, self._chart_canvas = fig, canvas
+        self._chart_bg = None
+        self._chart_lang = None
+
+    def _apply_chart_texts(self):
+        for ax, artists, (_, _, _, _, tk_k, *_) in zip(self._chart_axes, self._chart_artists, self._CHART_SERIES):
+            artists[-1].set_label(self._t("ch_thresh"))
+            ax.set_xlabel(self._t("ch_x"), color=CL["text"], fontsize=9)
+            ax.set_ylabel(self._t("ch_y"), color=CL["text"], fontsize=9)
+            ax.set_title(self._t(tk_k), color=CL["accent"], fontsize=11, fontweight="bold")
+            ax.legend(fontsize=8, facecolor=CL["bg2"], edgecolor=CL["border"], labelcolor=CL["text"])
+        self._chart_lang = self.lang
+
+    def _on_chart_draw(self, event):
+        # A full draw (resize, limits, labels) skips the animated artists: grab the clean background, then draw them
+        self._chart_bg = self._chart_canvas.copy_from_bbox(self._chart_fig.bbox)
+        for ax, artists in zip(self._chart_axes, self._chart_artists):
+            for a in artists:
+                ax.draw_artist(a)
+
+    @staticmethod
+    def _nice_ceil(x):
+        """Round up to 1/2/2.5/5 x 10^n so the y-limits (and the full redraw they need) rarely change."""
+        base = 10 ** math.floor(math.log10(x))
+        for m in (1, 2, 2.5, 5, 10):
+            if x <= m * base:
+                return m * base
+        return 10 * base
+
+    def _chart_range(self, keys, times):
+        t0, t1 = (self._vals.get(k, 0) for k in keys)
+        return (float(t0), float(t1)) if 0 < t0 < t1 else (float(times[0]), float(times[-1]))
+
+    def _set_chart_curves(self):
+        """Sample each curve over its time range and decimate it to the axes width.
+
+        The refinement is cached per (rn, sky) in self._curves, so a resize or a
+        range change only evaluates the parts of the curves not known yet.
+        Returns True when an x-range changed (a full redraw is needed).
+        """
+        if self._results is None or self._chart_fig is None:
+            return False
+        p = self._graph.params
+        skies = filter_skies(p)
+        changed = False
+        for ax, artists, (_, times, _, names, _, keys, sl) in zip(self._chart_axes, self._chart_artists, self._CHART_SERIES):
+            t0, t1 = self._chart_range(keys, times)
+            if tuple(ax.get_xlim()) != (t0, t1):
+                ax.set_xlim(t0, t1)
+                changed = True
+            width = ax.bbox.width
+            for line, sky in zip(artists[:len(names)], skies[sl]):
+                t, y = self._curves.sample(p["rn"], sky, t0, t1)
+                line.set_data(*decimate(t, y * 100, width, t0, t1))
+        return changed
+
+    def _draw_charts(self):
+        if self._results is None:
+            return
+        if self._chart_fig is None:
+            self._init_chart()
+        thr = self._vals["noise_pct"]
+        full = self._chart_bg is None
+        if self._chart_lang != self.lang:
+            self._apply_chart_texts()
+            full = True
+
+        if self._set_chart_curves():
+            full = True
+        for ax, artists, (node, _, _, names, *_) in zip(self._chart_axes, self._chart_artists, self._CHART_SERIES):
+            grid = self._results[node] * 100
+            for line, v in zip(artists[len(names):-1], grid):
+                line.set_ydata(v)
+            artists[-1].set_ydata([thr, thr])
+            top = max([line.get_ydata().max() for line in artists[:len(names)] if len(line.get_ydata())] + [thr, 1e-6]) * 1.15
+            cur = ax.get_ylim()[1]
+            if top > cur or top < cur * 0.4:
+                ax.set_ylim(0, self._nice_ceil(top))
+                full = True
+
+        canvas = self._chart_canvas
+        if full:
+            canvas.draw()
+        else:
+            canvas.restore_region(self._chart_bg)
+            for ax, artists in zip(self._chart_axes, self._chart_artists):
+                for a in artists:
+                    ax.draw_artist(a)
+            canvas.blit(self._chart_fig.bbox)
         self._charts_dirty = False
 
     def _build_tables_tab(self):
@@ -1066,89 +1794,58 @@ class ExposureCalculatorWindow(QMainWindow):
         self._tables_inner = inner
         self._tables_layout = QVBoxLayout(inner)
         self._tables_layout.setContentsMargins(8, 6, 8, 6)
-        return scroll
-
-    def _update_tables(self):
-        # Clear
-        while self._tables_layout.count():
-            item = self._tables_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.setParent(None)
-                w.deleteLater()
-
-        rn = self._vals["rn"]
-        thr = self._vals["noise_pct"] / 100
 
-        for tk_k, times, series in [
-            ("tbl_lrgb", TIMES_LRGB, [
-                ("L", [additional_noise(t, self._sky("sky_L"), rn) for t in TIMES_LRGB]),
-                ("RGB", [additional_noise(t, self._sky("sky_RGB"), rn) for t in TIMES_LRGB]),
-            ]),
-            ("tbl_nb", TIMES_NB, [
-                ("NB12", [additional_noise(t, self._sky("sky_NB12"), rn) for t in TIMES_NB]),
-                ("NB7", [additional_noise(t, self._sky("sky_NB7"), rn) for t in TIMES_NB]),
-                ("NB3", [additional_noise(t, self.sky_NB3, rn) for t in TIMES_NB]),
-            ]),
-        ]:
-            card = self._make_card(self._t(tk_k))
+        self._table_models = {}
+        for tk_k in ("tbl_lrgb", "tbl_nb"):
+            card = self._make_card(tk_k)
             card_lay = QVBoxLayout(card)
-
-            # Header
-            hdr = QHBoxLayout()
-            lbl = self._make_label(self._t("tbl_exp"), CL["accent2"], 9, bold=True)
-            lbl.setFixedWidth(80)
-            hdr.addWidget(lbl)
-            for t in times:
-                cell = self._make_label(str(t), CL["accent2"], 9, bold=True)
-                cell.setFixedWidth(55)
-                cell.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                hdr.addWidget(cell)
-            hdr.addStretch()
-            card_lay.addLayout(hdr)
-
-            # Data rows
-            for nm, vals in series:
-                row = QHBoxLayout()
-                name_lbl = self._make_label(nm, font_size=9, bold=True)
-                name_lbl.setFixedWidth(80)
-                row.addWidget(name_lbl)
-                for v in vals:
-                    color = CL["green"] if v <= thr else CL["red"]
-                    cell = QLabel(f"{v * 100:.1f}%")
-                    cell.setFixedWidth(55)
-                    cell.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    cell.setStyleSheet(f"color: {color}; font-family: 'Consolas', monospace; font-size: 9pt;")
-                    row.addWidget(cell)
-                row.addStretch()
-                card_lay.addLayout(row)
-
-            # Threshold row
-            thr_row = QHBoxLayout()
-            thr_lbl = self._make_label(self._t("tbl_thresh"), CL["green"], 9, italic=True)
-            thr_lbl.setFixedWidth(80)
-            thr_row.addWidget(thr_lbl)
-            for _ in times:
-                cell = QLabel(f"{thr * 100:.0f}%")
-                cell.setFixedWidth(55)
-                cell.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                cell.setStyleSheet(f"color: {CL['green']}; font-family: 'Consolas', monospace; font-size: 9pt; font-style: italic;")
-                thr_row.addWidget(cell)
-            thr_row.addStretch()
-            card_lay.addLayout(thr_row)
-
+            model = _NoiseTableModel(self)
+            self._tr(model, "tbl_exp", setter=lambda text, m=model: m.set_labels(text, self._t("tbl_thresh")))
+            view = QTableView()
+            view.setModel(model)
+            view.verticalHeader().hide()
+            view.setShowGrid(False)
+            view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+            view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+            view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+            view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+            hdr = view.horizontalHeader()
+            hdr.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+            hdr.setDefaultSectionSize(55)
+            model.modelReset.connect(lambda v=view: self._fit_table_view(v))
+            card_lay.addWidget(view)
             self._tables_layout.addWidget(card)
+            self._table_models[tk_k] = model
 
         self._tables_layout.addStretch()
+        return scroll
+
+    @staticmethod
+    def _fit_table_view(view):
+        view.setColumnWidth(0, 80)
+        h = view.horizontalHeader().sizeHint().height() + view.verticalHeader().length() + 2 * view.frameWidth()
+        if view.horizontalHeader().length() > view.viewport().width():
+            h += view.horizontalScrollBar().sizeHint().height()
+        view.setFixedHeight(h)
+
+    def _update_tables(self):
+        thr = self._vals["noise_pct"] / 100
+        for tk_k, times, names, node in [
+            ("tbl_lrgb", TIMES_LRGB, ["L", "RGB"], "table_lrgb"),
+            ("tbl_nb", TIMES_NB, ["NB12", "NB7", "NB3"], "table_nb"),
+        ]:
+            self._table_models[tk_k].set_data(times, names, self._results[node], thr)
+        self._tables_dirty = False
 
     def _build_help_tab(self):
         from PyQt6.QtWidgets import QTextEdit
         widget = QWidget()
         layout = QVBoxLayout(widget)
-        layout.addWidget(self._make_label(self._t("help_title"), CL["accent"], 13, bold=True))
+        layout.addWidget(self._tr(self._make_label("", CL["accent"], 13, bold=True), "help_title"))
         text_edit = QTextEdit()
         text_edit.setReadOnly(True)
-        text_edit.setPlainText(HELP_FR if self.lang == "fr" else HELP_EN)
+        self._tr(text_edit, "help_title",
+                 lambda _: HELP_FR if self.lang == "fr" else HELP_EN, setter="setPlainText")
         layout.addWidget(text_edit)
         return widget
 
@@ -1201,8 +1898,16 @@ class ExposureCalculatorWindow(QMainWindow):
         if not cam:
             return
         gk = self._combo_refs["gain_setting"].currentText()
-        if gk in cam["gains"]:
-            g = cam["gains"][gk]
+        g = cam["gains"].get(gk)
+        gain = parse_gain(gk, None) if g is None and gk.strip() else None
+        if gain is not None:
+            # Intermediate gain typed in: read the sensor's interpolated gain curve
+            c = gain_curve(cam)(gain)
+            g = {"rn": round(c["rn"], 2), "ge": float(f"{c['ge']:.3g}"), "offset": int(c["offset"])}
+        # A typed gain without a number keeps the current values; the field is flagged until fixed
+        bad_gain = g is None and bool(gk.strip())
+        self._combo_refs["gain_setting"].setStyleSheet(f"border: 1px solid {CL['red']};" if bad_gain else "")
+        if g is not None:
             self._vals["rn"] = g["rn"]
             self._vals["ge"] = g["ge"]
             self._vals["offset"] = g.get("offset", 20)
@@ -1217,126 +1922,196 @@ class ExposureCalculatorWindow(QMainWindow):
             self._input_fields["bits"].setText(str(cam["bits"]))
             self._input_fields["bits"].blockSignals(False)
 
-        temp_str = self._combo_refs["temp_setting"].currentText()
-        for k, v in cam["temps"].items():
-            if str(k) == temp_str:
-                self._vals["dc"] = v
-                if "dc" in self._input_fields:
-                    self._input_fields["dc"].blockSignals(True)
-                    self._input_fields["dc"].setText(str(v))
-                    self._input_fields["dc"].blockSignals(False)
-                break
-
-        self._cam_info_label.setText(
-            f"  {brand} {model} | {gk} | T={temp_str}C | "
-            f"RN={self._vals['rn']} Gain={self._vals['ge']} e-/ADU "
-            f"Dc={self._vals['dc']} {cam['bits']}bit Off={self._vals['offset']}"
-        )
+        temp_str = self._combo_refs["temp_setting"].currentText().replace("°", "").rstrip("Cc ").strip()
+        try:
+            temp = float(temp_str)
+        except ValueError:
+            temp = None
+        if temp is not None and cam["temps"]:
+            v = float(f"{dark_model(cam['temps'])(temp):.3g}")
+            self._vals["temp_setting"] = temp_str
+            self._vals["dc"] = v
+            if "dc" in self._input_fields:
+                self._input_fields["dc"].blockSignals(True)
+                self._input_fields["dc"].setText(str(v))
+                self._input_fields["dc"].blockSignals(False)
+
+        self._cam_info = {"brand": brand, "model": model, "gain": gk, "temp": temp_str, "rn": self._vals["rn"],
+                          "ge": self._vals["ge"], "dc": self._vals["dc"], "bits": cam["bits"], "offset": self._vals["offset"]}
+        self._cam_info_label.setText(self._t("cam_info").format(**self._cam_info))
         self._recalc()
 
-    def _recalc(self):
+    def _recalc(self, repaint_all=False):
         try:
-            rn = self._vals["rn"]
-            ge = self._vals["ge"]
-            bits = self._vals["bits"]
-            off = self._vals["offset"]
-            sf = self._vals["sf"]
-            npct = self._vals["noise_pct"]
-        except Exception:
+            params = {k: self._vals[k] for k in RESULT_KEYS + CAMERA_KEYS}
+        except KeyError:
             return
-        if rn <= 0 or ge <= 0:
+        if params["rn"] <= 0 or params["ge"] <= 0:
             return
 
+        # Only the nodes depending on the edited keys are recomputed (or replayed from the cache)
+        dirty = self._graph.update(params, self._results_cache)
+        if repaint_all:
+            dirty = set(self._graph.nodes)
+        self._results = self._graph.values
+        self._show_results(self._results, dirty)
+
+        # Charts
+        if "charts" in dirty:
+            self._charts_dirty = True
+            if self.tabs.currentIndex() == 4:
+                QTimer.singleShot(80, self._draw_charts)
+
+        # Tables
+        if "tables" in dirty:
+            self._tables_dirty = True
+            if self.tabs.currentIndex() == 5:
+                self._update_tables()
+
+        self._auto_save()
+
+    def _show_results(self, res, nodes):
+        """Write the given nodes of a result bundle into the result labels."""
+        lbl = self._result_labels
+
         # NB3 auto
-        if "nb3_val" in self._result_labels:
-            self._result_labels["nb3_val"].setText(f"{self.sky_NB3:.4f}")
+        if "nb3" in nodes and "nb3_val" in lbl:
+            lbl["nb3_val"].setText(f"{res['nb3']:.4f}")
 
         # Swamp Factor medians
-        for key, sf_val in [("median_sf3", 3), ("median_sfn", sf), ("median_sf10", 10)]:
-            if key in self._result_labels:
-                self._result_labels[key].setText(str(target_median(sf_val, rn, ge, off, bits)))
+        for key, med in zip(("median_sf3", "median_sfn", "median_sf10"), res["medians"] if "medians" in nodes else ()):
+            if key in lbl:
+                lbl[key].setText(str(med))
+        if "medians" in nodes:
+            self._fits_model.set_targets(res["medians"][0], res["medians"][2])
+            if self._watcher is not None:
+                self._watcher.set_targets(res["medians"][0], res["medians"][2])
+            self._update_fits_summary()
 
         # C factor & optimal times
-        cf = c_factor(npct)
-        if "c_factor" in self._result_labels:
-            self._result_labels["c_factor"].setText(f"{cf:.1f}" if cf < 1e6 else "inf")
-        for fn, sk in FILTERS:
-            t = optimal_time(cf, rn, self._sky(sk))
+        cf = res["c_factor"]
+        if "c_factor" in nodes and "c_factor" in lbl:
+            lbl["c_factor"].setText(f"{cf:.1f}" if cf < 1e6 else "inf")
+        for (fn, _), t in zip(FILTERS, res["optimal"] if "optimal" in nodes else ()):
             sec_key = f"opti_sec_{fn}"
             mmss_key = f"opti_mmss_{fn}"
-            if sec_key in self._result_labels:
+            if sec_key in lbl:
                 if t == float("inf"):
-                    self._result_labels[sec_key].setText("inf")
-                    self._result_labels[mmss_key].setText("--")
+                    lbl[sec_key].setText("inf")
+                    lbl[mmss_key].setText("--")
                 else:
-                    self._result_labels[sec_key].setText(f"{t} s")
-                    self._result_labels[mmss_key].setText(sec_to_mmss(t))
+                    lbl[sec_key].setText(f"{t} s")
+                    lbl[mmss_key].setText(sec_to_mmss(t))
+
+        # Dark-current-aware optimal times and stacked SNR
+        for (fn, _), t in zip(FILTERS, res["optimal_dc"] if "optimal_dc" in nodes else ()):
+            key = f"opti_dc_{fn}"
+            if key in lbl:
+                lbl[key].setText("inf" if t == float("inf") else f"{t} s")
+        if "snr" in nodes:
+            snr = res["snr"]
+            for f, (fn, _) in enumerate(FILTERS):
+                if f"snr_{fn}" in lbl:
+                    n = snr["n"][0][f]
+                    lbl[f"snr_n_{fn}"].setText(str(n) if n else "--")
+                    lbl[f"snr_{fn}"].setText(f"{snr['snr'][0][f]:.1f}" if n else "--")
+                    lbl[f"snr_eff_{fn}"].setText(f"{snr['eff'][0][f] * 100:.1f} %" if n else "--")
+                if f"gain_snr_{fn}" in lbl:
+                    n = snr["n"][1][f]
+                    lbl[f"gain_snr_{fn}"].setText(
+                        f"{self._t('col_snr')} {snr['snr'][1][f]:.1f}  ({n} x, {snr['eff'][1][f] * 100:.1f} %)" if n else "--")
+
+        # Session plan
+        if "plan" in nodes and "plan_total" in lbl:
+            plan = res["plan"]
+            for f, (fn, _) in enumerate(FILTERS):
+                ok = plan["feasible"][f] and plan["n"][f] > 0
+                lbl[f"plan_sub_{fn}"].setText(f"{plan['subs'][f]} s" if plan["feasible"][f] else "--")
+                lbl[f"plan_n_{fn}"].setText(str(plan["n"][f]) if ok else "--")
+                lbl[f"plan_time_{fn}"].setText(self._fmt_hm(plan["seconds"][f]) if ok else "--")
+                lbl[f"plan_snr_{fn}"].setText(f"{plan['snr'][f]:.1f}" if ok else "--")
+            lbl["plan_total"].setText(self._t("plan_total").format(used=self._fmt_hm(plan["used"]),
+                                                                   budget=self._fmt_hm(plan["budget"])))
+
+        # Whole camera database for tonight's sky
+        if "fastest" in nodes and "fastest_cams" in lbl and res.get("fastest"):
+            top = [r for r in res["fastest"] if r[0] != float("inf")]
+            lbl["fastest_cams"].setText(
+                self._t("fastest_cams") + "  " + "  |  ".join(
+                    f"{m} ({g}{'' if temp != temp else f', {temp:+.0f} C'}) {int(t)} s" for t, _, m, g, temp in top))
+
+        # Selected camera: best gain and warmest cooling setpoint per filter
+        if "cam_best_gain" in nodes and "cam_best_gain" in lbl:
+            best = res["cam_best_gain"]
+            if best is None:
+                lbl["cam_best_gain"].setText(f"{self._t('cam_best_gain')}  --")
+            elif best["gain"] is None:
+                lbl["cam_best_gain"].setText(f"{self._t('cam_best_gain')}  {self._t('cam_no_gain')}")
+            else:
+                times = "  |  ".join(f"{fn} {'inf' if t == float('inf') else f'{int(t)} s'}"
+                                     for (fn, _), t in zip(FILTERS, best["times_best"]))
+                lbl["cam_best_gain"].setText(
+                    f"{self._t('cam_best_gain')}  {best['gain']:.0f}  (RN {best['rn_best']:.2f} e-, "
+                    f"{best['ge_best']:.3g} e-/ADU, {best['dr_best']:.1f} stops)   {times}")
+        if "cam_setpoint" in nodes and "cam_setpoint" in lbl:
+            parts = []
+            for (fn, _), t in zip(FILTERS, res["cam_setpoint"] or ()):
+                txt = "--" if t != t else (f">= {SETPOINT_MAX:+.0f}" if t >= SETPOINT_MAX else f"{t:+.1f}")
+                parts.append(f"{fn} {txt} C")
+            lbl["cam_setpoint"].setText(self._t("cam_setpoint") + "  " + ("  |  ".join(parts) or "--"))
 
         # Additional noise for given exposure
-        exp_key_map = {"L": "exp_L", "RGB": "exp_RGB", "NB 12 nm": "exp_NB12", "NB 7 nm": "exp_NB7", "NB 3 nm": "exp_NB3"}
-        for fn, sk in FILTERS:
+        for (fn, _), n in zip(FILTERS, res["gain_noise"] if "gain_noise" in nodes else ()):
             key = f"gain_noise_{fn}"
-            if key in self._result_labels:
-                try:
-                    n = additional_noise(self._vals[exp_key_map[fn]], self._sky(sk), rn)
-                    self._result_labels[key].setText(f"{n * 100:.2f} %")
-                except Exception:
-                    pass
+            if key in lbl:
+                lbl[key].setText(f"{n * 100:.2f} %")
 
         # Comparison
-        try:
-            sL = self._sky("sky_L")
-            sR = self._sky("sky_RGB")
-            n1 = additional_noise(self._vals["cL1"], sL, rn)
-            n2 = additional_noise(self._vals["cL2"], sL, rn)
-            if "ndL1" in self._result_labels:
-                self._result_labels["ndL1"].setText(f"{n1 * 100:.3f}%")
-            if "ndL2" in self._result_labels:
-                self._result_labels["ndL2"].setText(f"{n2 * 100:.3f}%")
-            if "dL" in self._result_labels:
-                self._result_labels["dL"].setText(f"{(n2 - n1) * 100:+.4f}%")
-            n1 = additional_noise(self._vals["cR1"], sR, rn)
-            n2 = additional_noise(self._vals["cR2"], sR, rn)
-            if "ndR1" in self._result_labels:
-                self._result_labels["ndR1"].setText(f"{n1 * 100:.3f}%")
-            if "ndR2" in self._result_labels:
-                self._result_labels["ndR2"].setText(f"{n2 * 100:.3f}%")
-            if "dR" in self._result_labels:
-                self._result_labels["dR"].setText(f"{(n2 - n1) * 100:+.4f}%")
-        except Exception:
-            pass
-
-        # Charts
-        self._charts_dirty = True
-        if self.tabs.currentIndex() == 4:
-            QTimer.singleShot(80, self._draw_charts)
-
-        # Tables
-        try:
-            self._update_tables()
-        except Exception:
-            pass
-
-        self._auto_save()
+        cmp = res["compare"] if "compare" in nodes else []
+        for (k1, k2, kd), (n1, n2) in zip([("ndL1", "ndL2", "dL"), ("ndR1", "ndR2", "dR")], [cmp[:2], cmp[2:]] if cmp else ()):
+            if k1 in lbl:
+                lbl[k1].setText(f"{n1 * 100:.3f}%")
+            if k2 in lbl:
+                lbl[k2].setText(f"{n2 * 100:.3f}%")
+            if kd in lbl:
+                lbl[kd].setText(f"{(n2 - n1) * 100:+.4f}%")
+
+    @staticmethod
+    def _fmt_hm(seconds):
+        m = int(round(seconds / 60))
+        return f"{m // 60} h {m % 60:02d}"
 
     def _on_tab_changed(self, idx):
+        self._ensure_tab(idx)
         if idx == 4 and self._charts_dirty:
             QTimer.singleShot(80, self._draw_charts)
+        elif idx == 5 and self._tables_dirty and self._results is not None:
+            self._update_tables()
 
     def _toggle_lang(self):
         self.lang = "en" if self.lang == "fr" else "fr"
-        # Rebuild UI by recreating window content
-        central = self.centralWidget()
-        if central:
-            central.setParent(None)
-            central.deleteLater()
-        self._result_labels = {}
-        self._input_fields = {}
-        self._combo_refs = {}
-        self._charts_dirty = True
-        self._chart_fig = None
-        self._build_ui()
-        self._recalc()
+        self._retranslate()
+        self._auto_save()
+
+    def _retranslate(self):
+        """Retext every registered widget in place; tabs, inputs, results and charts are kept."""
+        for setter, key, fmt in self._i18n:
+            text = self._t(key)
+            setter(fmt(text) if callable(fmt) else fmt.format(text))
+        if self._watch_btn is not None:
+            self._watch_btn.setText(self._t("btn_watch_stop" if self._watcher is not None else "btn_watch"))
+        if self._profile_combo.count():
+            self._profile_combo.setItemText(0, self._t("profile_none"))
+        self._refresh_profiles()
+        # Texts composed with the results (plan total, best gain, ...) and the FITS summary
+        if self._results is not None:
+            self._show_results(self._results, set(self._graph.nodes))
+        self._update_fits_summary()
+        # The chart titles and axis labels follow self.lang on their next draw (see _draw_charts)
+        if self._chart_fig is not None:
+            self._charts_dirty = True
+            if self.tabs.currentIndex() == 4:
+                QTimer.singleShot(80, self._draw_charts)
 
     def _export(self):
         try:
@@ -1345,7 +2120,10 @@ class ExposureCalculatorWindow(QMainWindow):
             bits = self._vals["bits"]
             off = self._vals["offset"]
             npct = self._vals["noise_pct"]
-            cf = c_factor(npct)
+            res = self._results
+            if res is None:
+                return
+            cf = res["c_factor"]
             data = {
                 "settings": dict(self._vals),
                 "parameters": {
@@ -1356,12 +2134,24 @@ class ExposureCalculatorWindow(QMainWindow):
                 },
                 "approach1": {
                     "sf": self._vals["sf"],
-                    "median_SF3": target_median(3, rn, ge, off, bits),
-                    "median_SF10": target_median(10, rn, ge, off, bits),
+                    "median_SF3": res["medians"][0],
+                    "median_SF10": res["medians"][2],
                 },
                 "approach2": {
                     "noise_pct": npct, "c_factor": cf,
-                    "times": {fn: optimal_time(cf, rn, self._sky(sk)) for fn, sk in FILTERS},
+                    "times": {fn: t for (fn, _), t in zip(FILTERS, res["optimal"])},
+                    "times_with_dc": {fn: t for (fn, _), t in zip(FILTERS, res["optimal_dc"])},
+                },
+                "session_plan": dict(res["plan"], mode=PLAN_MODES[int(self._vals["plan_mode"]) % len(PLAN_MODES)],
+                                     weights={fn: self._vals["w_" + sk[4:]] for fn, sk in FILTERS},
+                                     overhead=self._vals["overhead"]),
+                "stacked_snr": {
+                    "hours": self._vals["hours"], "signal": self._vals["signal"],
+                    "at_optimal_dc": {fn: {"subs": res["snr"]["n"][0][f], "snr": res["snr"]["snr"][0][f],
+                                           "efficiency": res["snr"]["eff"][0][f]} for f, (fn, _) in enumerate(FILTERS)},
+                    "at_exposure": {fn: {"exposure": self._vals[EXP_KEYS[fn]], "subs": res["snr"]["n"][1][f],
+                                         "snr": res["snr"]["snr"][1][f], "efficiency": res["snr"]["eff"][1][f]}
+                                    for f, (fn, _) in enumerate(FILTERS)},
                 },
             }
             path, _ = QFileDialog.getSaveFileName(self, "Export", "exposure_results.json", "JSON (*.json)")
@@ -1374,6 +2164,306 @@ class ExposureCalculatorWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
 
+    def _analyze_fits_folder(self):
+        path = QFileDialog.getExistingDirectory(self, self._t("btn_fits"))
+        if not path:
+            return
+        from exposure_engine.fits import find_fits, scan_directory
+        n = len(find_fits(path))
+        lbl = self._result_labels["fits_summary"]
+        if not n:
+            lbl.setText(self._t("fits_none"))
+            return
+        lbl.setText(self._t("fits_running").format(n=n))
+        self._fits_btn.setEnabled(False)
+
+        def _worker():
+            t0 = time.perf_counter()
+            try:
+                res = scan_directory(path)
+            except Exception:
+                _log_error()
+                res = []
+            self.fits_scanned.emit(res, time.perf_counter() - t0)
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _on_fits_scanned(self, results, seconds):
+        self._fits_scan_time = seconds
+        self._fits_model.set_rows(results)
+        if self._results:
+            self._fits_model.set_targets(self._results["medians"][0], self._results["medians"][2])
+        if self._fits_view is not None:
+            self._fits_btn.setEnabled(True)
+            self._fits_view.setVisible(bool(results))
+        self._update_fits_summary()
+
+    def _toggle_watch(self):
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
+            self._watch_btn.setText(self._t("btn_watch"))
+            return
+        path = QFileDialog.getExistingDirectory(self, self._t("btn_watch"))
+        if not path:
+            return
+        from exposure_engine.watch import FolderWatcher
+        med = self._results["medians"] if self._results else (None, None, None)
+        self._watcher = FolderWatcher(path, on_result=self.fits_frame.emit, median_sf3=med[0], median_sf10=med[2])
+        self._watcher.start()
+        self._fits_model.set_rows([])
+        self._watch_btn.setText(self._t("btn_watch_stop"))
+        self._update_fits_summary()
+
+    def _on_fits_frame(self, res):
+        if self._watcher is None:
+            return
+        self._fits_model.append_row(res, self._watcher.history_size)
+        if "fits_alert" in self._result_labels and not res.get("error"):
+            self._fits_last = res
+            color = {"ok": CL["green"], "low": CL["accent"], "high": CL["red"]}.get(res.get("status"), CL["dim"])
+            lbl = self._result_labels["fits_alert"]
+            lbl.setText(self._watch_last_text(self._t("watch_last")))
+            lbl.setStyleSheet(f"color: {color}; font-size: 11pt; font-weight: bold;")
+        if self._fits_view is not None:
+            self._fits_view.show()
+            self._fits_view.scrollToBottom()
+        self._update_fits_summary()
+
+    def _watch_last_text(self, text):
+        """fits_alert text for the last sub measured by the folder watcher ("" before the first one)."""
+        res = self._fits_last
+        if res is None:
+            return ""
+        status = res.get("status")
+        return text.format(name=res["name"], med=res["sky_median"], status=self._t(f"fits_{status}") if status else "--")
+
+    def _update_fits_summary(self):
+        if "fits_summary" not in self._result_labels:
+            return
+        if self._watcher is not None:
+            st = self._watcher.stats()
+            self._result_labels["fits_summary"].setText(self._t("watch_status").format(
+                dir=os.path.basename(self._watcher.directory) or self._watcher.directory,
+                backend=st["backend"], n=st["analyzed"], **{k: st[k] for k in ("low", "ok", "high")}))
+            return
+        rows = self._fits_model.rows()
+        if not rows:
+            return
+        counts = {k: sum(1 for r in rows if r.get("status") == k) for k in ("low", "ok", "high")}
+        skies = sorted(r["sky_median"] for r in rows if r.get("sky_median") is not None)
+        med = f"{skies[len(skies) // 2]:.0f}" if skies else "--"
+        self._result_labels["fits_summary"].setText(self._t("fits_summary").format(
+            n=len(rows), s=getattr(self, "_fits_scan_time", 0.0), med=med, **counts))
+
+    # Profiles
+    def _profile_store(self, create=False):
+        """Shared ProfileStore, opened on first use (None if there is no file yet and create is False)."""
+        if self._profiles is None and (create or _PROFILES_PATH.exists()):
+            from exposure_engine.profiles import ProfileStore
+            try:
+                self._profiles = ProfileStore(_PROFILES_PATH)
+            except Exception as e:
+                _log_error()
+                QMessageBox.critical(self, self._t("lbl_profile"), self._t("profile_err").format(err=e))
+        return self._profiles
+
+    def _refresh_profiles(self):
+        """Re-read the profile list on a worker thread (the store may sit on a busy network share).
+
+        The worker opens its own short-lived connection: the GUI's store may be
+        inside a save transaction at the same time.
+        """
+        self._profiles_req += 1
+        req = self._profiles_req
+
+        def _worker():
+            rows = []
+            try:
+                if _PROFILES_PATH.exists():
+                    from exposure_engine.profiles import ProfileStore
+                    st = ProfileStore(_PROFILES_PATH)
+                    try:
+                        rows = st.list()
+                    finally:
+                        st.close()
+            except Exception:
+                _log_error()
+                rows = None
+            self.profiles_listed.emit(rows, req)
+
+        threading.Thread(target=_worker, daemon=True).start()
+
+    def _on_profiles_listed(self, rows, req):
+        if req != self._profiles_req:
+            return                  # a newer refresh is on its way
+        cb = self._profile_combo
+        if rows is None:
+            if cb.count():
+                return              # read failed: keep the last known list
+            rows = []
+        cb.blockSignals(True)
+        cb.clear()
+        cb.addItem(self._t("profile_none"), "")
+        for r in rows:
+            if r["name"] == self._vals["profile"] and self._profile_rev is None:
+                self._profile_rev = r["revision"]       # profile restored from the last session
+            meta = " · ".join(x for x in (r["rig"], r["site"]) if x)
+            cb.addItem(f"{r['name']}  ({meta})" if meta else r["name"], r["name"])
+        cb.setCurrentIndex(max(0, cb.findData(self._vals["profile"])))
+        cb.blockSignals(False)
+
+    def _profile_settings(self):
+        return {k: v for k, v in self._vals.items() if k != "profile"}
+
+    def _load_profile(self, name):
+        if not name:
+            self._vals["profile"] = ""
+            self._profile_rev = None
+            self._auto_save()
+            return
+        store = self._profile_store()
+        try:
+            p = store.load(name) if store else None
+        except Exception:
+            _log_error()
+            p = None
+        if p is None:
+            self._refresh_profiles()
+            return
+        for k, v in p["settings"].items():
+            if k in self._vals and k != "profile":
+                try:
+                    self._vals[k] = type(self._vals[k])(v)
+                except (ValueError, TypeError):
+                    pass
+        self._vals["profile"] = name
+        self._profile_rev = p["revision"]
+        self._sync_widgets()
+        # Cached results of these exact settings: shown without recomputing
+        if p["results"] is not None:
+            key, bundle = p["results"]
+            try:
+                params = {k: self._vals[k] for k in RESULT_KEYS + CAMERA_KEYS}
+                if key == ResultCache.key(params) and all(n in bundle for n, _, _, f in RESULT_NODES if f is not None):
+                    self._results_cache.put(key, bundle)
+            except (KeyError, ValueError, TypeError):
+                pass
+        self._recalc()
+
+    def _sync_widgets(self):
+        """Show the current _vals in the input fields and combo boxes (after a profile load)."""
+        for k, field in self._input_fields.items():
+            field.blockSignals(True)
+            field.setText(str(self._vals.get(k, "")))
+            field.blockSignals(False)
+        refs = self._combo_refs
+        if "plan_mode" in refs:
+            refs["plan_mode"].blockSignals(True)
+            refs["plan_mode"].setCurrentIndex(int(self._vals["plan_mode"]) % 2)
+            refs["plan_mode"].blockSignals(False)
+        if "brand" in refs:
+            # The brand / model handlers reset the gain and temperature: restore them afterwards
+            model, gain, temp = self._vals["model"], self._vals["gain_setting"], self._vals["temp_setting"]
+            idx = refs["brand"].findText(self._vals["brand"])
+            if idx >= 0:
+                refs["brand"].setCurrentIndex(idx)
+            idx = refs["model"].findText(model)
+            if idx >= 0:
+                refs["model"].setCurrentIndex(idx)
+            for vk, text in (("gain_setting", gain), ("temp_setting", temp)):
+                refs[vk].blockSignals(True)
+                refs[vk].setCurrentText(text)
+                refs[vk].blockSignals(False)
+                self._vals[vk] = text
+        self._refresh_profiles()
+
+    def _write_profile(self, name, rig=None, site=None, expected=None):
+        """Save the current settings and results under `name`; False if cancelled or failed."""
+        store = self._profile_store(create=True)
+        if store is None:
+            return False
+        from exposure_engine.profiles import ProfileConflict, encode_results
+        results = None
+        if self._results is not None:
+            try:
+                results = encode_results(self._results, ResultCache.key({k: self._vals[k] for k in RESULT_KEYS + CAMERA_KEYS}))
+            except (KeyError, ValueError, TypeError):
+                results = None
+        try:
+            try:
+                rev = store.save(name, self._profile_settings(), rig=rig, site=site,
+                                 camera=self._vals["model"], results=results, expected_revision=expected)
+            except ProfileConflict:
+                host = (store.load(name) or {}).get("host", "?")
+                ans = QMessageBox.question(self, self._t("lbl_profile"),
+                                           self._t("profile_conflict").format(name=name, host=host))
+                if ans != QMessageBox.StandardButton.Yes:
+                    return False
+                rev = store.save(name, self._profile_settings(), rig=rig, site=site,
+                                 camera=self._vals["model"], results=results)
+        except Exception as e:
+            _log_error()
+            QMessageBox.critical(self, self._t("lbl_profile"), self._t("profile_err").format(err=e))
+            return False
+        self._vals["profile"] = name
+        self._profile_rev = rev
+        self._refresh_profiles()
+        self._auto_save()
+        return True
+
+    def _save_profile(self):
+        name = self._vals["profile"]
+        if not name:
+            self._save_profile_as()
+            return
+        # Saving over a profile someone else changed meanwhile asks first
+        self._write_profile(name, expected=self._profile_rev)
+
+    def _save_profile_as(self):
+        store = self._profile_store()
+        current = store.load(self._vals["profile"]) if store and self._vals["profile"] else None
+        dlg = QDialog(self)
+        dlg.setWindowTitle(self._t("btn_profile_save_as"))
+        form = QFormLayout(dlg)
+        fields = {}
+        for key, val in (("name", self._vals["profile"]), ("rig", current["rig"] if current else ""),
+                         ("site", current["site"] if current else "")):
+            fields[key] = QLineEdit(val)
+            fields[key].setMinimumWidth(250)
+            form.addRow(self._t("profile_" + key), fields[key])
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(dlg.accept)
+        buttons.rejected.connect(dlg.reject)
+        form.addRow(buttons)
+        if dlg.exec() != QDialog.DialogCode.Accepted:
+            return
+        name = fields["name"].text().strip()
+        if not name:
+            return
+        # A new name must not exist yet (0); the current one must not have changed elsewhere
+        expected = self._profile_rev if name == self._vals["profile"] else 0
+        self._write_profile(name, fields["rig"].text().strip(), fields["site"].text().strip(), expected)
+
+    def _delete_profile(self):
+        name = self._vals["profile"]
+        store = self._profile_store()
+        if not name or store is None:
+            return
+        if QMessageBox.question(self, self._t("lbl_profile"),
+                                self._t("profile_delete_q").format(name=name)) != QMessageBox.StandardButton.Yes:
+            return
+        try:
+            store.delete(name)
+        except Exception as e:
+            _log_error()
+            QMessageBox.critical(self, self._t("lbl_profile"), self._t("profile_err").format(err=e))
+            return
+        self._vals["profile"] = ""
+        self._profile_rev = None
+        self._refresh_profiles()
+        self._auto_save()
+
     def _import_settings(self):
         try:
             path, _ = QFileDialog.getOpenFileName(self, "Import", "", "JSON (*.json);;All (*.*)")
@@ -1420,6 +2510,18 @@ class ExposureCalculatorWindow(QMainWindow):
             f"- OS: {platform.system()} ({platform.machine()})\n"
             f"- Python: {sys.version.split()[0]}\n"
         )
+        ws = _SETTINGS_WRITER.stats()
+        if ws["submitted"]:
+            env_info += (f"- Settings writes: {ws['written']} written, {ws['skipped']} unchanged, "
+                         f"{ws['coalesced']} coalesced, {ws['errors']} failed | "
+                         f"latency mean {ws['mean_ms']:.0f} / max {ws['max_ms']:.0f} ms\n")
+        us = _load_update_state()
+        if "check_ms" in us:
+            last = f"{us['check_ms']:.0f} ms" + (f", git pull {us['pull_ms']:.0f} ms" if "pull_ms" in us else "")
+            if us.get("status") == "skipped":
+                env_info += f"- Update check: skipped (interval), last check {last}\n"
+            else:
+                env_info += f"- Update check: {us.get('status', '?')}, {last}\n"
         title = quote(f"[Bug] v{__version__} - ")
         body = quote(
             f"## Environment\n{env_info}\n"
@@ -1430,26 +2532,89 @@ class ExposureCalculatorWindow(QMainWindow):
         QDesktopServices.openUrl(QUrl(f"{_REPO_URL}/issues/new?title={title}&body={body}"))
 
 
+def _load_update_state():
+    try:
+        data = json.loads(_UPDATE_STATE_PATH.read_text(encoding="utf-8"))
+        if isinstance(data, dict) and data.get("url") == _UPDATE_URL:
+            return data
+    except Exception:
+        pass
+    return {"url": _UPDATE_URL}     # validators of another URL do not apply
+
+def _save_update_state(state):
+    try:
+        _UPDATE_STATE_PATH.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    except Exception:
+        pass
+
+def _fetch_remote_version(state):
+    """Remote __version__ through a conditional request; updates the validators and status in `state`."""
+    from urllib.error import HTTPError
+    from urllib.request import urlopen, Request
+    headers = {"User-Agent": "ExposureCalculator"}
+    cached = state.get("remote_version")
+    if cached:
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+    kwargs = {}
+    if _UPDATE_URL.startswith("https:"):
+        import ssl
+        kwargs["context"] = ssl.create_default_context()
+    try:
+        resp = urlopen(Request(_UPDATE_URL, headers=headers), timeout=10, **kwargs)
+    except HTTPError as e:
+        if e.code == 304 and cached:
+            state["status"] = "not modified"
+            return cached
+        raise
+    with resp:
+        etag, modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+        # file:// and servers ignoring the conditional headers: compare the validators here
+        if cached and (etag or modified) and (etag, modified) == (state.get("etag"), state.get("last_modified")):
+            state["status"] = "not modified"
+            return cached
+        data = resp.read(2048).decode("utf-8", errors="ignore")
+    remote_ver = None
+    for line in data.splitlines():
+        if line.startswith("__version__"):
+            remote_ver = line.split("=")[1].strip().strip('"').strip("'")
+            break
+    if not remote_ver or not re.fullmatch(r"\d+\.\d+\.\d+", remote_ver):
+        state["status"] = "no version"
+        return None
+    state.update(etag=etag, last_modified=modified, remote_version=remote_ver, status="fetched")
+    return remote_ver
+
 def _check_for_update(window, lang):
     def _worker():
+        state = _load_update_state()
         try:
-            import ssl
-            from urllib.request import urlopen, Request
-            ctx = ssl.create_default_context()
-            req = Request(_UPDATE_URL, headers={"User-Agent": "ExposureCalculator"})
-            data = urlopen(req, timeout=10, context=ctx).read(2048).decode("utf-8", errors="ignore")
-            remote_ver = None
-            for line in data.splitlines():
-                if line.startswith("__version__"):
-                    remote_ver = line.split("=")[1].strip().strip('"').strip("'")
-                    break
-            if not remote_ver or not re.fullmatch(r"\d+\.\d+\.\d+", remote_ver):
-                return
-            if _parse_version(remote_ver) <= _parse_version(__version__):
+            now = time.time()
+            start = time.perf_counter()
+            if _UPDATE_INTERVAL_H > 0 and now - state.get("checked", 0) < _UPDATE_INTERVAL_H * 3600:
+                # Checked recently: no request, the known remote version is reused and the
+                # timings of the last real check (and pull) are kept
+                remote_ver = state.get("remote_version")
+                state["status"] = "skipped"
+                state["skipped_at"] = now
+            else:
+                try:
+                    remote_ver = _fetch_remote_version(state)
+                    state["checked"] = now
+                except Exception as e:
+                    state["status"] = f"failed: {type(e).__name__}"     # retried on the next launch
+                    remote_ver = None
+                state["check_ms"] = round((time.perf_counter() - start) * 1000, 1)
+                state.pop("pull_ms", None)
+                state.pop("skipped_at", None)
+            if not remote_ver or _parse_version(remote_ver) <= _parse_version(__version__):
                 return
             has_git = os.path.isdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".git"))
             git_ok = False
             if has_git:
+                start = time.perf_counter()
                 try:
                     cwd = os.path.dirname(os.path.abspath(__file__))
                     subprocess.check_call(["git", "pull", "--ff-only", "origin", "main"],
@@ -1457,6 +2622,8 @@ def _check_for_update(window, lang):
                     git_ok = True
                 except Exception:
                     pass
+                state["pull_ms"] = round((time.perf_counter() - start) * 1000, 1)
+                state["pull_ok"] = git_ok
 
             def _notify():
                 title = tr("update_available", lang)
@@ -1469,6 +2636,8 @@ def _check_for_update(window, lang):
             QTimer.singleShot(0, _notify)
         except Exception:
             pass
+        finally:
+            _save_update_state(state)
 
     t = threading.Thread(target=_worker, daemon=True)
     t.start()
@@ -1494,6 +2663,7 @@ def main():
         import ctypes
         ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("benoit.exposurecalculator")
 
+    _PROFILER.mark("module init")
     app = QApplication(sys.argv)
     app.setApplicationName("ExposureCalculator")
     app.setApplicationVersion(__version__)
@@ -1504,38 +2674,43 @@ def main():
     else:
         app.setFont(QFont("Noto Sans", 10))
 
+    _PROFILER.mark("QApplication + style")
     window = ExposureCalculatorWindow()
     window.show()
+    _PROFILER.mark("window.show")
 
-    # Desktop shortcut on first launch
-    try:
-        from shortcut_helper import offer_shortcut
-        config_path = _APP_DIR / ".exposure_calc_config.json"
-
-        def _get_cfg(key):
-            try:
-                data = json.loads(config_path.read_text(encoding="utf-8"))
-                return data.get(key)
-            except Exception:
-                return None
+    # Desktop shortcut on first launch (not when profiling: its modal dialog would hold the run)
+    if not _PROFILER.enabled:
+        try:
+            from shortcut_helper import offer_shortcut
+            config_path = _APP_DIR / ".exposure_calc_config.json"
 
-        def _set_cfg(key, value):
-            try:
-                data = {}
-                if config_path.exists():
+            def _get_cfg(key):
+                try:
                     data = json.loads(config_path.read_text(encoding="utf-8"))
-                data[key] = value
-                config_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-            except Exception:
-                pass
+                    return data.get(key)
+                except Exception:
+                    return None
 
-        offer_shortcut("ExposureCalculator", "ExposureCalculator.py", "logo-expo.ico",
-                       get_config=_get_cfg, set_config=_set_cfg)
-    except Exception:
-        pass
+            def _set_cfg(key, value):
+                try:
+                    data = {}
+                    if config_path.exists():
+                        data = json.loads(config_path.read_text(encoding="utf-8"))
+                    data[key] = value
+                    config_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+                except Exception:
+                    pass
+
+            offer_shortcut("ExposureCalculator", "ExposureCalculator.py", "logo-expo.ico",
+                           get_config=_get_cfg, set_config=_set_cfg)
+        except Exception:
+            pass
+    _PROFILER.mark("offer_shortcut")
 
     # Check for updates in background
     _check_for_update(window, window.lang)
+    _PROFILER.mark("update check thread start")
 
     sys.exit(app.exec())
 
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Headless calculation core of the Exposure Calculator.
+
+Pure stdlib at import time (NumPy is loaded on the first grid call), no Qt,
+no matplotlib, no pip probes and no global hooks — safe to import from
+automation workers:
+
+    from exposure_engine import c_factor, optimal_time, CAMERA_DB
+
+The camera database (which may read an external file) and the exports backed
+by heavier stdlib modules (camera file compiler, profile store, folder watcher) are loaded on
+first access, through the module __getattr__ below.
+"""
+
+import importlib
+
+from .core import (
+    TIMES_LRGB, TIMES_NB, FILTERS, EXP_KEYS, DEFAULT_PARAMS,
+    additional_noise, c_factor, optimal_time, target_median,
+    additional_noise_grid, optimal_time_grid, target_median_grid, noise_grid,
+    sec_to_mmss,
+)
+from .sensors import SENSORS, build_camera_db, find_camera
+from .darkcurrent import DarkCurrentModel, dark_model, warmest_setpoint
+from .gaincurve import GainCurve, gain_curve, optimal_gain, parse_gain
+from .camera_index import CameraIndex, camera_index
+from .matrix import ExposureMatrix
+from .results import RESULT_KEYS, CAMERA_KEYS, RESULT_NODES, SETPOINT_MAX, ResultCache, ResultGraph, compute_results, filter_skies
+from .curves import CurveSampler, decimate
+from .snr import sub_noise_grid, additional_noise_dc_grid, optimal_time_dc_grid, stack_snr_grid
+from .planner import PLAN_MODES, plan_session
+from .fits import FITS_EXTENSIONS, classify_median, measure_file, scan_directory
+
+__all__ = [
+    "TIMES_LRGB", "TIMES_NB", "FILTERS", "EXP_KEYS", "DEFAULT_PARAMS",
+    "additional_noise", "c_factor", "optimal_time", "target_median",
+    "additional_noise_grid", "optimal_time_grid", "target_median_grid", "noise_grid",
+    "sec_to_mmss",
+    "SENSORS", "CAMERA_DB", "CAMERA_DB_COUNTS", "build_camera_db", "find_camera",
+    "CAMERA_DB_INFO", "CompiledCameraDB", "compile_index", "load_camera_db", "read_source",
+    "DarkCurrentModel", "dark_model", "warmest_setpoint",
+    "GainCurve", "gain_curve", "optimal_gain", "parse_gain",
+    "CameraIndex", "camera_index",
+    "ExposureMatrix",
+    "RESULT_KEYS", "CAMERA_KEYS", "RESULT_NODES", "SETPOINT_MAX", "ResultCache", "ResultGraph", "compute_results", "filter_skies",
+    "CurveSampler", "decimate",
+    "sub_noise_grid", "additional_noise_dc_grid", "optimal_time_dc_grid", "stack_snr_grid",
+    "PLAN_MODES", "plan_session",
+    "FITS_EXTENSIONS", "classify_median", "measure_file", "scan_directory",
+    "FolderWatcher",
+    "ProfileConflict", "ProfileStore", "decode_results", "encode_results",
+]
+
+# name -> (submodule, attribute), imported on first access
+_LAZY = {
+    "CAMERA_DB": (".sensors", "CAMERA_DB"),
+    "CAMERA_DB_COUNTS": (".sensors", "CAMERA_DB_COUNTS"),
+    "CAMERA_DB_INFO": (".camera_store", "LOAD_INFO"),
+    **{name: (".camera_store", name) for name in ("CompiledCameraDB", "compile_index", "load_camera_db", "read_source")},
+    **{name: (".profiles", name) for name in ("ProfileConflict", "ProfileStore", "decode_results", "encode_results")},
+    "FolderWatcher": (".watch", "FolderWatcher"),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attr = _LAZY[name]
+    value = getattr(importlib.import_module(module, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
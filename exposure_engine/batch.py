@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+"""
+Streaming batch mode — runs the calculator over CSV / JSONL rows without the GUI.
+
+    python ExposureCalculator.py --batch nights.csv -o results.csv
+    cat rows.jsonl | python ExposureCalculator.py --batch - --format jsonl --workers 8
+    python -m exposure_engine.batch --batch nights.csv -o results.csv
+
+Each row gives the sensor either directly (rn, ge, bits, offset, dc) or through
+the camera database (camera, optional brand, gain preset, temp), and the sky
+levels either as sky_L / sky_RGB / sky_NB12 / sky_NB7 / sky_NB3 columns or as a
+filter + sky pair (NB3 defaults to NB12 / 4, as in the GUI). Any other numeric
+input missing from the row (sf, noise_pct, exp_*) falls back to DEFAULT_PARAMS.
+
+Input columns are passed through unchanged and the results of the GUI are
+appended: SF3 / SFn / SF10 medians, C factor, optimal time per filter (without
+and with dark current), and the additional noise (%) and stacked SNR over
+`hours` of a `signal` target at the exp_* exposures. Rows are chunked over a process
+pool with a bounded number of chunks in flight, so memory stays flat and the
+output keeps the input order.
+"""
+
+import argparse, csv, json, math, os, sys, time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .core import (
+    FILTERS, EXP_KEYS, DEFAULT_PARAMS,
+    c_factor, additional_noise_grid, optimal_time_grid, target_median_grid,
+)
+from .darkcurrent import dark_model
+from .sensors import find_camera
+from .snr import optimal_time_dc_grid, stack_snr_grid
+
+_SUFFIXES = [sk[4:] for _, sk in FILTERS]  # L, RGB, NB12, NB7, NB3
+_SKY_KEYS = [sk for _, sk in FILTERS]
+_FILTER_ALIASES = {fn.replace(" ", "").replace("nm", "").upper(): sk for fn, sk in FILTERS}
+
+RESULT_FIELDS = (
+    ["rn", "ge", "bits", "offset", "dc", "sf", "noise_pct",
+     "median_sf3", "median_sfn", "median_sf10", "c_factor"]
+    + [f"opt_{s}" for s in _SUFFIXES]
+    + [f"noise_{s}" for s in _SUFFIXES]
+    + [f"opt_dc_{s}" for s in _SUFFIXES]
+    + [f"snr_{s}" for s in _SUFFIXES]
+    + ["error"]
+)
+
+
+def _num(v):
+    if v is None or isinstance(v, (int, float)):
+        return v
+    v = str(v).strip()
+    return float(v) if v else None
+
+
+def _match_gain(gains, wanted):
+    if not wanted:
+        return next(iter(gains.values()))
+    wanted = str(wanted).strip()
+    if wanted in gains:
+        return gains[wanted]
+    for name, g in gains.items():
+        parts = name.split()
+        if name.lower() == wanted.lower() or (len(parts) > 1 and parts[1] == wanted):
+            return g
+    raise ValueError(f"unknown gain preset {wanted!r}")
+
+
+def resolve_row(row):
+    """Turn one input row into the full numeric parameter set (floats, NaN for unknown skies)."""
+    p = {k: float(v) for k, v in DEFAULT_PARAMS.items()}
+    for sk in _SKY_KEYS:
+        p[sk] = float("nan")
+
+    cam_name = row.get("camera") or row.get("model")
+    if cam_name:
+        cam = find_camera(cam_name, row.get("brand"))
+        if cam is None:
+            raise ValueError(f"unknown camera {cam_name!r}")
+        g = _match_gain(cam["gains"], row.get("gain"))
+        p.update(rn=g["rn"], ge=g["ge"], offset=g.get("offset", 20), bits=cam["bits"])
+        temp = _num(row.get("temp"))
+        if temp is not None and cam["temps"]:
+            p["dc"] = dark_model(cam["temps"])(temp)
+
+    for k in p:
+        v = _num(row.get(k))
+        if v is not None:
+            p[k] = float(v)
+
+    flt, sky = row.get("filter"), _num(row.get("sky"))
+    if flt and sky is not None:
+        sk = _FILTER_ALIASES.get(str(flt).replace(" ", "").replace("nm", "").upper())
+        if sk is None:
+            raise ValueError(f"unknown filter {flt!r}")
+        p[sk] = float(sky)
+    if math.isnan(p["sky_NB3"]):
+        p["sky_NB3"] = p["sky_NB12"] / 4.0
+
+    if p["rn"] <= 0 or p["ge"] <= 0:
+        raise ValueError("rn and ge must be > 0")
+    return p
+
+
+def compute_chunk(rows):
+    """Compute the results of a list of rows in one vectorized pass."""
+    import numpy as np
+
+    params, errors = [], {}
+    for i, row in enumerate(rows):
+        if row.get("error"):
+            # Already rejected by read_rows (invalid JSON): no parameters to resolve
+            errors[i] = str(row["error"])
+            continue
+        try:
+            params.append(resolve_row(row))
+        except (ValueError, TypeError) as e:
+            errors[i] = str(e)
+    out = []
+    if params:
+        cols = {k: np.array([p[k] for p in params]) for k in params[0]}
+        rn = cols["rn"][:, None]
+        sfs = np.stack([np.full(len(params), 3.0), cols["sf"], np.full(len(params), 10.0)], axis=1)
+        meds = target_median_grid(sfs, rn, cols["ge"][:, None], cols["offset"][:, None], cols["bits"][:, None])
+        cf_cache = {v: c_factor(v) for v in set(cols["noise_pct"].tolist())}
+        cf = np.array([cf_cache[v] for v in cols["noise_pct"].tolist()])
+        skies = np.stack([cols[sk] for sk in _SKY_KEYS], axis=1)
+        exps = np.stack([cols[EXP_KEYS[fn]] for fn, _ in FILTERS], axis=1)
+        known = ~np.isnan(skies)
+        opt = optimal_time_grid(cf[:, None], rn, np.nan_to_num(skies))
+        noise = additional_noise_grid(exps, np.nan_to_num(skies), rn)
+        dc = cols["dc"][:, None]
+        opt_dc = optimal_time_dc_grid(cf[:, None], rn, np.nan_to_num(skies), dc)
+        snr = stack_snr_grid(exps, np.nan_to_num(skies), rn, dc, cols["signal"][:, None], cols["hours"][:, None] * 3600)[0]
+        for j, p in enumerate(params):
+            res = {k: p[k] for k in ("rn", "ge", "dc", "sf", "noise_pct")}
+            res.update(bits=int(p["bits"]), offset=p["offset"],
+                       median_sf3=int(meds[j, 0]), median_sfn=int(meds[j, 1]), median_sf10=int(meds[j, 2]),
+                       c_factor=float(cf[j]))
+            for f, s in enumerate(_SUFFIXES):
+                if known[j, f]:
+                    t = float(opt[j, f])
+                    res[f"opt_{s}"] = int(t) if t != float("inf") else t
+                    res[f"noise_{s}"] = round(float(noise[j, f]) * 100, 4)
+                    t = float(opt_dc[j, f])
+                    res[f"opt_dc_{s}"] = int(t) if t != float("inf") else t
+                    res[f"snr_{s}"] = round(float(snr[j, f]), 3)
+                else:
+                    res[f"opt_{s}"] = res[f"noise_{s}"] = res[f"opt_dc_{s}"] = res[f"snr_{s}"] = None
+            out.append(res)
+    results = iter(out)
+    return [dict(row, error=errors[i]) if i in errors else dict(row, **next(results))
+            for i, row in enumerate(rows)]
+
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_results(rows, workers=None, chunk_size=2000):
+    """Yield result rows in input order; at most 2 x workers chunks are held in memory."""
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(rows, chunk_size)
+    if workers <= 1:
+        for chunk in chunks:
+            yield from compute_chunk(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(compute_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def read_rows(stream, fmt):
+    if fmt == "csv":
+        yield from csv.DictReader(stream)
+        return
+    for n, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield row if isinstance(row, dict) else {"line": n, "error": "invalid JSON object"}
+
+
+class _Writer:
+    def __init__(self, stream, fmt, fields=RESULT_FIELDS):
+        self.stream = stream
+        self.fmt = fmt
+        self.fields = fields
+        self._csv = None
+
+    def write(self, row):
+        if self.fmt == "jsonl":
+            self.stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+            return
+        if self._csv is None:
+            fields = list(row.keys()) + [f for f in self.fields if f not in row]
+            self._csv = csv.DictWriter(self.stream, fieldnames=fields, restval="", extrasaction="ignore")
+            self._csv.writeheader()
+        self._csv.writerow(row)
+
+
+def _guess_format(path, default="csv"):
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    if ext == ".csv":
+        return "csv"
+    return default
+
+
+def run_batch(src, dst, in_fmt="csv", out_fmt=None, workers=None, chunk_size=2000, progress=None):
+    """Stream rows from src to dst; returns (rows, seconds)."""
+    writer = _Writer(dst, out_fmt or in_fmt)
+    start = last = time.perf_counter()
+    n = 0
+    for row in iter_results(read_rows(src, in_fmt), workers, chunk_size):
+        writer.write(row)
+        n += 1
+        if progress and n % 1000 == 0:
+            now = time.perf_counter()
+            if now - last >= 1.0:
+                last = now
+                progress(n, now - start)
+    dst.flush()
+    return n, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="ExposureCalculator.py --batch",
+                                     description="Run the exposure calculator over CSV/JSONL rows.")
+    parser.add_argument("--batch", metavar="INPUT", required=True, help="CSV or JSONL file, '-' for stdin")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="input format (default: from extension, else csv)")
+    parser.add_argument("--output-format", choices=("csv", "jsonl"), help="output format (default: same as input)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes (1 = no pool)")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="rows per worker task")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no throughput counter on stderr")
+    args = parser.parse_args(argv)
+
+    in_fmt = args.format or _guess_format(args.batch)
+    out_fmt = args.output_format or (_guess_format(args.output, in_fmt) if args.output != "-" else in_fmt)
+
+    def _progress(n, secs):
+        sys.stderr.write(f"\r[batch] {n} rows  {n / secs:,.0f} rows/s")
+        sys.stderr.flush()
+
+    src = sys.stdin if args.batch == "-" else open(args.batch, "r", newline="", encoding="utf-8")
+    dst = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        n, secs = run_batch(src, dst, in_fmt, out_fmt, max(1, args.workers), max(1, args.chunk_size),
+                            None if args.quiet else _progress)
+    except BrokenPipeError:
+        # Reader went away (e.g. `| head`): stop quietly, and keep the interpreter's final flush off the pipe
+        if dst is sys.stdout:
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+    if not args.quiet:
+        sys.stderr.write(f"\r[batch] {n} rows in {secs:.2f} s ({n / secs if secs > 0 else 0:,.0f} rows/s)\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
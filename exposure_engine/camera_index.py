@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+Query layer over CAMERA_DB with prebuilt secondary indexes.
+
+    idx = camera_index()
+    idx.query(sensor="IMX571")                          # every IMX571 camera
+    idx.query(bits=16, rn=(0, 1.5), brand="ZWO")        # some gain preset with RN <= 1.5 e-
+    idx.query(fw=(40000, None), dc_max=0.001, temp=-10)
+    idx.query(name="poseidon")                          # case-insensitive substring
+    idx.get("ASI2600MM Pro")                            # exact display key or bare model
+
+Results are entries like find_camera() returns: the CAMERA_DB record plus
+"brand" and "model" (display key), in brand then model order.
+
+Indexes, built once per database:
+    sensor, brand, bits     dict -> sorted tuple of camera ids
+    rn, fw                  one sorted array per quantity, one value per gain
+                            preset, searched with bisect (a camera matches
+                            when any of its presets is in the range)
+    dark current            per queried temperature, built on first use and
+                            kept: sorted (dc, id) pairs from the continuous
+                            model of each sensor (darkcurrent.py)
+    name                    trigram -> ids, candidates verified by substring
+Criteria are combined by intersecting id sets, smallest first.
+"""
+
+from bisect import bisect_left, bisect_right
+
+from .darkcurrent import dark_model
+from . import sensors
+
+
+def _range_ids(values, ids, lo, hi):
+    """Camera ids whose value falls in [lo, hi] (None = open end) in a sorted index."""
+    i = 0 if lo is None else bisect_left(values, lo)
+    j = len(values) if hi is None else bisect_right(values, hi)
+    return set(ids[i:j])
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class CameraIndex:
+    def __init__(self, camera_db=None):
+        self._db = camera_db if camera_db is not None else sensors.CAMERA_DB
+        self.entries = []
+        self._by_sensor, self._by_brand, self._by_bits, self._by_key = {}, {}, {}, {}
+        self._names = []
+        self._grams = {}
+        rn, fw = [], []
+        for brand, models in self._db.items():
+            for key, cam in models.items():
+                i = len(self.entries)
+                entry = dict(cam, brand=brand, model=key)
+                self.entries.append(entry)
+                self._by_sensor.setdefault(str(cam["sensor"]).upper(), []).append(i)
+                self._by_brand.setdefault(brand.lower(), []).append(i)
+                self._by_bits.setdefault(int(cam["bits"]), []).append(i)
+                name = key.lower()
+                self._names.append(name)
+                self._by_key.setdefault(name, []).append(i)
+                self._by_key.setdefault(key.split("  [")[0].lower(), []).append(i)
+                for g in _trigrams(name):
+                    self._grams.setdefault(g, []).append(i)
+                for g in cam["gains"].values():
+                    rn.append((g["rn"], i))
+                    if "fw" in g:
+                        fw.append((g["fw"], i))
+        for d in (self._by_sensor, self._by_brand, self._by_bits, self._by_key, self._grams):
+            for k in d:
+                d[k] = tuple(d[k])
+        self._rn = self._sorted(rn)
+        self._fw = self._sorted(fw)
+        self._dc = {}
+
+    @staticmethod
+    def _sorted(pairs):
+        pairs.sort()
+        return [v for v, _ in pairs], [i for _, i in pairs]
+
+    def __len__(self):
+        return len(self.entries)
+
+    # --- single lookups ---
+
+    def get(self, name, brand=None):
+        """Camera by display key ("ASI2600MM Pro  [IMX571]") or bare model name, case-insensitive."""
+        ids = self._by_key.get(str(name).strip().lower(), ())
+        if brand:
+            b = str(brand).strip().lower()
+            ids = [i for i in ids if self.entries[i]["brand"].lower() == b]
+        return self.entries[ids[0]] if ids else None
+
+    def sensors(self):
+        return sorted(self._by_sensor)
+
+    def dark_current(self, entry, temp):
+        """Dark current (e-/s/px) of a camera at `temp` (C), from its sensor's continuous model."""
+        return dark_model(entry["temps"])(temp) if entry["temps"] else None
+
+    # --- criteria -> id sets ---
+
+    def _dc_index(self, temp):
+        temp = float(temp)
+        if temp not in self._dc:
+            at_temp = {}        # one model evaluation per distinct sensor table
+            pairs = []
+            for i, e in enumerate(self.entries):
+                if e["temps"]:
+                    key = id(e["temps"])
+                    if key not in at_temp:
+                        at_temp[key] = self.dark_current(e, temp)
+                    pairs.append((at_temp[key], i))
+            self._dc[temp] = self._sorted(pairs)
+        return self._dc[temp]
+
+    def _name_ids(self, text):
+        text = str(text).strip().lower()
+        grams = _trigrams(text)
+        if grams:
+            lists = sorted((self._grams.get(g, ()) for g in grams), key=len)
+            cand = set(lists[0]).intersection(*lists[1:])
+        else:
+            cand = range(len(self.entries))
+        return {i for i in cand if text in self._names[i]}
+
+    def ids(self, sensor=None, brand=None, bits=None, rn=None, fw=None, dc_max=None, temp=None, name=None):
+        """Sorted camera ids matching every given criterion; see query()."""
+        sets = []
+        if sensor is not None:
+            sets.append(set(self._by_sensor.get(str(sensor).strip().upper(), ())))
+        if brand is not None:
+            sets.append(set(self._by_brand.get(str(brand).strip().lower(), ())))
+        if bits is not None:
+            sets.append(set(self._by_bits.get(int(bits), ())))
+        if rn is not None:
+            sets.append(_range_ids(*self._rn, *rn))
+        if fw is not None:
+            sets.append(_range_ids(*self._fw, *fw))
+        if dc_max is not None:
+            sets.append(_range_ids(*self._dc_index(0.0 if temp is None else temp), None, dc_max))
+        if name:
+            sets.append(self._name_ids(name))
+        if not sets:
+            return list(range(len(self.entries)))
+        sets.sort(key=len)
+        return sorted(sets[0].intersection(*sets[1:]))
+
+    def query(self, sensor=None, brand=None, bits=None, rn=None, fw=None, dc_max=None, temp=None, name=None):
+        """Cameras matching every given criterion (None = any).
+
+        rn / fw are (min, max) tuples, either end None for open, and match
+        when at least one gain preset is in range. dc_max filters on the dark
+        current at `temp` (C, default 0). name is a case-insensitive substring
+        of the display key.
+        """
+        return [self.entries[i] for i in self.ids(sensor, brand, bits, rn, fw, dc_max, temp, name)]
+
+
+_INDEX = None
+
+def camera_index():
+    """Shared index of the built-in CAMERA_DB, built on first use."""
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = CameraIndex()
+    return _INDEX
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+"""
+External camera database, compiled once into a memory-mapped binary index.
+
+The source is found in EXPOSURE_CALC_CAMERA_DB, else in cameras.json,
+cameras.sqlite or cameras.db next to the program. It may be:
+
+    JSON     the SENSORS layout of sensors.py, optionally under a "sensors" key:
+             {"IMX571": {"bits": 16, "gains": {"Gain 0": {"rn": 3.25, "ge": 0.75,
+              "offset": 40, "fw": 50000}}, "temps": {"0": 0.002, "-10": 0.00075},
+              "cameras": {"ZWO": ["ASI2600MM Pro"]}}}
+    SQLite   tables sensors(name, bits), gains(sensor, name, rn, ge, offset, fw),
+             temps(sensor, temp, dc), cameras(sensor, brand, model)
+
+A sensor of the source replaces the built-in sensor of the same name; every
+other built-in sensor stays, as the fallback layer. The merged set is written
+to <local data dir>/ExposureCalculator/cache/, next to the launcher's venv,
+as fixed-size little-endian records plus one string blob:
+
+    header   magic, counts, source mtime / size / SHA-256, built-in SHA-256
+    brands   name, first camera, camera count     (sorted, like CAMERA_DB)
+    cameras  display key, sensor                  (sorted by key per brand)
+    sensors  name, bits, gain range, temperature range
+    gains    name, rn, ge, offset, fw
+    temps    temperature, dark current
+
+Later launches map that file and decode records on access only: the brand
+list costs nothing, a brand's model keys are decoded when the brand is opened
+and a camera record when it is read. The cache is reused while the source
+mtime and size are unchanged. After a touch or a copy to another PC, it is
+also reused when the content hash still matches. Any change to the built-in
+table also triggers a rebuild.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from collections.abc import Mapping
+from pathlib import Path
+
+SOURCE_NAMES = ("cameras.json", "cameras.sqlite", "cameras.db")
+_MAGIC = b"ECAMDB01"
+_HEADER = struct.Struct("<8s6Iqq32s32s")     # magic, 6 counts, mtime_ns, size, source sha, built-in sha
+_BRAND = struct.Struct("<4I")                # name off/len, first camera, count
+_CAMERA = struct.Struct("<3I")               # key off/len, sensor
+_SENSOR = struct.Struct("<7I")               # name off/len, bits, gain first/count, temp first/count
+_GAIN = struct.Struct("<2I4d")               # name off/len, rn, ge, offset, fw (NaN if unknown)
+_TEMP = struct.Struct("<2d")                 # temperature (C), dark current (e-/s/px)
+
+# Outcome of the last load_camera_db() call (shown in the startup profile and the camera card)
+LOAD_INFO = {"source": None, "cache": None, "compiled": False, "error": None, "ms": 0.0}
+
+
+def external_db_path(app_dir=None):
+    """Path of the external camera file, or None."""
+    env = os.environ.get("EXPOSURE_CALC_CAMERA_DB")
+    if env:
+        return Path(env)
+    if app_dir is None:
+        app_dir = Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(__file__).resolve().parent.parent
+    for name in SOURCE_NAMES:
+        p = Path(app_dir) / name
+        if p.is_file():
+            return p
+    return None
+
+
+def cache_dir():
+    """Local (per PC) cache directory, next to the venv created by the launchers."""
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    else:
+        base = Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share")
+    return base / "ExposureCalculator" / "cache"
+
+
+# --- source files ---
+
+def _number(v):
+    v = float(v)
+    return int(v) if v.is_integer() else v
+
+
+def _normalize(sensors):
+    """Validated copy in the SENSORS layout; raises ValueError naming the faulty sensor."""
+    if not isinstance(sensors, dict):
+        raise ValueError("camera file: expected an object of sensors")
+    out = {}
+    for sn, s in sensors.items():
+        try:
+            gains = {str(gk): {"rn": float(g["rn"]), "ge": float(g["ge"]),
+                               "offset": _number(g.get("offset", 20)),
+                               **({"fw": _number(g["fw"])} if g.get("fw") is not None else {})}
+                     for gk, g in s["gains"].items()}
+            temps = {_number(t): float(dc) for t, dc in s.get("temps", {}).items()}
+            cameras = {str(b): [str(m) for m in models] for b, models in s["cameras"].items()}
+            out[str(sn)] = {"bits": int(s["bits"]), "gains": gains, "temps": temps, "cameras": cameras}
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            raise ValueError(f"camera file: invalid sensor {sn!r} ({e})") from None
+        if not gains:
+            raise ValueError(f"camera file: sensor {sn!r} has no gain preset")
+    return out
+
+
+def read_source(path):
+    """Sensors of a JSON or SQLite camera file, in the SENSORS layout."""
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return _normalize(data.get("sensors", data) if isinstance(data, dict) else data)
+    import sqlite3
+    con = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        sensors = {sn: {"bits": bits, "gains": {}, "temps": {}, "cameras": {}}
+                   for sn, bits in con.execute("SELECT name, bits FROM sensors ORDER BY rowid")}
+        for sn, gk, rn, ge, off, fw in con.execute(
+                "SELECT sensor, name, rn, ge, offset, fw FROM gains ORDER BY rowid"):
+            if sn in sensors:
+                sensors[sn]["gains"][gk] = {"rn": rn, "ge": ge, "offset": 20 if off is None else off, "fw": fw}
+        for sn, t, dc in con.execute("SELECT sensor, temp, dc FROM temps ORDER BY temp DESC"):
+            if sn in sensors:
+                sensors[sn]["temps"][t] = dc
+        for sn, brand, model in con.execute("SELECT sensor, brand, model FROM cameras ORDER BY rowid"):
+            if sn in sensors:
+                sensors[sn]["cameras"].setdefault(brand, []).append(model)
+    except sqlite3.Error as e:
+        raise ValueError(f"camera file: {e}") from None
+    finally:
+        con.close()
+    return _normalize(sensors)
+
+
+def _sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.digest()
+
+
+def builtin_digest(sensors):
+    return hashlib.sha256(json.dumps(sensors, sort_keys=True, default=str).encode()).digest()
+
+
+# --- binary index ---
+
+def compile_index(sensors, mtime_ns=0, size=0, source_sha=b"", builtin_sha=b""):
+    """Binary index (bytes) of a SENSORS-layout dict; see the module docstring for the layout."""
+    strings = bytearray()
+    interned = {}
+
+    def s(text):
+        b = text.encode("utf-8")
+        if b not in interned:
+            interned[b] = len(strings)
+            strings.extend(b)
+        return interned[b], len(b)
+
+    names = list(sensors)
+    index = {sn: i for i, sn in enumerate(names)}
+    sensor_recs, gain_recs, temp_recs = [], [], []
+    for sn in names:
+        x = sensors[sn]
+        sensor_recs.append(_SENSOR.pack(*s(sn), x["bits"], len(gain_recs), len(x["gains"]),
+                                        len(temp_recs), len(x["temps"])))
+        for gk, g in x["gains"].items():
+            gain_recs.append(_GAIN.pack(*s(gk), g["rn"], g["ge"], g.get("offset", 20), g.get("fw", float("nan"))))
+        for t, dc in x["temps"].items():
+            temp_recs.append(_TEMP.pack(t, dc))
+
+    brands = {}
+    for sn in names:
+        for brand, models in sensors[sn]["cameras"].items():
+            for m in models:
+                brands.setdefault(brand, {})[f"{m}  [{sn}]"] = index[sn]
+    brand_recs, camera_recs = [], []
+    for brand in sorted(brands):
+        models = sorted(brands[brand].items())
+        brand_recs.append(_BRAND.pack(*s(brand), len(camera_recs), len(models)))
+        camera_recs += [_CAMERA.pack(*s(key), si) for key, si in models]
+
+    header = _HEADER.pack(_MAGIC, len(brand_recs), len(camera_recs), len(sensor_recs), len(gain_recs),
+                          len(temp_recs), len(strings), mtime_ns, size, source_sha, builtin_sha)
+    return b"".join([header, *brand_recs, *camera_recs, *sensor_recs, *gain_recs, *temp_recs, bytes(strings)])
+
+
+class CompiledCameraDB(Mapping):
+    """CAMERA_DB-compatible read-only mapping (brand -> model key -> record) over a binary index."""
+
+    def __init__(self, buf):
+        self._buf = buf
+        head = _HEADER.unpack_from(buf, 0)
+        if head[0] != _MAGIC:
+            raise ValueError("not a camera index")
+        self.n_brands, self.n_cameras, self.n_sensors, n_gains, n_temps, n_strings = head[1:7]
+        self.mtime_ns, self.size, self.source_sha, self.builtin_sha = head[7:11]
+        self._brand_at = _HEADER.size
+        self._camera_at = self._brand_at + self.n_brands * _BRAND.size
+        self._sensor_at = self._camera_at + self.n_cameras * _CAMERA.size
+        self._gain_at = self._sensor_at + self.n_sensors * _SENSOR.size
+        self._temp_at = self._gain_at + n_gains * _GAIN.size
+        self._str_at = self._temp_at + n_temps * _TEMP.size
+        if self._str_at + n_strings > len(buf):
+            raise ValueError("truncated camera index")
+        self._brands = {}
+        for i in range(self.n_brands):
+            off, ln, first, count = _BRAND.unpack_from(buf, self._brand_at + i * _BRAND.size)
+            self._brands[self._str(off, ln)] = (first, count)
+        self._models = {}
+        self._sensors = {}
+
+    def _str(self, off, ln):
+        start = self._str_at + off
+        return bytes(self._buf[start:start + ln]).decode("utf-8")
+
+    def sensor(self, i):
+        """Decoded sensor record i: (name, bits, gains dict, temps dict), shared by its cameras."""
+        if i not in self._sensors:
+            off, ln, bits, g0, gn, t0, tn = _SENSOR.unpack_from(self._buf, self._sensor_at + i * _SENSOR.size)
+            gains = {}
+            for j in range(g0, g0 + gn):
+                goff, gln, rn, ge, offset, fw = _GAIN.unpack_from(self._buf, self._gain_at + j * _GAIN.size)
+                g = {"rn": rn, "ge": ge, "offset": _number(offset)}
+                if fw == fw:
+                    g["fw"] = _number(fw)
+                gains[self._str(goff, gln)] = g
+            temps = {}
+            for j in range(t0, t0 + tn):
+                t, dc = _TEMP.unpack_from(self._buf, self._temp_at + j * _TEMP.size)
+                temps[_number(t)] = dc
+            self._sensors[i] = (self._str(off, ln), bits, gains, temps)
+        return self._sensors[i]
+
+    def __getitem__(self, brand):
+        if brand not in self._models:
+            first, count = self._brands[brand]
+            self._models[brand] = _BrandModels(self, first, count)
+        return self._models[brand]
+
+    def __iter__(self):
+        return iter(self._brands)
+
+    def __len__(self):
+        return self.n_brands
+
+
+class _BrandModels(Mapping):
+    """Model key -> camera record of one brand; keys decoded on first use, records on access."""
+
+    def __init__(self, db, first, count):
+        self._db = db
+        self._keys = {}
+        for i in range(first, first + count):
+            off, ln, si = _CAMERA.unpack_from(db._buf, db._camera_at + i * _CAMERA.size)
+            self._keys[db._str(off, ln)] = si
+        self._records = {}
+
+    def __getitem__(self, key):
+        if key not in self._records:
+            name, bits, gains, temps = self._db.sensor(self._keys[key])
+            self._records[key] = {"sensor": name, "gains": gains, "temps": temps, "bits": bits}
+        return self._records[key]
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+
+def _map(path):
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def load_camera_db(builtin, path=None, cache=None):
+    """CompiledCameraDB of an external file merged over `builtin` (SENSORS), or None without a usable file.
+
+    The outcome (source, cache file, whether it was (re)compiled, error,
+    time) is left in LOAD_INFO.
+    """
+    t0 = time.perf_counter()
+    LOAD_INFO.update(source=None, cache=None, compiled=False, error=None, ms=0.0)
+    path = Path(path) if path is not None else external_db_path()
+    if path is None:
+        return None
+    LOAD_INFO["source"] = str(path)
+    try:
+        st = path.stat()
+        builtin_sha = builtin_digest(builtin)
+        cache = Path(cache) if cache is not None else \
+            cache_dir() / f"cameras-{hashlib.sha1(str(path.resolve()).encode()).hexdigest()[:12]}.idx"
+        LOAD_INFO["cache"] = str(cache)
+        db = None
+        try:
+            db = CompiledCameraDB(_map(cache))
+        except (OSError, ValueError, struct.error):
+            pass
+        if db is not None and db.builtin_sha == builtin_sha:
+            if (db.mtime_ns, db.size) == (st.st_mtime_ns, st.st_size):
+                return db
+            source_sha = _sha256_file(path)
+            if db.source_sha == source_sha:
+                # Same content, new mtime (touched, copied from another PC): just refresh the key
+                try:
+                    with open(cache, "r+b") as f:
+                        f.seek(struct.calcsize("<8s6I"))
+                        f.write(struct.pack("<qq", st.st_mtime_ns, st.st_size))
+                except OSError:
+                    pass
+                return db
+        else:
+            source_sha = _sha256_file(path)
+        merged = dict(builtin)
+        merged.update(read_source(path))
+        data = compile_index(merged, st.st_mtime_ns, st.st_size, source_sha, builtin_sha)
+        LOAD_INFO["compiled"] = True
+        if db is not None and isinstance(db._buf, mmap.mmap):
+            db._buf.close()
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache.with_suffix(f".tmp{os.getpid()}")
+            tmp.write_bytes(data)
+            tmp.replace(cache)
+            return CompiledCameraDB(_map(cache))
+        except OSError:
+            # Read-only or locked cache (e.g. mapped by another instance on Windows): use it from memory
+            return CompiledCameraDB(data)
+    except (OSError, ValueError) as e:
+        LOAD_INFO["error"] = str(e)
+        return None
+    finally:
+        LOAD_INFO["ms"] = (time.perf_counter() - t0) * 1000
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Exposure calculations: swamp factor medians, C factor, optimal time and additional noise."""
+
+import math
+
+TIMES_LRGB = [4, 10, 20, 30, 40, 50, 60, 100, 200, 300, 400, 500, 600, 1000, 2000]
+TIMES_NB = [100, 200, 300, 400, 500, 600, 1000, 2000]
+FILTERS = [("L", "sky_L"), ("RGB", "sky_RGB"), ("NB 12 nm", "sky_NB12"), ("NB 7 nm", "sky_NB7"), ("NB 3 nm", "sky_NB3")]
+EXP_KEYS = {"L": "exp_L", "RGB": "exp_RGB", "NB 12 nm": "exp_NB12", "NB 7 nm": "exp_NB7", "NB 3 nm": "exp_NB3"}
+
+# Numeric inputs (and their types) shared by the GUI fields, the settings file and the batch CLI
+DEFAULT_PARAMS = {
+    "sky_L": 1.76, "sky_RGB": 1.31, "sky_NB12": 0.12, "sky_NB7": 0.07,
+    "rn": 1.375, "ge": 0.244, "dc": 0.0017, "bits": 16, "offset": 20,
+    "sf": 10, "noise_pct": 5.0,
+    "exp_L": 90, "exp_RGB": 90, "exp_NB12": 180, "exp_NB7": 300, "exp_NB3": 300,
+    "cL1": 120, "cL2": 180, "cR1": 120, "cR2": 180,
+    "hours": 4.0, "signal": 0.2,
+    "w_L": 1.0, "w_RGB": 1.0, "w_NB12": 0.0, "w_NB7": 0.0, "w_NB3": 0.0, "overhead": 5.0, "plan_mode": 0,
+    # Warmest-setpoint sweep: accepted dark current, % of the sky flux
+    "dc_frac": 10.0,
+    # Optimal-gain sweep: minimum dynamic range, stops
+    "dr_min": 11.0,
+}
+
+
+def additional_noise(t, sky, rn):
+    if rn == 0 or t <= 0 or sky <= 0:
+        return 0.0
+    r = t * sky / (rn * rn)
+    return math.sqrt((r + 1) / r) - 1
+
+def c_factor(npct):
+    if npct <= 0:
+        return float("inf")
+    ratio = ((100 + npct) / 100) ** 2 - 1
+    return round(1.0 / ratio, 1) if ratio > 0 else float("inf")
+
+def optimal_time(c, rn, sky):
+    if sky <= 0 or c == float("inf"):
+        return float("inf")
+    return math.ceil(c * rn * rn / sky)
+
+def target_median(sf, rn, ge, offset, bits):
+    if ge == 0:
+        return 0
+    return int((sf * rn * rn / ge + offset) * 65536 / (2 ** bits))
+
+# Array-native kernels: same formulas and edge cases as the scalar versions above,
+# broadcast over whole (filter x time) grids in a single call. NumPy is imported
+# on first use so that importing the engine stays stdlib-only.
+def additional_noise_grid(t, sky, rn):
+    import numpy as np
+    t, sky, rn = np.broadcast_arrays(np.asarray(t, dtype=float), np.asarray(sky, dtype=float),
+                                     np.asarray(rn, dtype=float))
+    valid = (rn != 0) & (t > 0) & (sky > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = t * sky / (rn * rn)
+        out = np.sqrt((r + 1) / r) - 1
+    return np.where(valid, out, 0.0)
+
+def optimal_time_grid(c, rn, sky):
+    import numpy as np
+    c, rn, sky = np.broadcast_arrays(np.asarray(c, dtype=float), np.asarray(rn, dtype=float),
+                                     np.asarray(sky, dtype=float))
+    valid = (sky > 0) & np.isfinite(c)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.ceil(c * rn * rn / sky)
+    return np.where(valid, out, np.inf)
+
+def target_median_grid(sf, rn, ge, offset, bits):
+    import numpy as np
+    sf, rn, ge, offset, bits = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (sf, rn, ge, offset, bits)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.trunc((sf * rn * rn / ge + offset) * 65536 / np.exp2(bits))
+    return np.where(ge == 0, 0, np.nan_to_num(out)).astype(np.int64)
+
+def noise_grid(times, skies, rn):
+    """Additional noise for every (sky, time) pair -> array of shape (len(skies), len(times))."""
+    import numpy as np
+    return additional_noise_grid(np.asarray(times, dtype=float)[None, :],
+                                 np.asarray(skies, dtype=float)[:, None], rn)
+
+def sec_to_mmss(s):
+    if s is None or s == float("inf") or s < 0:
+        return "\u2014"
+    m, sec = divmod(int(s), 60)
+    return f"{m:02d}:{sec:02d}"
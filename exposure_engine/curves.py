@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Adaptive noise curves: additional_noise(t) over a continuous time range,
+sampled densely where the curve bends and sparsely where it is flat, then
+decimated to the plot width.
+
+    cs = CurveSampler()
+    t, y = cs.sample(rn=1.4, sky=1.76, t_min=1, t_max=2000)   # refined samples
+    t, y = decimate(t, y, 800)                                  # plot-ready polyline
+
+Refinement bisects intervals in log(t), starting from a grid aligned on
+powers of ten (so zooming reuses the same seed points). Each pass evaluates
+the midpoints of all unchecked intervals in one vectorized call and splits
+the intervals whose midpoint is more than `tol` x (y span of the range) away
+from the chord as drawn on a linear (or, with log_x, logarithmic) time axis.
+Samples, midpoints and chord errors are kept per (rn, sky) curve, so zooming,
+resizing or redrawing never re-evaluates a region already known at the
+needed precision.
+"""
+
+from collections import OrderedDict
+
+from .core import additional_noise_grid
+
+
+class _Curve:
+    __slots__ = ("t", "y", "err", "mid")
+
+    def __init__(self, np):
+        # t, y: sorted samples; err[i] / mid[i]: chord error and midpoint value of [t[i], t[i+1]] (NaN = unchecked)
+        self.t = self.y = self.err = self.mid = np.empty(0)
+
+
+class CurveSampler:
+    def __init__(self, tol=5e-5, per_decade=16, log_x=False, max_passes=20, max_points=20000, maxsize=32):
+        self.tol = tol
+        self.log_x = log_x
+        self.per_decade = per_decade
+        self.max_passes = max_passes
+        self.max_points = max_points
+        self.maxsize = maxsize
+        self._curves = OrderedDict()
+        self.evaluations = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _curve(self, rn, sky):
+        import numpy as np
+        key = (float(rn), float(sky))
+        c = self._curves.get(key)
+        if c is None:
+            self.misses += 1
+            c = self._curves[key] = _Curve(np)
+            while len(self._curves) > self.maxsize:
+                self._curves.popitem(last=False)
+        else:
+            self.hits += 1
+            self._curves.move_to_end(key)
+        return c
+
+    @staticmethod
+    def _merge(c, t_new, y_new):
+        """Insert samples, keeping the checked state of every interval that was not split."""
+        import numpy as np
+        t = np.concatenate([c.t, t_new])
+        order = np.argsort(t, kind="stable")
+        t, y = t[order], np.concatenate([c.y, y_new])[order]
+        err, mid = np.full(max(len(t) - 1, 0), np.nan), np.full(max(len(t) - 1, 0), np.nan)
+        if len(c.t) > 1:
+            ia = np.searchsorted(t, c.t[:-1])
+            kept = t[ia + 1] == c.t[1:]
+            err[ia[kept]] = c.err[kept]
+            mid[ia[kept]] = c.mid[kept]
+        c.t, c.y, c.err, c.mid = t, y, err, mid
+
+    def sample(self, rn, sky, t_min, t_max):
+        """Refined (t, noise) samples of additional_noise(t, sky, rn) for t in [t_min, t_max]."""
+        import numpy as np
+        if not 0 < t_min < t_max:
+            raise ValueError("need 0 < t_min < t_max")
+        c = self._curve(rn, sky)
+
+        # Seed: endpoints + a log grid aligned on powers of ten, only the points not already known
+        k = np.arange(np.floor(np.log10(t_min) * self.per_decade), np.ceil(np.log10(t_max) * self.per_decade) + 1)
+        seed = np.unique(np.clip(np.concatenate([[t_min, t_max], 10.0 ** (k / self.per_decade)]), t_min, t_max))
+        pos = np.searchsorted(c.t, seed)
+        known = (pos < len(c.t)) & (c.t[np.minimum(pos, len(c.t) - 1)] == seed) if len(c.t) else np.zeros(len(seed), bool)
+        if not known.all():
+            new = seed[~known]
+            self._merge(c, new, additional_noise_grid(new, sky, rn))
+            self.evaluations += len(new)
+
+        for _ in range(self.max_passes):
+            i0, i1 = np.searchsorted(c.t, t_min), np.searchsorted(c.t, t_max, side="right") - 1
+            ys = c.y[i0:i1 + 1]
+            abs_tol = self.tol * (ys.max() - ys.min())
+            if abs_tol <= 0:
+                break
+            idx = np.arange(i0, i1)
+            todo = idx[np.isnan(c.err[idx])]
+            if todo.size:
+                ta, tb = c.t[todo], c.t[todo + 1]
+                tm = np.sqrt(ta * tb)
+                ym = additional_noise_grid(tm, sky, rn)
+                w = 0.5 if self.log_x else (tm - ta) / (tb - ta)
+                c.mid[todo] = ym
+                c.err[todo] = np.abs(ym - (c.y[todo] + w * (c.y[todo + 1] - c.y[todo])))
+                self.evaluations += todo.size
+            split = idx[c.err[idx] > abs_tol]
+            if not split.size or len(c.t) + split.size > self.max_points:
+                break
+            self._merge(c, np.sqrt(c.t[split] * c.t[split + 1]), c.mid[split])
+
+        i0, i1 = np.searchsorted(c.t, t_min), np.searchsorted(c.t, t_max, side="right")
+        return c.t[i0:i1], c.y[i0:i1]
+
+    def clear(self):
+        self._curves.clear()
+
+    def stats(self):
+        return {"curves": len(self._curves), "points": sum(len(c.t) for c in self._curves.values()),
+                "evaluations": self.evaluations, "hits": self.hits, "misses": self.misses}
+
+
+def decimate(t, y, width, t_min=None, t_max=None, log=False):
+    """Reduce (t, y) to at most 4 points per pixel column (first, last, min, max).
+
+    The polyline drawn at `width` pixels looks the same as with every sample.
+    The x extent defaults to the data range; log=True for a log time axis.
+    """
+    import numpy as np
+    t, y = np.asarray(t, dtype=float), np.asarray(y, dtype=float)
+    width = max(int(width), 1)
+    if len(t) <= 4 * width:
+        return t, y
+    x = np.log(t) if log else t
+    x0 = np.log(t_min) if log and t_min else (t_min if t_min is not None else x[0])
+    x1 = np.log(t_max) if log and t_max else (t_max if t_max is not None else x[-1])
+    col = np.clip(((x - x0) / ((x1 - x0) or 1.0) * width).astype(np.int64), -1, width)
+    starts = np.flatnonzero(np.r_[True, col[1:] != col[:-1]])
+    ends = np.r_[starts[1:], len(col)] - 1
+    by_y = np.lexsort((y, col))  # per column, sorted by y: group start = argmin, group end = argmax
+    keep = np.unique(np.concatenate([starts, ends, by_y[starts], by_y[ends]]))
+    return t[keep], y[keep]
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Continuous dark-current model over the cooling temperature.
+
+The sensor tables only list a few setpoints (0, -5, ..., -25 C). A model
+is fitted once per sensor table and evaluated for any temperature, scalar or
+array:
+
+    m = dark_model(cam["temps"])
+    m(-12)                          # e-/s/px at -12 C
+    m.doubling                      # fitted doubling interval (C)
+    warmest_setpoint(cam["temps"], skies, fraction=0.1)   # per filter (C)
+
+Dark current roughly doubles every N degrees, so ln(DC) is close to linear
+in T. The model is piecewise log-linear through the listed setpoints (it
+returns the table values exactly and keeps the plateaus of sensors whose
+dark current stops falling). Warmer than the table, it follows the
+least-squares slope of ln(DC) over the table. Colder, it holds the coldest value,
+the pessimistic reading. With a single setpoint the slope falls back to
+DEFAULT_DOUBLING_C.
+"""
+
+import math
+
+DEFAULT_DOUBLING_C = 6.0
+
+
+class DarkCurrentModel:
+    def __init__(self, temps):
+        pts = sorted((float(t), float(dc)) for t, dc in temps.items() if dc > 0)
+        if not pts:
+            raise ValueError("no positive dark current in the table")
+        self.t = [t for t, _ in pts]
+        self.log_dc = [math.log(dc) for _, dc in pts]
+        slope = 0.0
+        if len(pts) > 1:
+            mt = sum(self.t) / len(self.t)
+            ml = sum(self.log_dc) / len(self.log_dc)
+            var = sum((t - mt) ** 2 for t in self.t)
+            slope = sum((t - mt) * (l - ml) for t, l in zip(self.t, self.log_dc)) / var
+        self.slope = slope if slope > 0 else math.log(2) / DEFAULT_DOUBLING_C
+        self.doubling = math.log(2) / self.slope
+
+    def __call__(self, temp):
+        """Dark current (e-/s/px) at `temp` (C); a float for a scalar, else an array."""
+        import numpy as np
+        t = np.asarray(temp, dtype=float)
+        log_dc = np.interp(t, self.t, self.log_dc)
+        log_dc = np.where(t > self.t[-1], self.log_dc[-1] + self.slope * (t - self.t[-1]), log_dc)
+        out = np.exp(log_dc)
+        return float(out) if out.ndim == 0 else out
+
+    def warmest(self, limit, t_min=-40.0, t_max=30.0, step=0.1):
+        """Warmest temperature (C, on a `step` grid) with a dark current <= limit; NaN if none in range.
+
+        `limit` broadcasts: one answer per limit.
+        """
+        import numpy as np
+        grid = np.arange(t_min, t_max + step / 2, step)
+        dc = np.maximum.accumulate(self(grid))        # monotone even for a noisy table
+        limit = np.asarray(limit, dtype=float)
+        idx = np.searchsorted(dc, limit, side="right") - 1
+        out = np.where(idx >= 0, grid[np.clip(idx, 0, None)], np.nan)
+        return float(out) if out.ndim == 0 else out
+
+
+_MODELS = {}
+
+def dark_model(temps):
+    """Model of a sensor's temps table, fitted on first use and kept (one per distinct table)."""
+    key = tuple(sorted(temps.items()))
+    if key not in _MODELS:
+        _MODELS[key] = DarkCurrentModel(temps)
+    return _MODELS[key]
+
+
+def warmest_setpoint(temps, skies, fraction=0.1, t_min=-40.0, t_max=30.0, step=0.1):
+    """Per sky level (e-/s/px), the warmest setpoint keeping dark current below `fraction` of it."""
+    import numpy as np
+    return dark_model(temps).warmest(fraction * np.asarray(skies, dtype=float), t_min, t_max, step)
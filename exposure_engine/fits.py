@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+Sky medians of raw FITS subs, measured in bulk without loading the frames.
+
+    res = scan_directory("captures/2026-10-18", median_sf3=412, median_sf10=1236)
+    for r in res:
+        print(r["name"], r["sky_median"], r["status"])     # status: low / ok / high
+
+Only the primary HDU is read, with a small built-in header parser (no
+astropy). The pixel data is opened with numpy.memmap and only every n-th
+row of the central region is touched: about `samples` pixels, i.e. ~2 MB
+of I/O for a 60 MP 16-bit frame. That sample is
+split into tiles; the tile medians come from a selection (np.partition),
+and tiles more than 3 robust sigma above the typical tile (star clusters,
+nebula, galaxy) are dropped. The median of the remaining tiles is the sky
+median, the automatic version of measuring a star-free sky area by hand.
+Files are spread over a process pool.
+"""
+
+import os
+
+FITS_EXTENSIONS = (".fit", ".fits", ".fts")
+_BLOCK = 2880
+_DTYPES = {8: "u1", 16: ">i2", 32: ">i4", 64: ">i8", -32: ">f4", -64: ">f8"}
+
+
+def read_header(path):
+    """Primary header as a dict (keyword -> value) plus the byte offset of the data."""
+    header = {}
+    with open(path, "rb") as f:
+        offset = 0
+        while True:
+            block = f.read(_BLOCK)
+            if len(block) < _BLOCK:
+                raise ValueError("truncated FITS header")
+            if offset == 0 and not block.startswith(b"SIMPLE  ="):
+                raise ValueError("not a FITS file")
+            offset += _BLOCK
+            for i in range(0, _BLOCK, 80):
+                card = block[i:i + 80].decode("ascii", errors="replace")
+                key = card[:8].strip()
+                if key == "END":
+                    return header, offset
+                if card[8:10] != "= ":
+                    continue
+                value = card[10:]
+                if value.lstrip().startswith("'"):
+                    v = value.lstrip()[1:]
+                    header[key] = v[:v.find("'")].strip() if "'" in v else v.strip()
+                    continue
+                value = value.split("/", 1)[0].strip()
+                if value in ("T", "F"):
+                    header[key] = value == "T"
+                    continue
+                try:
+                    header[key] = int(value)
+                except ValueError:
+                    try:
+                        header[key] = float(value)
+                    except ValueError:
+                        header[key] = value
+
+
+def open_data(path):
+    """(header, memmap of the first 2-D image plane, in raw stored values)."""
+    import numpy as np
+    header, offset = read_header(path)
+    bitpix, naxis = header.get("BITPIX"), header.get("NAXIS", 0)
+    if bitpix not in _DTYPES or naxis < 2:
+        raise ValueError("no 2-D image in the primary HDU")
+    w, h = header["NAXIS1"], header["NAXIS2"]
+    return header, np.memmap(path, dtype=_DTYPES[bitpix], mode="r", offset=offset, shape=(h, w))
+
+
+def sky_median(data, bzero=0.0, bscale=1.0, samples=1 << 20, tiles=8, margin=0.05):
+    """Sky median (physical ADU) of a 2-D array from a strided sample of its central region."""
+    import numpy as np
+    h, w = data.shape
+    y0, x0 = int(h * margin), int(w * margin)
+    region = data[y0:h - y0 or h, x0:w - x0 or w]
+    # Whole rows (contiguous on disk) rather than a 2-D stride: the fewest pages read for `samples` pixels
+    step = max(1, region.size // samples)
+    sample = np.asarray(region[::step], dtype=np.float64)
+    th, tw = sample.shape[0] // tiles, sample.shape[1] // tiles
+    if th == 0 or tw == 0:
+        med = float(np.median(sample))
+        return med * bscale + bzero, med * bscale + bzero
+    t = sample[:th * tiles, :tw * tiles].reshape(tiles, th, tiles, tw).transpose(0, 2, 1, 3).reshape(tiles * tiles, -1)
+    k = t.shape[1] // 2
+    tile_med = np.partition(t, k, axis=1)[:, k]
+    mid = np.median(tile_med)
+    mad = 1.4826 * np.median(np.abs(tile_med - mid))
+    sky = float(np.median(tile_med[tile_med <= mid + 3 * mad])) if mad > 0 else float(mid)
+    frame = float(np.partition(sample.ravel(), sample.size // 2)[sample.size // 2])
+    return sky * bscale + bzero, frame * bscale + bzero
+
+
+def measure_file(path, samples=1 << 20):
+    """Sky and frame median of one FITS sub plus the header fields useful to compare subs."""
+    res = {"path": path, "name": os.path.basename(path)}
+    try:
+        header, data = open_data(path)
+        sky, frame = sky_median(data, header.get("BZERO", 0.0), header.get("BSCALE", 1.0), samples)
+        res.update(sky_median=round(sky, 1), frame_median=round(frame, 1),
+                   width=data.shape[1], height=data.shape[0],
+                   exptime=header.get("EXPTIME", header.get("EXPOSURE")), filter=header.get("FILTER"),
+                   gain=header.get("GAIN"), temp=header.get("CCD-TEMP"), error=None)
+        del data
+    except (OSError, ValueError, KeyError) as e:
+        res["error"] = str(e)
+    return res
+
+
+def find_fits(directory, recursive=False):
+    """FITS files of a directory, sorted by name."""
+    found = []
+    for root, dirs, files in os.walk(directory):
+        found += [os.path.join(root, f) for f in files if f.lower().endswith(FITS_EXTENSIONS)]
+        if not recursive:
+            break
+    return sorted(found)
+
+
+def classify_median(median, median_sf3, median_sf10):
+    """'low' below the SF x3 target (lengthen the subs), 'high' above SF x10, else 'ok'."""
+    if median is None:
+        return None
+    if median < median_sf3:
+        return "low"
+    if median > median_sf10:
+        return "high"
+    return "ok"
+
+
+def scan_directory(directory, median_sf3=None, median_sf10=None, workers=None, recursive=False, samples=1 << 20):
+    """Measure every FITS sub of a directory over a process pool; results in file name order."""
+    paths = find_fits(directory, recursive)
+    workers = min(workers or os.cpu_count() or 1, max(len(paths), 1))
+    if workers <= 1 or len(paths) <= 1:
+        results = [measure_file(p, samples) for p in paths]
+    else:
+        from concurrent.futures import ProcessPoolExecutor     # only for a pool: keeps the package import light
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(measure_file, paths, [samples] * len(paths),
+                                    chunksize=max(1, len(paths) // (workers * 4))))
+    if median_sf3 is not None and median_sf10 is not None:
+        for r in results:
+            r["status"] = classify_median(r.get("sky_median"), median_sf3, median_sf10)
+    return results
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+Continuous gain curves per sensor and the optimal-gain sweep.
+
+The sensor tables list 1-3 gain presets ("Gain 0", "Gain 100 (HCG)", ...).
+The gain number is read from the preset name (a preset without one, e.g.
+"Unique", is gain 0), and the curves are evaluated at any gain, scalar or
+array:
+
+    c = gain_curve(cam)             # cam: CAMERA_DB / find_camera() record
+    c(60)                           # {"rn", "ge", "fw", "offset", "dr"} at gain 60
+    c.hcg                           # gain of the HCG step (None without one)
+    optimal_gain(cam, skies, noise_pct=5.0, dr_min=11.0)
+
+The curves are:
+    ge      log-linear in gain through the presets (conversion gain is in dB
+            steps); outside them, the fitted slope, or 0.1 dB per unit with
+            a single preset
+    rn      log-linear between presets of the same mode, with a step at the
+            HCG preset: below it the low-conversion-gain presets only, from
+            it the HCG ones. Beyond a mode's presets the nearest value is
+            held (read noise only falls with gain, so this overestimates it)
+    fw      log-linear through the presets; outside them, the ge slope
+            capped by the ADC range ge * 2^bits
+    offset  that of the closest preset at or below the gain
+    dr      dynamic range in stops, log2(fw / rn)
+"""
+
+import math
+
+_GAIN_NUMBER = r"(-?\d+(?:\.\d+)?)"       # compiled (and cached by re) on the first parse
+_DB_SLOPE = -math.log(10) / 200      # ln(ge) per gain unit for 0.1 dB gain steps
+
+
+def parse_gain(name, default=0.0):
+    """Gain number of a preset name ("Gain 100 (HCG)" -> 100.0, "Unique" -> `default`)."""
+    import re
+    m = re.search(_GAIN_NUMBER, str(name))
+    return float(m.group(1)) if m else default
+
+
+def _loglin(x, xs, logs, slope):
+    """Piecewise log-linear interpolation, extrapolated with `slope` (ln units per x) on both sides."""
+    import numpy as np
+    y = np.interp(x, xs, logs)
+    y = np.where(x > xs[-1], logs[-1] + slope * (x - xs[-1]), y)
+    y = np.where(x < xs[0], logs[0] + slope * (x - xs[0]), y)
+    return np.exp(y)
+
+
+class GainCurve:
+    def __init__(self, gains, bits):
+        pts = sorted((parse_gain(name), "HCG" in name.upper(), g) for name, g in gains.items())
+        if not pts:
+            raise ValueError("no gain preset")
+        self.bits = int(bits)
+        self.presets = [p[0] for p in pts]
+        hcg = [p[0] for p in pts if p[1]]
+        self.hcg = hcg[0] if hcg else None
+        self._g = [p[0] for p in pts]
+        self._log_ge = [math.log(p[2]["ge"]) for p in pts]
+        self._offset = [p[2].get("offset", 20) for p in pts]
+        fw = [(p[0], math.log(p[2]["fw"])) for p in pts if p[2].get("fw")]
+        self._fw = ([g for g, _ in fw], [l for _, l in fw])
+        self._ge_slope = self._fit(self._g, self._log_ge) if len(pts) > 1 else _DB_SLOPE
+        # Read noise: one log-linear piece per conversion-gain mode
+        self._rn_modes = []
+        for in_hcg in (False, True):
+            mode = [(p[0], math.log(p[2]["rn"])) for p in pts if (self.hcg is not None and p[0] >= self.hcg) == in_hcg]
+            if mode:
+                self._rn_modes.append(([g for g, _ in mode], [l for _, l in mode]))
+
+    @staticmethod
+    def _fit(xs, ys):
+        mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+        var = sum((x - mx) ** 2 for x in xs)
+        return sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / var if var else _DB_SLOPE
+
+    def __call__(self, gain):
+        """rn (e-), ge (e-/ADU), fw (e-), offset (ADU) and dr (stops) at `gain`; arrays for an array."""
+        import numpy as np
+        g = np.asarray(gain, dtype=float)
+        ge = _loglin(g, self._g, self._log_ge, self._ge_slope)
+        if len(self._rn_modes) == 2:
+            lcg, hcg = self._rn_modes
+            rn = np.where(g >= self.hcg, _loglin(g, *hcg, 0.0), _loglin(g, *lcg, 0.0))
+        else:
+            rn = _loglin(g, *self._rn_modes[0], 0.0)
+        adc = ge * (2 ** self.bits)
+        if self._fw[0]:
+            fw = _loglin(g, *self._fw, self._ge_slope)
+            fw = np.where((g < self._fw[0][0]) | (g > self._fw[0][-1]), np.minimum(fw, adc), fw)
+        else:
+            fw = adc
+        idx = np.clip(np.searchsorted(self._g, g, side="right") - 1, 0, len(self._g) - 1)
+        offset = np.asarray(self._offset, dtype=float)[idx]
+        out = {"rn": rn, "ge": ge, "fw": fw, "offset": offset, "dr": np.log2(fw / rn)}
+        if g.ndim == 0:
+            return {k: float(v) for k, v in out.items()}
+        return out
+
+
+_CURVES = {}
+
+def gain_curve(cam):
+    """Curve of a camera record's gain presets, built once per distinct sensor table and kept."""
+    key = (cam["bits"], tuple((name, tuple(sorted(g.items()))) for name, g in cam["gains"].items()))
+    if key not in _CURVES:
+        _CURVES[key] = GainCurve(cam["gains"], cam["bits"])
+    return _CURVES[key]
+
+
+def optimal_gain(cam, skies, noise_pct, dc=0.0, dr_min=11.0, g_min=None, g_max=None, step=1.0):
+    """Gain minimizing the optimal sub length while keeping at least `dr_min` stops of dynamic range.
+
+    The sweep covers [g_min, g_max] (default: the preset range) in `step`
+    units, all gains and filters in one pass. Returns a dict with the best
+    gain, its curve values, the optimal times per filter (dark current
+    included, see snr.py) and the swept arrays ("gains", "rn", "dr",
+    "times" as (gains, filters)). Without a gain reaching dr_min, "gain" is
+    None.
+    """
+    import numpy as np
+    from .core import c_factor
+    from .snr import optimal_time_dc_grid
+    curve = gain_curve(cam)
+    lo = curve.presets[0] if g_min is None else g_min
+    hi = curve.presets[-1] if g_max is None else g_max
+    gains = np.arange(lo, hi + step / 2, step) if hi > lo else np.array([float(lo)])
+    c = curve(gains)
+    sky = np.asarray(skies, dtype=float)
+    times = optimal_time_dc_grid(c_factor(noise_pct), c["rn"][:, None], sky[None, :], dc)
+    ok = c["dr"] >= dr_min
+    res = {"gains": gains, "rn": c["rn"], "dr": c["dr"], "times": times, "gain": None}
+    if ok.any():
+        # Every filter's optimal time grows with rn^2 (whether it is finite does not depend on
+        # the gain), so the lowest read noise wins; ties go to the lowest gain (most dynamic range)
+        i = int(np.argmin(np.where(ok, c["rn"], np.inf)))
+        res.update(gain=float(gains[i]), times_best=times[i].tolist(),
+                   **{k + "_best": float(v[i]) for k, v in c.items()})
+    return res
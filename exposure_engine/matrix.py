@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Full-database exposure matrix: every camera model x gain preset x cooling
+temperature x filter, computed in one vectorized pass for the current sky.
+
+    m = ExposureMatrix()
+    res = m.compute(skies=[1.76, 1.31, 0.12, 0.07, 0.03], noise_pct=5.0)
+    res["optimal"]              # (configs, filters) optimal sub length (s)
+    res["optimal_dc"]           # same with each config's dark current at its temperature
+    m.fastest(skies, 5.0, "L")  # shortest-sub cameras for tonight
+
+The flattened camera table is built once. The last result is cached and
+recomputed only when the sky / noise inputs change.
+"""
+
+from .core import FILTERS, c_factor, optimal_time_grid, target_median_grid, additional_noise_grid
+from . import sensors
+from .snr import optimal_time_dc_grid
+
+
+class ExposureMatrix:
+    def __init__(self, camera_db=None):
+        self._db = camera_db if camera_db is not None else sensors.CAMERA_DB
+        self._table = None
+        self._key = None
+        self._result = None
+        self.hits = 0
+        self.misses = 0
+
+    def table(self):
+        """Flattened (brand, model, gain, temp) configurations with their sensor parameters as arrays."""
+        if self._table is None:
+            import numpy as np
+            cols = {k: [] for k in ("brand", "model", "sensor", "gain", "temp", "rn", "ge", "offset", "bits", "dc")}
+            for brand, models in self._db.items():
+                for model, cam in models.items():
+                    for gk, g in cam["gains"].items():
+                        # A camera without a temperature table is kept, without dark current
+                        for temp, dc in (cam["temps"] or {float("nan"): 0.0}).items():
+                            cols["brand"].append(brand)
+                            cols["model"].append(model)
+                            cols["sensor"].append(cam["sensor"])
+                            cols["gain"].append(gk)
+                            cols["temp"].append(temp)
+                            cols["rn"].append(g["rn"])
+                            cols["ge"].append(g["ge"])
+                            cols["offset"].append(g.get("offset", 20))
+                            cols["bits"].append(cam["bits"])
+                            cols["dc"].append(dc)
+            for k in ("rn", "ge", "offset", "bits", "dc"):
+                cols[k] = np.asarray(cols[k], dtype=float)
+            cols["temp"] = np.asarray(cols["temp"], dtype=float)
+            self._table = cols
+        return self._table
+
+    def invalidate(self):
+        self._key = None
+        self._result = None
+
+    def compute(self, skies, noise_pct, sf=10, exps=None):
+        """Optimal times, target medians (SF x3 / xN / x10) and additional noise at `exps` for every config.
+
+        `skies` and `exps` are per-filter sequences in FILTERS order.
+        """
+        key = (tuple(float(s) for s in skies), float(noise_pct), float(sf),
+               tuple(float(e) for e in exps) if exps is not None else None)
+        if key == self._key:
+            self.hits += 1
+            return self._result
+        self.misses += 1
+        import numpy as np
+        tbl = self.table()
+        rn = tbl["rn"][:, None]
+        cf = c_factor(noise_pct)
+        sky = np.asarray(skies, dtype=float)[None, :]
+        self._result = {
+            "c_factor": cf,
+            "optimal": optimal_time_grid(cf, rn, sky),
+            "optimal_dc": optimal_time_dc_grid(cf, rn, sky, tbl["dc"][:, None]),
+            "medians": target_median_grid(np.array([3.0, sf, 10.0])[None, :], rn, tbl["ge"][:, None],
+                                          tbl["offset"][:, None], tbl["bits"][:, None]),
+            "noise": additional_noise_grid(np.asarray(exps, dtype=float)[None, :], sky, rn) if exps is not None else None,
+        }
+        self._key = key
+        return self._result
+
+    def fastest(self, skies, noise_pct, filter_name="L", n=5, sf=10, exps=None):
+        """Cameras needing the shortest optimal sub in one filter, best gain/temp per model.
+
+        Ranked on the dark-current-aware optimum, so a colder setpoint can win.
+        Takes the same inputs as compute() (so it reuses its cached result) and
+        returns a list of (t, brand, model, gain, temp) sorted by t.
+        """
+        import numpy as np
+        tbl = self.table()
+        col = [fn for fn, _ in FILTERS].index(filter_name)
+        t = self.compute(skies, noise_pct, sf, exps)["optimal_dc"][:, col]
+        best = {}
+        for i in np.argsort(t, kind="stable"):
+            key = (tbl["brand"][i], tbl["model"][i])
+            if key not in best:
+                best[key] = (float(t[i]), key[0], key[1], tbl["gain"][i], float(tbl["temp"][i]))
+                if len(best) >= n:
+                    break
+        return sorted(best.values(), key=lambda r: r[0])
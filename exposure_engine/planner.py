@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Session planner: split a night's usable hours across the filters and pick the
+sub length of each one.
+
+    plan = plan_session(skies=[1.76, 1.31, 0.12, 0.07, 0.03], rn=1.4, dc=0.002,
+                        signal=0.2, noise_pct=5.0, hours=6, weights=[1, 1, 0, 0, 0])
+    plan["n"], plan["subs"], plan["snr"]    # per filter, in FILTERS order
+
+Each filter's sub is the shortest one keeping its additional noise (dark
+current included, see snr.py) below noise_pct. Longer subs would only add
+marginal SNR. A filter is left out when its weight is 0 or when that sub
+would be infinite or longer than max_sub.
+
+With a_i = SNR of one sub and d_i = sub + overhead (wall time per sub),
+N_i subs give SNR_i = a_i * sqrt(N_i), so for a wall time T_i the SNR is
+r_i * sqrt(T_i) with r_i = a_i / sqrt(d_i). Two objectives:
+
+    "maxmin"    maximize min(SNR_i / w_i). Reaching a level z needs
+                N_i = ceil((z * w_i / a_i)^2) subs, monotone in z, so the
+                integer optimum is found by bisection on z (each step one
+                vectorized evaluation of the wall time).
+    "weighted"  maximize sum(w_i * SNR_i). The continuous optimum under
+                sum(T_i) = T is T_i ~ (w_i * r_i)^2 (Lagrange / KKT), and its
+                floor is the integer start.
+
+Either way the leftover time is then spent one sub at a time, on the filter
+with the best objective gain (the lowest weighted SNR, or the best weighted
+gain per second), as long as the sub fits.
+"""
+
+import heapq
+
+from .core import FILTERS, c_factor
+from .snr import optimal_time_dc_grid, sub_noise_grid
+
+PLAN_MODES = ("maxmin", "weighted")
+
+
+def plan_session(skies, rn, dc, signal, noise_pct, hours, weights, overhead=0.0, mode="maxmin", max_sub=3600.0):
+    """Integer session plan; returns a dict of per-filter lists plus totals.
+
+    Keys: subs (s), n, seconds (exposure), wall (exposure + overhead), snr,
+    feasible, and objective / used (s) / budget (s).
+    """
+    import numpy as np
+    if mode not in PLAN_MODES:
+        raise ValueError(f"mode must be one of {PLAN_MODES}")
+    k = len(FILTERS)
+    sky = np.broadcast_to(np.asarray(skies, dtype=float), (k,))
+    w = np.broadcast_to(np.asarray(weights, dtype=float), (k,)).clip(min=0)
+    budget = max(float(hours), 0.0) * 3600
+
+    t = optimal_time_dc_grid(c_factor(noise_pct), rn, sky, dc)
+    feasible = (w > 0) & np.isfinite(t) & (t <= max_sub) & (sky > 0)
+    t = np.where(feasible, np.maximum(t, 1.0), 0.0)
+    d = t + max(float(overhead), 0.0)
+    a = np.where(feasible, signal * t / sub_noise_grid(t, sky, rn, dc, signal), 0.0)
+    n = np.zeros(k, dtype=np.int64)
+
+    if feasible.any() and budget > 0 and signal > 0:
+        f = np.flatnonzero(feasible)
+        if mode == "maxmin":
+            def subs_for(z):
+                return np.ceil((z * w[f] / a[f]) ** 2 - 1e-9).astype(np.int64)
+            lo, hi = 0.0, float((a[f] * np.sqrt(budget / d[f]) / w[f]).min())
+            for _ in range(60):
+                mid = (lo + hi) / 2
+                if float((subs_for(mid) * d[f]).sum()) <= budget:
+                    lo = mid
+                else:
+                    hi = mid
+            n[f] = subs_for(lo)
+        else:
+            share = (w[f] * a[f] / np.sqrt(d[f])) ** 2
+            n[f] = np.floor(budget * share / share.sum() / d[f]).astype(np.int64)
+
+        # Spend the leftover time one sub at a time
+        left = budget - float((n * d).sum())
+        if mode == "maxmin":
+            heap = [(a[i] * np.sqrt(n[i]) / w[i], i) for i in f]
+        else:
+            heap = [(-w[i] * a[i] * (np.sqrt(n[i] + 1) - np.sqrt(n[i])) / d[i], i) for i in f]
+        heapq.heapify(heap)
+        while heap:
+            _, i = heapq.heappop(heap)
+            if d[i] > left:
+                continue  # this filter no longer fits: drop it from the heap
+            n[i] += 1
+            left -= d[i]
+            key = a[i] * np.sqrt(n[i]) / w[i] if mode == "maxmin" else \
+                -w[i] * a[i] * (np.sqrt(n[i] + 1) - np.sqrt(n[i])) / d[i]
+            heapq.heappush(heap, (key, i))
+
+    snr = a * np.sqrt(n)
+    if not feasible.any():
+        objective = 0.0
+    elif mode == "maxmin":
+        objective = float((snr[feasible] / w[feasible]).min())
+    else:
+        objective = float((w * snr).sum())
+    return {
+        "subs": [int(x) for x in t], "n": n.tolist(), "seconds": (n * t).tolist(),
+        "wall": (n * d).tolist(), "snr": snr.tolist(), "feasible": feasible.tolist(),
+        "objective": objective, "used": float((n * d).sum()), "budget": budget,
+    }
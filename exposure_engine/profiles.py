@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+"""
+Named settings profiles (per rig / site / camera) in one SQLite file.
+
+    store = ProfileStore("profiles.sqlite")
+    rev = store.save("Newton 200 @ home", settings, rig="Newton 200", site="home",
+                     camera="ASI2600MM Pro  [IMX571]", results=encode_results(bundle, key))
+    store.list(site="home")             # light rows, no settings blobs
+    p = store.load("Newton 200 @ home") # settings + cached results, one query
+    store.save(p["name"], new_settings, expected_revision=p["revision"])
+
+The file may sit in a folder shared by several PCs (NAS):
+    - rollback journal (journal_mode=DELETE): WAL needs shared memory,
+      which network file systems do not provide
+    - every write is one short BEGIN IMMEDIATE transaction, and a locked
+      file is waited for (busy timeout) instead of failing at once
+    - each profile has a revision: a save with expected_revision raises
+      ProfileConflict when another PC saved it in between (optimistic
+      locking), rather than silently overwriting its changes
+
+The cached results are the result bundle of the settings (see results.py),
+stored as JSON with its ResultCache key, so a loaded profile can be shown
+without recomputing it.
+"""
+
+import json
+import socket
+import sqlite3
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    rig TEXT NOT NULL DEFAULT '',
+    site TEXT NOT NULL DEFAULT '',
+    camera TEXT NOT NULL DEFAULT '',
+    settings TEXT NOT NULL,
+    results TEXT,
+    revision INTEGER NOT NULL DEFAULT 1,
+    updated REAL NOT NULL,
+    host TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS profiles_rig ON profiles (rig, name);
+CREATE INDEX IF NOT EXISTS profiles_site ON profiles (site, name);
+CREATE INDEX IF NOT EXISTS profiles_camera ON profiles (camera, name);
+"""
+_LIST_COLUMNS = ("name", "rig", "site", "camera", "revision", "updated", "host")
+
+
+class ProfileConflict(Exception):
+    """The profile was saved elsewhere since it was loaded."""
+
+    def __init__(self, name, expected, current):
+        super().__init__(f"profile {name!r} is at revision {current}, expected {expected}")
+        self.name, self.expected, self.current = name, expected, current
+
+
+def encode_results(values, key):
+    """JSON text of a result bundle (NumPy arrays as nested lists) with its cache key."""
+    def default(o):
+        if hasattr(o, "tolist"):
+            return {"__array__": o.tolist()}
+        raise TypeError(f"not serializable: {type(o).__name__}")
+    return json.dumps({"key": list(key), "values": values}, default=default)
+
+
+def decode_results(text):
+    """(cache key tuple, result bundle) from encode_results() text."""
+    import numpy as np
+
+    def hook(d):
+        return np.asarray(d["__array__"], dtype=float) if len(d) == 1 and "__array__" in d else d
+    data = json.loads(text, object_hook=hook)
+    return tuple(data["key"]), data["values"]
+
+
+class ProfileStore:
+    # One connection per thread: a store is not shared (sqlite3 raises if it is)
+    def __init__(self, path, timeout=10.0):
+        self.path = str(path)
+        self._con = sqlite3.connect(self.path, timeout=timeout, isolation_level=None)
+        self._con.execute("PRAGMA journal_mode=DELETE")
+        self._con.executescript(_SCHEMA)
+
+    def close(self):
+        self._con.close()
+
+    def _write(self, sql, args):
+        con = self._con
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            cur = con.execute(sql, args)
+            con.execute("COMMIT")
+            return cur
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+
+    # --- queries ---
+
+    def list(self, rig=None, site=None, camera=None):
+        """Profiles as dicts (name, rig, site, camera, revision, updated, host), by rig, site, name."""
+        where, args = [], []
+        for col, val in (("rig", rig), ("site", site), ("camera", camera)):
+            if val is not None:
+                where.append(f"{col} = ?")
+                args.append(val)
+        sql = f"SELECT {', '.join(_LIST_COLUMNS)} FROM profiles"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY rig, site, name"
+        return [dict(zip(_LIST_COLUMNS, row)) for row in self._con.execute(sql, args)]
+
+    def facets(self):
+        """Distinct rigs, sites and cameras (for filters)."""
+        return {col: [r[0] for r in self._con.execute(f"SELECT DISTINCT {col} FROM profiles ORDER BY {col}")]
+                for col in ("rig", "site", "camera")}
+
+    def load(self, name):
+        """Profile dict with settings and, if cached, results (cache key, bundle); None if unknown."""
+        row = self._con.execute(
+            f"SELECT {', '.join(_LIST_COLUMNS)}, settings, results FROM profiles WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        p = dict(zip(_LIST_COLUMNS, row[:len(_LIST_COLUMNS)]))
+        p["settings"] = json.loads(row[-2])
+        p["results"] = None
+        if row[-1]:
+            try:
+                p["results"] = decode_results(row[-1])
+            except (ValueError, KeyError, TypeError):
+                pass
+        return p
+
+    # --- writes ---
+
+    def save(self, name, settings, rig=None, site=None, camera=None, results=None, expected_revision=None):
+        """Create or update a profile; returns its new revision.
+
+        rig / site / camera left to None keep their stored values. With
+        expected_revision, raises ProfileConflict if the stored revision
+        differs (0 = the profile must not exist yet).
+        """
+        name = str(name).strip()
+        if not name:
+            raise ValueError("empty profile name")
+        con = self._con
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            row = con.execute("SELECT revision, rig, site, camera FROM profiles WHERE name = ?", (name,)).fetchone()
+            current = row[0] if row else 0
+            if expected_revision is not None and expected_revision != current:
+                raise ProfileConflict(name, expected_revision, current)
+            meta = [v if v is not None else (row[i + 1] if row else "") for i, v in enumerate((rig, site, camera))]
+            values = (*meta, json.dumps(settings, ensure_ascii=False), results, current + 1, time.time(),
+                      socket.gethostname())
+            if row:
+                con.execute("UPDATE profiles SET rig = ?, site = ?, camera = ?, settings = ?, results = ?, "
+                            "revision = ?, updated = ?, host = ? WHERE name = ?", values + (name,))
+            else:
+                con.execute("INSERT INTO profiles (rig, site, camera, settings, results, revision, updated, host, name) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", values + (name,))
+            con.execute("COMMIT")
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+        return current + 1
+
+    def delete(self, name):
+        return self._write("DELETE FROM profiles WHERE name = ?", (name,)).rowcount > 0
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Result bundles: every number the GUI displays for one parameter set, computed
+through a dependency graph (input key -> result nodes -> views) so that an
+edit recomputes only what depends on it, plus a bounded LRU memo so that
+returning to a previous input replays the bundle instead of recomputing it.
+"""
+
+from collections import OrderedDict
+
+from .core import (
+    TIMES_LRGB, TIMES_NB, FILTERS, EXP_KEYS,
+    c_factor, optimal_time_grid, target_median_grid, additional_noise_grid, noise_grid,
+)
+from .snr import optimal_time_dc_grid, stack_snr_grid
+from .planner import PLAN_MODES, plan_session
+from .darkcurrent import warmest_setpoint
+from .gaincurve import optimal_gain
+
+# Numeric inputs a bundle depends on (gain/temp combos only act through rn/ge/dc)
+RESULT_KEYS = (
+    "rn", "ge", "dc", "bits", "offset", "sf", "noise_pct", "hours", "signal",
+    "sky_L", "sky_RGB", "sky_NB12", "sky_NB7",
+    "exp_L", "exp_RGB", "exp_NB12", "exp_NB7", "exp_NB3",
+    "cL1", "cL2", "cR1", "cR2",
+    "w_L", "w_RGB", "w_NB12", "w_NB7", "w_NB3", "overhead", "plan_mode",
+    "dc_frac", "dr_min",
+)
+# Text inputs: the selected camera (CAMERA_DB brand and model key) for the camera sweeps
+CAMERA_KEYS = ("brand", "model")
+
+# Warmest setpoint searched by the cam_setpoint sweep (C)
+SETPOINT_MAX = 30.0
+
+
+def _normalize(p):
+    out = {k: float(p[k]) for k in RESULT_KEYS}
+    out.update((k, str(p.get(k, ""))) for k in CAMERA_KEYS)
+    return out
+
+
+def filter_skies(p):
+    """Sky level per filter in FILTERS order (NB3 = NB12 / 4)."""
+    return [p["sky_NB12"] / 4.0 if sk == "sky_NB3" else p[sk] for _, sk in FILTERS]
+
+
+def _optimal(p, v, g):
+    return [int(t) if t != float("inf") else t
+            for t in optimal_time_grid(v["c_factor"], p["rn"], filter_skies(p)).tolist()]
+
+
+def _compare(p, v, g):
+    sL, sR = p["sky_L"], p["sky_RGB"]
+    return additional_noise_grid([p["cL1"], p["cL2"], p["cR1"], p["cR2"]], [sL, sL, sR, sR], p["rn"]).tolist()
+
+
+def _optimal_dc(p, v, g):
+    return [int(t) if t != float("inf") else t
+            for t in optimal_time_dc_grid(v["c_factor"], p["rn"], filter_skies(p), p["dc"]).tolist()]
+
+
+def _snr(p, v, g):
+    # Stacked SNR over the integration budget: row 0 at the dark-aware optimal sub, row 1 at the exp_* subs
+    import numpy as np
+    t = np.array([v["optimal_dc"], [p[k] for k in _EXP_INPUTS]], dtype=float)
+    snr, n, eff = stack_snr_grid(t, filter_skies(p), p["rn"], p["dc"], p["signal"], p["hours"] * 3600)
+    return {"snr": snr.tolist(), "n": n.tolist(), "eff": eff.tolist()}
+
+
+def _plan(p, v, g):
+    return plan_session(filter_skies(p), p["rn"], p["dc"], p["signal"], p["noise_pct"], p["hours"],
+                        [p[k] for k in _WEIGHT_INPUTS], p["overhead"], PLAN_MODES[int(p["plan_mode"]) % len(PLAN_MODES)])
+
+
+def _camera(p):
+    from . import sensors
+    return sensors.CAMERA_DB.get(p["brand"], {}).get(p["model"])
+
+
+def _cam_best_gain(p, v, g):
+    # Only the best gain is kept: the swept arrays would bloat every cached bundle
+    cam = _camera(p)
+    if not cam:
+        return None
+    best = optimal_gain(cam, filter_skies(p), p["noise_pct"], p["dc"], p["dr_min"])
+    return {k: best[k] for k in ("gain", "rn_best", "ge_best", "dr_best", "times_best") if k in best}
+
+
+def _cam_setpoint(p, v, g):
+    cam = _camera(p)
+    if not cam or not cam["temps"]:
+        return None
+    return warmest_setpoint(cam["temps"], filter_skies(p), p["dc_frac"] / 100, t_max=SETPOINT_MAX).tolist()
+
+
+_SKY_INPUTS = ("sky_L", "sky_RGB", "sky_NB12", "sky_NB7")
+_EXP_INPUTS = tuple(EXP_KEYS[fn] for fn, _ in FILTERS)
+_WEIGHT_INPUTS = tuple("w_" + sk[4:] for _, sk in FILTERS)
+
+# Result nodes in topological order: (name, input keys, upstream nodes, compute(p, values, graph)).
+# Nodes without a compute function are views (tables, charts) that only need repainting.
+RESULT_NODES = [
+    ("nb3", ("sky_NB12",), (), lambda p, v, g: p["sky_NB12"] / 4.0),
+    ("medians", ("sf", "rn", "ge", "offset", "bits"), (),
+     lambda p, v, g: target_median_grid([3, p["sf"], 10], p["rn"], p["ge"], p["offset"], p["bits"]).tolist()),
+    ("c_factor", ("noise_pct",), (), lambda p, v, g: c_factor(p["noise_pct"])),
+    ("optimal", ("rn",) + _SKY_INPUTS, ("c_factor",), _optimal),
+    ("optimal_dc", ("rn", "dc") + _SKY_INPUTS, ("c_factor",), _optimal_dc),
+    ("snr", ("rn", "dc", "signal", "hours") + _SKY_INPUTS + _EXP_INPUTS, ("optimal_dc",), _snr),
+    ("plan", ("rn", "dc", "signal", "hours", "noise_pct", "overhead", "plan_mode") + _SKY_INPUTS + _WEIGHT_INPUTS, (), _plan),
+    ("gain_noise", ("rn",) + _SKY_INPUTS + _EXP_INPUTS, (),
+     lambda p, v, g: additional_noise_grid([p[k] for k in _EXP_INPUTS], filter_skies(p), p["rn"]).tolist()),
+    ("compare", ("rn", "sky_L", "sky_RGB", "cL1", "cL2", "cR1", "cR2"), (), _compare),
+    ("table_lrgb", ("rn", "sky_L", "sky_RGB"), (),
+     lambda p, v, g: noise_grid(TIMES_LRGB, filter_skies(p)[:2], p["rn"])),
+    ("table_nb", ("rn", "sky_NB12", "sky_NB7"), (),
+     lambda p, v, g: noise_grid(TIMES_NB, filter_skies(p)[2:], p["rn"])),
+    ("fastest", ("noise_pct",) + _SKY_INPUTS, (),
+     lambda p, v, g: g.matrix.fastest(filter_skies(p), p["noise_pct"], "L", 3) if g.matrix is not None else None),
+    ("cam_best_gain", ("noise_pct", "dc", "dr_min") + _SKY_INPUTS + CAMERA_KEYS, (), _cam_best_gain),
+    ("cam_setpoint", ("dc_frac",) + _SKY_INPUTS + CAMERA_KEYS, (), _cam_setpoint),
+    ("tables", ("noise_pct",), ("table_lrgb", "table_nb"), None),
+    ("charts", ("noise_pct",), ("table_lrgb", "table_nb"), None),
+]
+
+
+class ResultGraph:
+    """Incremental evaluation of RESULT_NODES.
+
+    update() diffs the new inputs against the previous ones, recomputes only
+    the nodes that (transitively) depend on a changed key and returns the
+    dirty node names, so callers repaint only those. `values` is the current
+    result bundle.
+    """
+
+    def __init__(self, matrix=None):
+        self.matrix = matrix
+        self.params = None
+        self.values = {}
+        self.last_recomputed = []
+        self.total_recomputed = 0
+        self.edits = 0
+        self._by_input = {}
+        self._downstream = {}
+        for name, inputs, upstream, _ in RESULT_NODES:
+            for k in inputs:
+                self._by_input.setdefault(k, set()).add(name)
+            for u in upstream:
+                self._downstream.setdefault(u, set()).add(name)
+
+    @property
+    def nodes(self):
+        return [name for name, *_ in RESULT_NODES]
+
+    def affected(self, changed_keys):
+        """All nodes depending, directly or through other nodes, on any of changed_keys."""
+        dirty = set()
+        stack = [n for k in changed_keys for n in self._by_input.get(k, ())]
+        while stack:
+            n = stack.pop()
+            if n not in dirty:
+                dirty.add(n)
+                stack.extend(self._downstream.get(n, ()))
+        return dirty
+
+    def update(self, p, cache=None):
+        p = _normalize(p)
+        if self.params is None:
+            changed = set(p)
+        else:
+            changed = {k for k in p if p[k] != self.params[k]}
+        dirty = self.affected(changed)
+        self.params = p
+        self.last_recomputed = []
+        if not dirty:
+            return dirty
+        self.edits += 1
+        key = ResultCache.key(p)
+        bundle = cache.get(key) if cache is not None else None
+        if bundle is not None:
+            self.values = dict(bundle)
+            return dirty
+        values = dict(self.values)
+        for name, _, _, func in RESULT_NODES:
+            if name in dirty and func is not None:
+                values[name] = func(p, values, self)
+                self.last_recomputed.append(name)
+        self.values = values
+        self.total_recomputed += len(self.last_recomputed)
+        if cache is not None:
+            cache.put(key, values)
+        return dirty
+
+    def stats(self):
+        return {"edits": self.edits, "last_recomputed": len(self.last_recomputed),
+                "total_recomputed": self.total_recomputed}
+
+
+def compute_results(p, matrix=None):
+    """Compute the full result bundle for parameter dict `p` (keys: RESULT_KEYS, plus CAMERA_KEYS).
+
+    Scalars and short lists are plain Python values; the two noise tables
+    (also used as chart data) are (filters x times) arrays. If an
+    ExposureMatrix is given, the shortest-L-sub cameras are included too;
+    the camera sweeps are None unless p names a CAMERA_DB camera.
+    """
+    g = ResultGraph(matrix)
+    g.update(p)
+    return g.values
+
+
+class ResultCache:
+    """Bounded LRU memo of result bundles keyed on the normalized numeric inputs."""
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(p):
+        p = _normalize(p)
+        return tuple(p[k] for k in RESULT_KEYS + CAMERA_KEYS)
+
+    def get(self, key):
+        bundle = self._data.get(key)
+        if bundle is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return bundle
+
+    def put(self, key, bundle):
+        self._data[key] = bundle
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data), "maxsize": self.maxsize}
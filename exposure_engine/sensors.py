@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Sensor database (gain presets, dark current vs temperature) and brand -> model camera index.
+
+SENSORS is the built-in table; an external camera file, when present, is merged
+over it (camera_store.py) and CAMERA_DB then reads from its compiled index.
+CAMERA_DB and CAMERA_DB_COUNTS are loaded on first access (module __getattr__),
+so importing the package does not probe the disk.
+"""
+
+SENSORS = {
+    "IMX571": {"bits":16, "gains":{"Gain 0":{"rn":3.25,"ge":0.75,"offset":40,"fw":50000},"Gain 100 (HCG)":{"rn":1.4,"ge":0.21,"offset":40,"fw":15000}}, "temps":{0:0.002,-5:0.00125,-10:0.00075,-15:0.00037,-20:0.00012,-25:0.00012},
+        "cameras":{"ZWO":["ASI2600MM Pro","ASI2600MC Pro"],"QHY":["QHY268M","QHY268C"],"Moravian":["C3-26000"],"Player One":["Poseidon-M Pro","Poseidon-C Pro"],"ToupTek":["ATR2600M","ATR2600C"],"ATIK":["Horizon II"]}},
+    "IMX455": {"bits":16, "gains":{"Gain 0":{"rn":3.5,"ge":0.78,"offset":50,"fw":51400},"Gain 100 (HCG)":{"rn":1.2,"ge":0.25,"offset":50,"fw":21000}}, "temps":{0:0.0017,-5:0.001,-10:0.0006,-15:0.0003,-20:0.00015,-25:0.00008},
+        "cameras":{"ZWO":["ASI6200MM Pro","ASI6200MC Pro"],"QHY":["QHY600M","QHY600C"],"Moravian":["C3-61000"],"Player One":["Poseidon-M FF Pro"],"ToupTek":["ATR6200M"]}},
+    "IMX533": {"bits":14, "gains":{"Gain 0":{"rn":3.1,"ge":3.1,"offset":5,"fw":50000},"Gain 100 (HCG)":{"rn":1.0,"ge":0.8,"offset":5,"fw":13000}}, "temps":{0:0.0008,-5:0.0004,-10:0.0002,-15:0.0001,-20:0.00005,-25:0.00003},
+        "cameras":{"ZWO":["ASI533MM Pro","ASI533MC Pro"],"QHY":["QHY533M","QHY533C"],"Player One":["Ares-M Pro","Ares-C Pro"],"ToupTek":["ATR533M","ATR533C"]}},
+    "IMX294": {"bits":14, "gains":{"Gain 0":{"rn":3.6,"ge":3.5,"offset":10,"fw":66400},"Gain 120 (HCG)":{"rn":1.2,"ge":0.9,"offset":10,"fw":17000}}, "temps":{0:0.01,-5:0.006,-10:0.004,-15:0.003,-20:0.0022,-25:0.0015},
+        "cameras":{"ZWO":["ASI294MM Pro","ASI294MC Pro"],"QHY":["QHY294M","QHY294C"],"Player One":["Artemis-M Pro","Artemis-C Pro"]}},
+    "IMX183": {"bits":12, "gains":{"Gain 0":{"rn":3.0,"ge":3.6,"offset":10,"fw":15000},"Gain 120":{"rn":2.2,"ge":1.0,"offset":10,"fw":4500}}, "temps":{0:0.007,-5:0.0042,-10:0.0035,-15:0.00298,-20:0.00298,-25:0.00298},
+        "cameras":{"ZWO":["ASI183MM Pro","ASI183MC Pro"],"QHY":["QHY183M","QHY183C"]}},
+    "MN34230": {"bits":12, "gains":{"Gain 0":{"rn":3.6,"ge":5.0,"offset":50,"fw":10000},"Gain 76 (Unity)":{"rn":2.5,"ge":1.65,"offset":50,"fw":6000},"Gain 139 (HCG)":{"rn":1.7,"ge":1.0,"offset":50,"fw":4000}}, "temps":{0:0.03125,-5:0.018,-10:0.0136,-15:0.009,-20:0.0062,-25:0.0062},
+        "cameras":{"ZWO":["ASI1600MM Pro","ASI1600MC Pro"],"QHY":["QHY163M","QHY163C"]}},
+    "IMX585": {"bits":12, "gains":{"Gain 0":{"rn":3.3,"ge":2.7,"offset":10,"fw":40000},"Gain 250":{"rn":0.8,"ge":0.12,"offset":10,"fw":5000}}, "temps":{0:0.015,-5:0.009,-10:0.005,-15:0.003,-20:0.002,-25:0.001},
+        "cameras":{"ZWO":["ASI585MC"],"QHY":["QHY5III585C"],"Player One":["Neptune-C II"],"ToupTek":["ATR585MC"]}},
+    "IMX174": {"bits":12, "gains":{"Gain 0":{"rn":5.7,"ge":2.58,"offset":10,"fw":32400}}, "temps":{0:0.04,-5:0.025,-10:0.015,-15:0.01,-20:0.007,-25:0.005},
+        "cameras":{"ZWO":["ASI174MM","ASI174MC"]}},
+    "IMX224": {"bits":12, "gains":{"Gain 0":{"rn":6.7,"ge":3.85,"offset":10,"fw":63700}}, "temps":{0:0.05,-5:0.03,-10:0.018,-15:0.011,-20:0.007,-25:0.005},
+        "cameras":{"ZWO":["ASI224MC"]}},
+    "AR0130": {"bits":12, "gains":{"Gain 0":{"rn":6.0,"ge":3.3,"offset":10,"fw":20000}}, "temps":{0:0.05,-5:0.03,-10:0.02,-15:0.012,-20:0.008,-25:0.005},
+        "cameras":{"ZWO":["ASI120MM","ASI120MC"]}},
+    "IMX290": {"bits":12, "gains":{"Gain 0":{"rn":3.3,"ge":2.12,"offset":10,"fw":14600}}, "temps":{0:0.03,-5:0.018,-10:0.011,-15:0.007,-20:0.004,-25:0.003},
+        "cameras":{"ZWO":["ASI290MM","ASI290MC"],"QHY":["QHY290M","QHY290C"]}},
+    "IMX461": {"bits":16, "gains":{"Gain 0":{"rn":3.6,"ge":0.78,"offset":50,"fw":51000},"Gain 100 (HCG)":{"rn":1.4,"ge":0.25,"offset":50,"fw":20000}}, "temps":{0:0.002,-5:0.0012,-10:0.0007,-15:0.0004,-20:0.0002,-25:0.0001},
+        "cameras":{"QHY":["QHY461M","QHY411"],"Moravian":["C3-100000"]}},
+    "IMX071": {"bits":14, "gains":{"Gain 0":{"rn":3.3,"ge":3.2,"offset":10,"fw":50000},"Gain 90":{"rn":2.5,"ge":0.8,"offset":10,"fw":12000}}, "temps":{0:0.015,-5:0.01,-10:0.006,-15:0.004,-20:0.003,-25:0.002},
+        "cameras":{"ZWO":["ASI071MC Pro"]}},
+    "ICX825": {"bits":16, "gains":{"Unique":{"rn":5.0,"ge":0.27,"offset":10,"fw":18000}}, "temps":{-10:0.0005},
+        "cameras":{"ATIK":["One 6.0","Infinity"]}},
+    "IMX410": {"bits":16, "gains":{"Gain 0":{"rn":3.4,"ge":0.93,"offset":50,"fw":75000},"Gain 100 (HCG)":{"rn":1.3,"ge":0.28,"offset":50,"fw":22000}}, "temps":{0:0.003,-5:0.002,-10:0.001,-15:0.0006,-20:0.0003,-25:0.00015},
+        "cameras":{"ZWO":["ASI2400MC Pro"]}},
+    "IMX678": {"bits":12, "gains":{"Gain 0":{"rn":3.2,"ge":4.5,"offset":10,"fw":18000},"Gain 200":{"rn":0.7,"ge":0.15,"offset":10,"fw":3000}}, "temps":{0:0.01,-5:0.006,-10:0.004,-15:0.002,-20:0.001,-25:0.0006},
+        "cameras":{"ZWO":["ASI678MC"],"Player One":["Uranus-C Pro"]}},
+}
+
+def build_camera_db():
+    db = {}
+    for sn, s in SENSORS.items():
+        for brand, models in s["cameras"].items():
+            if brand not in db:
+                db[brand] = {}
+            for m in models:
+                db[brand][f"{m}  [{sn}]"] = {"sensor": sn, "gains": s["gains"], "temps": s["temps"], "bits": s["bits"]}
+    return {b: dict(sorted(db[b].items())) for b in sorted(db.keys())}
+
+def _load_camera_db():
+    """External camera file merged over SENSORS when there is one (see camera_store.py), else the built-in table."""
+    from .camera_store import load_camera_db
+    db = load_camera_db(SENSORS)
+    if db is not None:
+        return db, {"cameras": db.n_cameras, "sensors": db.n_sensors}
+    db = build_camera_db()
+    return db, {"cameras": sum(len(m) for m in db.values()), "sensors": len(SENSORS)}
+
+def __getattr__(name):
+    if name in ("CAMERA_DB", "CAMERA_DB_COUNTS"):
+        global CAMERA_DB, CAMERA_DB_COUNTS
+        CAMERA_DB, CAMERA_DB_COUNTS = _load_camera_db()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def find_camera(name, brand=None):
+    """Look up a camera by display key ("ASI2600MM Pro  [IMX571]") or bare model name, case-insensitive."""
+    from .camera_index import camera_index
+    return camera_index().get(name, brand)
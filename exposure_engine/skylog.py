@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+"""
+Sky-brightness logs — streams long CSV / JSONL logs of timestamped sky levels
+and turns them into per-sample, rolling-window and per-hour sub-length
+recommendations, in constant memory.
+
+    python ExposureCalculator.py --sky-log sqm.csv --schedule schedule.csv
+    python ExposureCalculator.py --sky-log sky.jsonl -o samples.jsonl --window 20 --camera "ASI2600MM Pro"
+
+Each row needs a timestamp (time / timestamp / datetime / date / ts / utc,
+ISO 8601 or epoch seconds, read as wall-clock time) and one of:
+
+- sky_L / sky_RGB / sky_NB12 / sky_NB7 / sky_NB3 columns (e-/px/s)
+- a sky value, with an optional filter (default L)
+- an sqm value (mag/arcsec^2)
+
+Filters missing from a row are scaled from the reference sky levels (the
+GUI defaults, or --set sky_L=...) by the same brightness ratio. For an SQM
+reading that ratio is 10^(-0.4 (sqm - sqm_ref)). NB3 defaults to NB12 / 4.
+
+Rows are processed in chunks of NumPy arrays. The rolling window only keeps
+the samples of the last `window` seconds. An hour is emitted as soon as the
+log moves past it, so memory does not grow with the log (multi-night,
+multi-million rows). Timestamps are expected in order; a backward jump
+starts a new segment (new window, new hour).
+"""
+
+import argparse, math, os, sys, time
+from datetime import datetime, timedelta
+
+from .core import FILTERS, EXP_KEYS, DEFAULT_PARAMS, c_factor, optimal_time_grid, additional_noise_grid
+from .batch import _FILTER_ALIASES, _SKY_KEYS, _SUFFIXES, _Writer, _guess_format, _num, read_rows, resolve_row
+
+TIME_KEYS = ("time", "timestamp", "datetime", "date", "ts", "utc")
+_EPOCH = datetime(1970, 1, 1)
+
+SAMPLE_FIELDS = (
+    ["time"]
+    + [f"sky_{s}" for s in _SUFFIXES] + [f"opt_{s}" for s in _SUFFIXES] + [f"noise_{s}" for s in _SUFFIXES]
+    + [f"roll_sky_{s}" for s in _SUFFIXES] + [f"roll_opt_{s}" for s in _SUFFIXES] + [f"roll_noise_{s}" for s in _SUFFIXES]
+)
+SCHEDULE_FIELDS = (
+    ["hour", "night", "samples"]
+    + [f"sky_{s}" for s in _SUFFIXES] + [f"sub_{s}" for s in _SUFFIXES]
+    + [f"sub_min_{s}" for s in _SUFFIXES] + [f"sub_max_{s}" for s in _SUFFIXES]
+)
+
+
+def parse_time(v):
+    """Wall-clock seconds since 1970-01-01 (the UTC offset of ISO strings is ignored), or None."""
+    if v is None:
+        return None
+    if isinstance(v, (int, float)):
+        return float(v)
+    v = str(v).strip()
+    if not v:
+        return None
+    try:
+        return float(v)
+    except ValueError:
+        pass
+    try:
+        dt = datetime.fromisoformat(v.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return (dt.replace(tzinfo=None) - _EPOCH).total_seconds()
+
+
+def format_time(sec):
+    return (_EPOCH + timedelta(seconds=sec)).isoformat(timespec="seconds")
+
+
+def row_skies(row, ref, sqm_ref=21.0):
+    """Sky level per filter (FILTERS order) for one log row, or None if the row has none."""
+    explicit = {}
+    for i, sk in enumerate(_SKY_KEYS):
+        v = _num(row.get(sk))
+        if v is not None:
+            explicit[i] = float(v)
+    sqm, sky = _num(row.get("sqm")), _num(row.get("sky"))
+    if sqm is not None:
+        k = 10 ** (-0.4 * (float(sqm) - sqm_ref))
+    elif sky is not None:
+        flt = row.get("filter")
+        sk = _FILTER_ALIASES.get(str(flt).replace(" ", "").replace("nm", "").upper()) if flt else "sky_L"
+        if sk is None:
+            raise ValueError(f"unknown filter {flt!r}")
+        i = _SKY_KEYS.index(sk)
+        explicit[i] = float(sky)
+        k = float(sky) / ref[i] if ref[i] > 0 else 1.0
+    elif explicit:
+        i = min(explicit)
+        k = explicit[i] / ref[i] if ref[i] > 0 else 1.0
+    else:
+        return None
+    out = [explicit.get(i, ref[i] * k) for i in range(len(ref))]
+    if 4 not in explicit and 2 in explicit:
+        out[4] = out[2] / 4.0
+    return out
+
+
+def iter_samples(rows, ref, sqm_ref=21.0, stats=None):
+    """Yield (time string, wall-clock seconds, skies) for every usable row; unusable rows are counted in stats."""
+    for row in rows:
+        tkey = next((k for k in TIME_KEYS if k in row), None)
+        t = parse_time(row.get(tkey)) if tkey else None
+        try:
+            skies = row_skies(row, ref, sqm_ref) if t is not None else None
+        except (ValueError, TypeError):
+            skies = None
+        if skies is None:
+            if stats is not None:
+                stats["skipped"] = stats.get("skipped", 0) + 1
+            continue
+        yield row[tkey], t, skies
+
+
+class SkyLogProcessor:
+    """Chunked rolling-window and hourly aggregation of sky samples for one sensor / noise setting.
+
+    feed() takes a chunk of samples and returns the per-sample results as
+    arrays; completed hours are appended to `hours` for the caller to take.
+    """
+
+    def __init__(self, p, window=1800.0):
+        import numpy as np
+        self.rn = p["rn"]
+        self.cf = c_factor(p["noise_pct"])
+        self.exps = np.array([p[EXP_KEYS[fn]] for fn, _ in FILTERS], dtype=float)
+        self.window = float(window)
+        if not self.window > 0:
+            raise ValueError(f"window must be > 0 s, got {window!r}")
+        self.hours = []
+        self.rows = 0
+        self.segments = 0
+        self._tail_t = np.empty(0)
+        self._tail_s = np.empty((0, len(FILTERS)))
+        self._hour = None
+
+    def _evaluate(self, skies):
+        opt = optimal_time_grid(self.cf, self.rn, skies)
+        noise = additional_noise_grid(self.exps, skies, self.rn)
+        return opt, noise
+
+    def feed(self, t, skies):
+        import numpy as np
+        t = np.asarray(t, dtype=float)
+        skies = np.asarray(skies, dtype=float).reshape(len(t), len(FILTERS))
+        # Split at backward jumps (and at a jump back from the previous chunk)
+        prev = self._tail_t[-1] if len(self._tail_t) else -np.inf
+        breaks = np.flatnonzero(np.diff(np.r_[prev, t]) < 0)
+        roll = np.empty_like(skies)
+        for a, b in zip(np.r_[0, breaks], np.r_[breaks, len(t)]):
+            if a == b:
+                continue
+            if a in breaks:
+                self._new_segment()
+            roll[a:b] = self._roll(t[a:b], skies[a:b])
+            self._aggregate(t[a:b], skies[a:b])
+        self.rows += len(t)
+        opt, noise = self._evaluate(skies)
+        roll_opt, roll_noise = self._evaluate(roll)
+        return {"t": t, "sky": skies, "opt": opt, "noise": noise,
+                "roll_sky": roll, "roll_opt": roll_opt, "roll_noise": roll_noise}
+
+    def _new_segment(self):
+        import numpy as np
+        self._close_hour()
+        self._tail_t = np.empty(0)
+        self._tail_s = np.empty((0, len(FILTERS)))
+        self.segments += 1
+
+    def _roll(self, t, skies):
+        """Mean sky over (t - window, t] for each sample, using the carried tail of the previous chunk."""
+        import numpy as np
+        tt = np.r_[self._tail_t, t]
+        ss = np.vstack([self._tail_s, skies])
+        cs = np.vstack([np.zeros((1, ss.shape[1])), np.cumsum(ss, axis=0)])
+        i = np.arange(len(self._tail_t), len(tt))
+        j = np.searchsorted(tt, tt[i] - self.window, side="right")
+        mean = (cs[i + 1] - cs[j]) / (i + 1 - j)[:, None]
+        keep = tt > tt[-1] - self.window
+        self._tail_t, self._tail_s = tt[keep], ss[keep]
+        return mean
+
+    def _aggregate(self, t, skies):
+        import numpy as np
+        hour = np.floor(t / 3600.0).astype(np.int64)
+        opt = optimal_time_grid(self.cf, self.rn, skies)
+        starts = np.flatnonzero(np.r_[True, hour[1:] != hour[:-1]])
+        ends = np.r_[starts[1:], len(hour)]
+        for a, b in zip(starts, ends):
+            h = int(hour[a])
+            if self._hour is not None and self._hour[0] != h:
+                self._close_hour()
+            if self._hour is None:
+                self._hour = [h, 0, np.zeros(len(FILTERS)), np.full(len(FILTERS), np.inf), np.zeros(len(FILTERS))]
+            acc = self._hour
+            acc[1] += int(b - a)
+            acc[2] += skies[a:b].sum(axis=0)
+            acc[3] = np.minimum(acc[3], opt[a:b].min(axis=0))
+            acc[4] = np.maximum(acc[4], opt[a:b].max(axis=0))
+
+    def _close_hour(self):
+        if self._hour is None:
+            return
+        h, n, total, lo, hi = self._hour
+        mean = total / n
+        sub = optimal_time_grid(self.cf, self.rn, mean)
+        row = {"hour": format_time(h * 3600), "night": format_time(h * 3600 - 12 * 3600)[:10], "samples": n}
+        for f, s in enumerate(_SUFFIXES):
+            row[f"sky_{s}"] = round(float(mean[f]), 5)
+        for key, arr in (("sub", sub), ("sub_min", lo), ("sub_max", hi)):
+            for f, s in enumerate(_SUFFIXES):
+                v = float(arr[f])
+                row[f"{key}_{s}"] = int(v) if v != float("inf") else v
+        self.hours.append(row)
+        self._hour = None
+
+    def finish(self):
+        """Close the last hour; returns the hours not taken yet."""
+        self._close_hour()
+        hours, self.hours = self.hours, []
+        return hours
+
+
+def _chunks(samples, size):
+    times, ts, skies = [], [], []
+    for raw, t, s in samples:
+        times.append(raw)
+        ts.append(t)
+        skies.append(s)
+        if len(ts) >= size:
+            yield times, ts, skies
+            times, ts, skies = [], [], []
+    if ts:
+        yield times, ts, skies
+
+
+def _sample_rows(times, res):
+    import numpy as np
+    cols = [times]
+    for k in ("sky", "opt", "noise", "roll_sky", "roll_opt", "roll_noise"):
+        arr = res[k]
+        for f in range(arr.shape[1]):
+            v = arr[:, f]
+            if k.endswith("opt"):
+                # Whole seconds, inf where the sky is unknown / zero (as in the batch output)
+                cols.append(v.astype(np.int64).tolist() if np.isfinite(v).all() else
+                            [int(x) if x != float("inf") else x for x in v.tolist()])
+            else:
+                cols.append(np.round(v * 100, 4).tolist() if k.endswith("noise") else np.round(v, 5).tolist())
+    return (dict(zip(SAMPLE_FIELDS, vals)) for vals in zip(*cols))
+
+
+def run_sky_log(src, p, in_fmt="csv", samples_dst=None, schedule_dst=None, out_fmt=None,
+                window=1800.0, sqm_ref=21.0, chunk_size=8192, progress=None):
+    """Stream a sky log; returns (rows, hours, skipped, seconds)."""
+    ref = [p[sk] for sk in _SKY_KEYS]
+    stats = {}
+    proc = SkyLogProcessor(p, window)
+    samples_out = _Writer(samples_dst, out_fmt or in_fmt, SAMPLE_FIELDS) if samples_dst is not None else None
+    schedule_out = _Writer(schedule_dst, out_fmt or in_fmt, SCHEDULE_FIELDS) if schedule_dst is not None else None
+    n_hours = 0
+    start = last = time.perf_counter()
+
+    def _emit(hours):
+        nonlocal n_hours
+        n_hours += len(hours)
+        if schedule_out is not None:
+            for h in hours:
+                schedule_out.write(h)
+
+    for times, ts, skies in _chunks(iter_samples(read_rows(src, in_fmt), ref, sqm_ref, stats), chunk_size):
+        res = proc.feed(ts, skies)
+        if samples_out is not None:
+            for row in _sample_rows(times, res):
+                samples_out.write(row)
+        _emit(proc.hours)
+        proc.hours = []
+        if progress:
+            now = time.perf_counter()
+            if now - last >= 1.0:
+                last = now
+                progress(proc.rows, now - start)
+    _emit(proc.finish())
+    for dst in (samples_dst, schedule_dst):
+        if dst is not None:
+            dst.flush()
+    return proc.rows, n_hours, stats.get("skipped", 0), time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="ExposureCalculator.py --sky-log",
+                                     description="Rolling and per-hour optimal sub lengths from a sky-brightness log.")
+    parser.add_argument("--sky-log", metavar="INPUT", required=True, help="CSV or JSONL log, '-' for stdin")
+    parser.add_argument("-o", "--output", help="per-sample output file ('-' for stdout)")
+    parser.add_argument("--schedule", help="per-hour schedule file (default: stdout when -o is not given)")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="input format (default: from extension, else csv)")
+    parser.add_argument("--output-format", choices=("csv", "jsonl"), help="output format (default: same as input)")
+    parser.add_argument("--window", type=float, default=30.0, help="rolling window in minutes (default 30)")
+    parser.add_argument("--sqm-ref", type=float, default=21.0, help="SQM at which the reference sky levels apply")
+    parser.add_argument("--camera", help="camera from the database (sets rn, ge, offset, bits)")
+    parser.add_argument("--brand", help="camera brand, if the model name is ambiguous")
+    parser.add_argument("--gain", help="gain preset of --camera")
+    parser.add_argument("--temp", help="sensor temperature of --camera")
+    parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                        help="override a numeric input (rn, noise_pct, sky_L, exp_L, ...); repeatable")
+    parser.add_argument("--chunk-size", type=int, default=8192, help="samples per vectorized chunk")
+    parser.add_argument("-q", "--quiet", action="store_true", help="no throughput counter on stderr")
+    args = parser.parse_args(argv)
+    if not args.window > 0:
+        parser.error(f"--window must be > 0 minutes, got {args.window:g}")
+
+    row = {k: v for k, v in (("camera", args.camera), ("brand", args.brand), ("gain", args.gain), ("temp", args.temp)) if v}
+    for item in args.set:
+        key, sep, value = item.partition("=")
+        if not sep:
+            parser.error(f"--set expects KEY=VALUE, got {item!r}")
+        row[key.strip()] = value.strip()
+    try:
+        p = resolve_row(row)
+    except (ValueError, TypeError) as e:
+        parser.error(str(e))
+    if any(math.isnan(p[sk]) for sk in _SKY_KEYS):
+        # Reference skies not given: the GUI defaults
+        for sk in _SKY_KEYS:
+            if math.isnan(p[sk]):
+                p[sk] = DEFAULT_PARAMS.get(sk, DEFAULT_PARAMS["sky_NB12"] / 4.0)
+
+    in_fmt = args.format or _guess_format(args.sky_log)
+    schedule = args.schedule or (None if args.output else "-")
+    out_fmt = args.output_format or in_fmt
+
+    def _open(path):
+        if path is None:
+            return None
+        return sys.stdout if path == "-" else open(path, "w", newline="", encoding="utf-8")
+
+    def _progress(n, secs):
+        sys.stderr.write(f"\r[sky-log] {n} samples  {n / secs:,.0f} samples/s")
+        sys.stderr.flush()
+
+    src = sys.stdin if args.sky_log == "-" else open(args.sky_log, "r", newline="", encoding="utf-8")
+    samples_dst, schedule_dst = _open(args.output), _open(schedule)
+    try:
+        n, hours, skipped, secs = run_sky_log(src, p, in_fmt, samples_dst, schedule_dst, out_fmt,
+                                              args.window * 60, args.sqm_ref, max(1, args.chunk_size),
+                                              None if args.quiet else _progress)
+    finally:
+        for f in (src, samples_dst, schedule_dst):
+            if f is not None and f not in (sys.stdin, sys.stdout):
+                f.close()
+    if not args.quiet:
+        sys.stderr.write(f"\r[sky-log] {n} samples, {hours} hours, {skipped} skipped rows in {secs:.2f} s "
+                         f"({n / secs if secs > 0 else 0:,.0f} samples/s)\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Dark-current-aware noise model and stacked SNR.
+
+Per sub of t seconds (all rates in e-/s/px):
+
+    sigma_sub = sqrt(RN^2 + (Signal + Sky + DC) * t)
+
+The approach-2 functions of core.py ignore DC (sky-limited model of the
+original spreadsheet). Here DC adds a noise floor that longer subs cannot
+remove, so the accepted additional noise may become unreachable on a warm
+sensor or under a dark narrowband sky:
+
+    Add_noise_dc = sqrt((RN^2 + (Sky + DC) * t) / (Sky * t)) - 1
+    T_optimal_dc = ceil(RN^2 / (Sky / C - DC))      (inf if Sky / C <= DC)
+
+Stacking N = floor(budget / t) subs of a target of `signal` e-/s/px gives
+
+    SNR = Signal * t * sqrt(N) / sigma_sub
+
+and the efficiency is SNR over the ideal SNR of the whole budget without
+read noise and dark current. All functions broadcast over sub length and
+filter (sky).
+"""
+
+
+def sub_noise_grid(t, sky, rn, dc, signal=0.0):
+    import numpy as np
+    t, sky, rn, dc, signal = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (t, sky, rn, dc, signal)))
+    return np.sqrt(rn * rn + (signal + sky + dc) * np.maximum(t, 0))
+
+def additional_noise_dc_grid(t, sky, rn, dc):
+    import numpy as np
+    t, sky, rn, dc = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (t, sky, rn, dc)))
+    valid = (t > 0) & (sky > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.sqrt((rn * rn + (sky + dc) * t) / (sky * t)) - 1
+    return np.where(valid, out, 0.0)
+
+def optimal_time_dc_grid(c, rn, sky, dc):
+    import numpy as np
+    c, rn, sky, dc = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (c, rn, sky, dc)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        room = sky / c - dc
+        out = np.ceil(rn * rn / room)
+    return np.where((sky > 0) & (room > 0), out, np.inf)
+
+def stack_snr_grid(t, sky, rn, dc, signal, budget):
+    """Stacked SNR of floor(budget / t) subs: returns (snr, n_subs, efficiency) arrays."""
+    import numpy as np
+    t, sky, rn, dc, signal, budget = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (t, sky, rn, dc, signal, budget)))
+    ok = (t > 0) & np.isfinite(t) & (budget > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n = np.where(ok, np.floor(budget / np.where(ok, t, 1.0)), 0.0)
+        snr = np.where(n > 0, signal * t * np.sqrt(n) / sub_noise_grid(t, sky, rn, dc, signal), 0.0)
+        ideal = signal * np.sqrt(budget) / np.sqrt(signal + sky)
+        eff = np.where(ideal > 0, snr / ideal, 0.0)
+    return np.nan_to_num(snr), n.astype(np.int64), np.nan_to_num(eff)
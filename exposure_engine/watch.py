@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+Watch a capture folder and measure each new FITS sub as soon as it is complete.
+
+    w = FolderWatcher("captures/tonight", on_result=print, median_sf3=412, median_sf10=1236)
+    w.start()
+    ...
+    w.set_targets(430, 1290)    # after a parameter change
+    w.history()                 # [(time, name, sky_median, status), ...], oldest first
+    w.stop()
+
+New files are reported by inotify on Linux (IN_CLOSE_WRITE / IN_MOVED_TO,
+through ctypes, no extra package) and by polling the directory elsewhere.
+A file counts as complete once its size reaches the header offset plus the
+data size given by NAXIS/BITPIX. Capture programs that write in several
+passes are covered, because incomplete files are checked again on the next tick.
+
+Complete files go through a bounded queue to a few worker threads (the
+measure is mostly memory-mapped I/O and NumPy selection, which release the
+GIL). When the queue is full the watcher thread waits, and new events stay
+in the kernel buffer or the next directory scan. `on_result` runs on a
+worker thread, so a GUI has to hand it over to its own thread.
+"""
+
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+from collections import deque
+
+from .fits import FITS_EXTENSIONS, _DTYPES, classify_median, measure_file, read_header
+
+WATCH_BACKENDS = ("inotify", "poll")
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT = struct.Struct("iIII")
+
+
+def data_complete(path):
+    """True once a FITS file holds its whole primary data unit (False while it is being written)."""
+    try:
+        header, offset = read_header(path)
+        size = os.path.getsize(path)
+    except (OSError, ValueError):
+        return False
+    if header.get("BITPIX") not in _DTYPES:
+        return size > offset
+    n = 1
+    for i in range(1, int(header.get("NAXIS", 0)) + 1):
+        n *= int(header.get(f"NAXIS{i}", 0))
+    return size >= offset + n * abs(header["BITPIX"]) // 8
+
+
+class _Inotify:
+    """Minimal non-blocking inotify watch of one directory (Linux only)."""
+
+    def __init__(self, directory):
+        import ctypes, ctypes.util      # Linux watch only: not paid by a package import
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), _IN_CLOSE_WRITE | _IN_MOVED_TO) < 0:
+            err = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(err, f"inotify_add_watch failed on {directory}")
+
+    def read(self, timeout):
+        """File names written or moved in during `timeout` seconds."""
+        import select
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return []
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        names, i = [], 0
+        while i + _EVENT.size <= len(buf):
+            _, _, _, length = _EVENT.unpack_from(buf, i)
+            i += _EVENT.size
+            names.append(os.fsdecode(buf[i:i + length].rstrip(b"\0")))
+            i += length
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+
+class FolderWatcher:
+    """Background watch of a capture folder; see the module docstring."""
+
+    def __init__(self, directory, on_result=None, median_sf3=None, median_sf10=None, workers=2,
+                 max_pending=8, history=1000, poll_interval=1.0, backend=None, samples=1 << 20):
+        if backend not in (None,) + WATCH_BACKENDS:
+            raise ValueError(f"backend must be one of {WATCH_BACKENDS}")
+        self.directory = os.path.abspath(directory)
+        self.on_result = on_result
+        self.poll_interval = poll_interval
+        self.samples = samples
+        self.backend = backend or ("inotify" if sys.platform.startswith("linux") else "poll")
+        self._targets = (median_sf3, median_sf10)
+        self._workers = max(1, int(workers))
+        self._queue = queue.Queue(maxsize=max(1, int(max_pending)))
+        self._history = deque(maxlen=max(1, int(history)))
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+        self._counts = {"seen": 0, "analyzed": 0, "errors": 0, "busy_s": 0.0}
+
+    # --- control ---
+
+    def start(self):
+        if self._threads:
+            return self
+        self._stop.clear()
+        source = None
+        if self.backend == "inotify":
+            try:
+                source = _Inotify(self.directory)
+            except (OSError, AttributeError):
+                self.backend = "poll"
+        self._threads = [threading.Thread(target=self._watch, args=(source,), daemon=True, name="fits-watch")]
+        self._threads += [threading.Thread(target=self._work, daemon=True, name=f"fits-measure-{i}")
+                          for i in range(self._workers)]
+        for t in self._threads:
+            t.start()
+        return self
+
+    def stop(self, timeout=2.0):
+        self._stop.set()
+        for t in self._threads:
+            t.join(timeout)
+        self._threads = []
+
+    @property
+    def history_size(self):
+        return self._history.maxlen
+
+    @property
+    def running(self):
+        return bool(self._threads) and not self._stop.is_set()
+
+    def set_targets(self, median_sf3, median_sf10):
+        """New SF x3 / SF x10 medians; the history statuses are re-evaluated."""
+        with self._lock:
+            self._targets = (median_sf3, median_sf10)
+            self._history = deque(((t, n, m, classify_median(m, median_sf3, median_sf10) if median_sf3 is not None else None)
+                                   for t, n, m, _ in self._history), maxlen=self._history.maxlen)
+
+    def history(self):
+        with self._lock:
+            return list(self._history)
+
+    def stats(self):
+        with self._lock:
+            statuses = [h[3] for h in self._history]
+            return dict(self._counts, backend=self.backend, pending=self._queue.qsize(),
+                        low=statuses.count("low"), ok=statuses.count("ok"), high=statuses.count("high"))
+
+    # --- threads ---
+
+    def _watch(self, source):
+        waiting = {}        # path -> last seen (size, mtime), files not complete yet
+        known = set(self._list()) if source is None else set()
+        try:
+            while not self._stop.is_set():
+                if source is not None:
+                    names = source.read(min(self.poll_interval, 0.5))
+                    new = [os.path.join(self.directory, n) for n in names if n.lower().endswith(FITS_EXTENSIONS)]
+                else:
+                    self._stop.wait(self.poll_interval)
+                    listed = self._list()
+                    new = [p for p in listed if p not in known]
+                    known = set(listed)
+                for p in new:
+                    if p not in waiting:
+                        waiting[p] = None
+                        with self._lock:
+                            self._counts["seen"] += 1
+                for p in list(waiting):
+                    try:
+                        st = os.stat(p)
+                    except OSError:
+                        del waiting[p]
+                        continue
+                    sig = (st.st_size, st.st_mtime_ns)
+                    # Polling: also wait for one unchanged scan, inotify already saw the close
+                    settled = source is not None or waiting[p] == sig
+                    waiting[p] = sig
+                    if settled and data_complete(p) and self._put(p):
+                        del waiting[p]
+        finally:
+            if source is not None:
+                source.close()
+            for _ in range(self._workers):
+                try:
+                    self._queue.put_nowait(None)
+                except queue.Full:
+                    pass
+
+    def _put(self, path):
+        # Backpressure: block this thread (never the caller's) while the workers are behind
+        while not self._stop.is_set():
+            try:
+                self._queue.put(path, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _work(self):
+        while True:
+            try:
+                path = self._queue.get(timeout=0.2)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                continue
+            if path is None:
+                return
+            t0 = time.perf_counter()
+            res = measure_file(path, self.samples)
+            with self._lock:
+                sf3, sf10 = self._targets
+                res["status"] = classify_median(res.get("sky_median"), sf3, sf10) if sf3 is not None else None
+                res["time"] = time.time()
+                self._counts["analyzed" if not res.get("error") else "errors"] += 1
+                self._counts["busy_s"] += time.perf_counter() - t0
+                if not res.get("error"):
+                    self._history.append((res["time"], res["name"], res["sky_median"], res["status"]))
+            if self.on_result is not None:
+                try:
+                    self.on_result(res)
+                except Exception:
+                    pass
+
+    def _list(self):
+        try:
+            with os.scandir(self.directory) as it:
+                return [e.path for e in it if e.is_file() and e.name.lower().endswith(FITS_EXTENSIONS)]
+        except OSError:
+            return []
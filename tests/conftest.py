@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+# The engine is imported from the checkout (there is no installed package)
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+import math
+
+import pytest
+
+from exposure_engine import c_factor, optimal_time, find_camera
+from exposure_engine.batch import compute_chunk, iter_results, read_rows, resolve_row, run_batch
+
+SENSOR = {"rn": "2.0", "ge": "0.5", "bits": "16", "offset": "20", "dc": "0.01"}
+
+
+def test_camera_row_uses_the_database_preset():
+    p = resolve_row({"camera": "ASI2600MM Pro", "gain": "100", "sky_L": "1.5"})
+    g = find_camera("ASI2600MM Pro")["gains"]["Gain 100 (HCG)"]
+    assert (p["rn"], p["ge"], p["offset"], p["bits"]) == (g["rn"], g["ge"], g["offset"], 16)
+
+
+def test_camera_temp_sets_dark_current():
+    warm = resolve_row({"camera": "ASI2600MM Pro", "temp": "0"})
+    cold = resolve_row({"camera": "ASI2600MM Pro", "temp": "-20"})
+    assert warm["dc"] > cold["dc"] > 0
+
+
+def test_explicit_columns_override_the_camera():
+    p = resolve_row({"camera": "ASI2600MM Pro", "rn": "9.5"})
+    assert p["rn"] == 9.5
+
+
+def test_explicit_sensor_row():
+    row = compute_chunk([dict(SENSOR, sky_L="2.0")])[0]
+    assert "error" not in row
+    assert row["opt_L"] == int(optimal_time(c_factor(5.0), 2.0, 2.0))
+    assert row["opt_dc_L"] >= row["opt_L"]
+    # Skies not given stay empty instead of being computed from a made-up level
+    assert row["opt_RGB"] is None and row["snr_NB12"] is None
+
+
+def test_filter_and_sky_pair():
+    p = resolve_row(dict(SENSOR, filter="NB 7 nm", sky="0.1"))
+    assert p["sky_NB7"] == 0.1
+    assert math.isnan(p["sky_L"])
+    with pytest.raises(ValueError, match="unknown filter"):
+        resolve_row(dict(SENSOR, filter="Halpha", sky="0.1"))
+
+
+def test_nb3_defaults_to_a_quarter_of_nb12():
+    assert resolve_row(dict(SENSOR, sky_NB12="0.4"))["sky_NB3"] == pytest.approx(0.1)
+    assert resolve_row(dict(SENSOR, sky_NB12="0.4", sky_NB3="0.3"))["sky_NB3"] == 0.3
+
+
+def test_invalid_json_lines_become_error_rows():
+    src = io.StringIO('{"rn": 2, "ge": 0.5, "sky_L": 1}\nnot json\n\n[1, 2]\n')
+    rows = compute_chunk(list(read_rows(src, "jsonl")))
+    assert len(rows) == 3
+    assert "error" not in rows[0] and rows[0]["opt_L"] > 0
+    assert rows[1] == {"line": 2, "error": "invalid JSON object"}
+    assert rows[2] == {"line": 4, "error": "invalid JSON object"}
+
+
+def test_unknown_camera_is_an_error_row():
+    rows = compute_chunk([{"camera": "No Such Cam", "sky_L": "1"}, dict(SENSOR, sky_L="1")])
+    assert "unknown camera" in rows[0]["error"]
+    assert "median_sf3" not in rows[0]
+    assert rows[1]["opt_L"] > 0
+
+
+def test_pool_keeps_input_order():
+    rows = [dict(SENSOR, id=str(i), sky_L=str(0.5 + i % 7)) for i in range(50)]
+    rows[17] = {"id": "17", "camera": "No Such Cam"}
+    out = list(iter_results(iter(rows), workers=2, chunk_size=4))
+    assert [r["id"] for r in out] == [str(i) for i in range(50)]
+    assert "error" in out[17] and out[18]["opt_L"] == out[18 + 7]["opt_L"]
+
+
+def test_run_batch_csv_to_jsonl():
+    src = io.StringIO("site,rn,ge,filter,sky\nhome,2.0,0.5,L,2.0\nclub,2.0,0,L,2.0\n")
+    dst = io.StringIO()
+    n, _ = run_batch(src, dst, "csv", "jsonl", workers=1)
+    rows = [json.loads(line) for line in dst.getvalue().splitlines()]
+    assert n == 2 and [r["site"] for r in rows] == ["home", "club"]
+    assert rows[0]["opt_L"] == int(optimal_time(c_factor(5.0), 2.0, 2.0))
+    assert rows[1]["error"] == "rn and ge must be > 0"
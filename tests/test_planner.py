@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+import math
+
+import pytest
+
+from exposure_engine import PLAN_MODES, plan_session
+
+SKIES = [1.76, 1.31, 0.12, 0.07, 0.03]
+NIGHT = dict(skies=SKIES, rn=1.4, dc=0.002, signal=0.2, noise_pct=5.0, hours=6.0)
+
+
+def plan(**kw):
+    return plan_session(**dict(NIGHT, **kw))
+
+
+@pytest.mark.parametrize("mode", PLAN_MODES)
+@pytest.mark.parametrize("overhead", [0.0, 5.0, 120.0])
+def test_budget_respected_with_overhead(mode, overhead):
+    p = plan(weights=[1, 1, 1, 1, 1], overhead=overhead, mode=mode)
+    assert p["budget"] == 6 * 3600
+    for n, sub, secs, wall in zip(p["n"], p["subs"], p["seconds"], p["wall"]):
+        assert secs == n * sub
+        assert wall == pytest.approx(n * (sub + overhead))
+    assert p["used"] == pytest.approx(sum(p["wall"]))
+    assert p["used"] <= p["budget"]
+    # The leftover is too short for one more sub of any filter
+    assert p["budget"] - p["used"] < min(sub + overhead for sub, ok in zip(p["subs"], p["feasible"]) if ok)
+
+
+@pytest.mark.parametrize("mode", PLAN_MODES)
+def test_zero_weight_filters_get_nothing(mode):
+    p = plan(weights=[1, 0, 2, 0, 0], overhead=5.0, mode=mode)
+    assert p["feasible"] == [True, False, True, False, False]
+    assert [p["n"][i] for i in (1, 3, 4)] == [0, 0, 0]
+    assert [p["snr"][i] for i in (1, 3, 4)] == [0.0, 0.0, 0.0]
+    assert p["n"][0] > 0 and p["n"][2] > 0
+
+
+@pytest.mark.parametrize("mode", PLAN_MODES)
+def test_no_time_no_subs(mode):
+    p = plan(weights=[1, 1, 1, 1, 1], hours=0, mode=mode)
+    assert p["n"] == [0] * 5 and p["used"] == 0.0
+
+
+def test_maxmin_balances_weighted_snr():
+    # Short subs (fine granularity): the weighted SNRs end up equal to within a sub
+    weights = [1.0, 1.0, 2.0, 0.0, 0.0]
+    p = plan(weights=weights, overhead=5.0, hours=10.0, mode="maxmin")
+    levels = [snr / w for snr, w in zip(p["snr"][:3], weights)]
+    assert max(levels) / min(levels) < 1.05
+    assert p["objective"] == pytest.approx(min(levels))
+
+
+def test_maxmin_cannot_raise_the_lowest_filter():
+    weights = [1.0, 1.0, 2.0, 1.0, 0.5]
+    p = plan(weights=weights, overhead=5.0, mode="maxmin")
+    levels = [snr / w for snr, w in zip(p["snr"], weights)]
+    low = levels.index(min(levels))
+    assert p["subs"][low] + 5.0 > p["budget"] - p["used"]
+
+
+def test_weighted_reaches_the_continuous_optimum():
+    # Per-sub SNR and wall time, read from a plan where every filter gets subs
+    ref = plan(weights=[1, 1, 1, 0, 0], overhead=5.0, hours=10.0, mode="maxmin")
+    r = [snr / math.sqrt(wall) for snr, wall in zip(ref["snr"][:3], ref["wall"][:3])]
+    weights = [1.0, 1.0, 2.0, 0.0, 0.0]
+    p = plan(weights=weights, overhead=5.0, hours=10.0, mode="weighted")
+    # The continuous optimum, T_i ~ (w_i r_i)^2, is sqrt(T * sum((w_i r_i)^2))
+    bound = math.sqrt(p["budget"] * sum((w * ri) ** 2 for w, ri in zip(weights, r)))
+    assert 0.99 * bound <= p["objective"] <= bound * (1 + 1e-9)
+
+
+def test_weighted_beats_maxmin_on_its_objective():
+    weights = [1.0, 1.0, 2.0, 1.0, 0.5]
+    p = plan(weights=weights, overhead=5.0, mode="weighted")
+    balanced = plan(weights=weights, overhead=5.0, mode="maxmin")
+    assert p["objective"] >= sum(w * s for w, s in zip(weights, balanced["snr"]))
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        plan(weights=[1, 1, 1, 1, 1], mode="fastest")
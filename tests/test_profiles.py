@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+import threading
+
+import pytest
+
+from exposure_engine import DEFAULT_PARAMS, ResultCache, compute_results
+from exposure_engine.profiles import ProfileConflict, ProfileStore, encode_results
+
+
+@pytest.fixture
+def stores(tmp_path):
+    """Two PCs sharing one profile file."""
+    path = tmp_path / "profiles.sqlite"
+    a, b = ProfileStore(path), ProfileStore(path)
+    yield a, b
+    a.close()
+    b.close()
+
+
+def test_stale_save_raises_and_fresh_save_bumps_the_revision(stores):
+    a, b = stores
+    assert a.save("Refractor", {"sky_L": 1.0}, rig="R80", expected_revision=0) == 1
+    loaded_a, loaded_b = a.load("Refractor"), b.load("Refractor")
+    assert loaded_a["revision"] == loaded_b["revision"] == 1
+
+    # B saves first: A's copy is now stale
+    assert b.save("Refractor", {"sky_L": 2.0}, expected_revision=loaded_b["revision"]) == 2
+    with pytest.raises(ProfileConflict) as exc:
+        a.save("Refractor", {"sky_L": 3.0}, expected_revision=loaded_a["revision"])
+    assert (exc.value.expected, exc.value.current) == (1, 2)
+    # The rejected save changed nothing
+    p = a.load("Refractor")
+    assert p["settings"] == {"sky_L": 2.0} and p["revision"] == 2 and p["rig"] == "R80"
+
+    # After a reload A saves again, on top of B's revision
+    assert a.save("Refractor", {"sky_L": 3.0}, expected_revision=p["revision"]) == 3
+    assert b.load("Refractor")["settings"] == {"sky_L": 3.0}
+
+
+def test_create_conflicts_with_an_existing_profile(stores):
+    a, b = stores
+    a.save("Newton", {}, expected_revision=0)
+    with pytest.raises(ProfileConflict):
+        b.save("Newton", {}, expected_revision=0)
+    # Without an expected revision the save overwrites (the user confirmed it)
+    assert b.save("Newton", {"sf": 5}) == 2
+
+
+def test_list_and_results_roundtrip(stores):
+    a, b = stores
+    p = dict(DEFAULT_PARAMS)
+    values = compute_results(p)
+    a.save("Newton", p, rig="N200", site="club", results=encode_results(values, ResultCache.key(p)))
+    a.save("Refractor", p, rig="R80", site="home")
+    assert [r["name"] for r in b.list()] == ["Newton", "Refractor"]
+    assert [r["name"] for r in b.list(site="home")] == ["Refractor"]
+    key, bundle = b.load("Newton")["results"]
+    assert key == ResultCache.key(p)
+    assert bundle["optimal"] == values["optimal"]
+    assert b.load("Refractor")["results"] is None
+
+
+def test_a_store_is_not_shared_across_threads(stores):
+    a, _ = stores
+    errors = []
+
+    def _worker():
+        try:
+            a.list()
+        except Exception as e:
+            errors.append(e)
+
+    t = threading.Thread(target=_worker)
+    t.start()
+    t.join()
+    assert len(errors) == 1
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+
+import pytest
+
+from exposure_engine import DEFAULT_PARAMS, c_factor, optimal_time
+from exposure_engine.skylog import SkyLogProcessor, main, parse_time, row_skies, run_sky_log
+
+P = dict({k: float(v) for k, v in DEFAULT_PARAMS.items()}, sky_NB3=DEFAULT_PARAMS["sky_NB12"] / 4.0)
+REF = [P["sky_L"], P["sky_RGB"], P["sky_NB12"], P["sky_NB7"], P["sky_NB3"]]
+T0 = parse_time("2026-10-18T21:00:00")
+
+
+def sky_log(rows):
+    return io.StringIO("".join(json.dumps(r) + "\n" for r in rows))
+
+
+def run(rows, chunk_size=8192, window=1800.0):
+    samples, schedule = io.StringIO(), io.StringIO()
+    n, hours, skipped, _ = run_sky_log(sky_log(rows), P, "jsonl", samples, schedule,
+                                       window=window, chunk_size=chunk_size)
+    out = [json.loads(line) for line in samples.getvalue().splitlines()]
+    sched = [json.loads(line) for line in schedule.getvalue().splitlines()]
+    return n, hours, skipped, out, sched
+
+
+def test_parse_time_epoch_and_iso():
+    assert parse_time(0) == 0.0
+    assert parse_time("86400") == 86400.0
+    assert parse_time("1970-01-02T00:00:00") == 86400.0
+    assert parse_time("1970-01-02 01:00") == 90000.0
+    # Wall-clock time: the UTC offset is ignored
+    assert parse_time("1970-01-02T00:00:00Z") == parse_time("1970-01-02T00:00:00+02:00") == 86400.0
+    assert parse_time("") is None and parse_time("dusk") is None and parse_time(None) is None
+
+
+def test_sqm_scales_every_filter():
+    assert row_skies({"sqm": 21.0}, REF) == pytest.approx(REF)
+    # 2.5 mag darker = 10x less sky, in every filter
+    assert row_skies({"sqm": 23.5}, REF) == pytest.approx([s / 10 for s in REF])
+    assert row_skies({"sqm": 20.0}, REF, sqm_ref=20.0) == pytest.approx(REF)
+
+
+def test_sky_with_filter_and_nb3_fallback():
+    skies = row_skies({"sky": P["sky_NB12"] * 2, "filter": "NB12"}, REF)
+    assert skies == pytest.approx([s * 2 for s in REF])
+    skies = row_skies({"sky_NB12": 0.4}, REF)
+    assert skies[2] == 0.4 and skies[4] == pytest.approx(0.1)
+    assert row_skies({"site": "home"}, REF) is None
+    with pytest.raises(ValueError):
+        row_skies({"sky": 1.0, "filter": "Halpha"}, REF)
+
+
+def test_samples_and_skipped_rows():
+    rows = [{"time": T0, "sky_L": 2.0}, {"time": "dusk", "sky_L": 2.0}, {"sky_L": 2.0},
+            {"ts": format(T0 + 60, ".0f"), "sqm": 21.0}]
+    n, _, skipped, out, _ = run(rows)
+    assert (n, skipped) == (2, 2)
+    assert out[0]["time"] == T0 and out[0]["sky_L"] == 2.0
+    assert out[0]["opt_L"] == int(optimal_time(c_factor(P["noise_pct"]), P["rn"], 2.0))
+    assert out[1]["sky_L"] == pytest.approx(P["sky_L"])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 8192])
+def test_rolling_window_mean(chunk_size):
+    # One sample every 10 min, sky stepping 1 -> 4: a 30 min window averages the last 3 samples
+    rows = [{"time": T0 + 600 * i, "sky_L": 1.0 if i < 3 else 4.0} for i in range(6)]
+    _, _, _, out, _ = run(rows, chunk_size=chunk_size)
+    assert [r["roll_sky_L"] for r in out] == pytest.approx([1.0, 1.0, 1.0, 2.0, 3.0, 4.0])
+    assert out[3]["roll_opt_L"] == int(optimal_time(c_factor(P["noise_pct"]), P["rn"], 2.0))
+
+
+def test_backward_jump_restarts_the_window():
+    rows = [{"time": T0 + 600, "sky_L": 4.0}, {"time": T0, "sky_L": 1.0}]
+    _, _, _, out, _ = run(rows, chunk_size=1)
+    assert [r["roll_sky_L"] for r in out] == [4.0, 1.0]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 8192])
+def test_hours_are_flushed_in_order(chunk_size):
+    # 21:00 to 23:50, every 10 min, one sky level per hour
+    rows = [{"time": T0 + 600 * i, "sky_L": float(1 + i // 6)} for i in range(18)]
+    n, hours, _, _, sched = run(rows, chunk_size=chunk_size)
+    assert (n, hours) == (18, 3)
+    assert [h["hour"] for h in sched] == ["2026-10-18T21:00:00", "2026-10-18T22:00:00", "2026-10-18T23:00:00"]
+    assert [h["samples"] for h in sched] == [6, 6, 6]
+    assert [h["sky_L"] for h in sched] == [1.0, 2.0, 3.0]
+    assert all(h["night"] == "2026-10-18" for h in sched)
+    assert sched[0]["sub_L"] > sched[1]["sub_L"] > sched[2]["sub_L"]
+
+
+def test_hour_is_emitted_once_the_log_moves_past_it():
+    proc = SkyLogProcessor(P, window=1800.0)
+    proc.feed([T0, T0 + 1800], [REF, REF])
+    assert proc.hours == []
+    proc.feed([T0 + 3600], [REF])
+    assert [h["hour"] for h in proc.hours] == ["2026-10-18T21:00:00"]
+    assert [h["hour"] for h in proc.finish()] == ["2026-10-18T21:00:00", "2026-10-18T22:00:00"]
+
+
+@pytest.mark.parametrize("window", [0, -5.0, float("nan")])
+def test_non_positive_window_is_rejected(window):
+    with pytest.raises(ValueError):
+        SkyLogProcessor(P, window=window)
+
+
+def test_cli_rejects_window_zero(tmp_path, capsys):
+    log = tmp_path / "sqm.csv"
+    log.write_text("time,sqm\n2026-10-18T21:00:00,20.5\n", encoding="utf-8")
+    with pytest.raises(SystemExit) as exc:
+        main(["--sky-log", str(log), "--window", "0"])
+    assert exc.value.code == 2
+    assert "--window must be > 0" in capsys.readouterr().err